@@ -0,0 +1,59 @@
+'''
+File name: engine_batch_threads.py
+    Example code related to the tradingti.engine package.
+    Benchmark of the thread execution mode of the batch calculation, the
+    throughput (symbols per second) is measured for an increasing number of
+    threads.
+           
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+import os
+import time
+import numpy as np
+import pandas as pd
+from tradingti.engine import calculateBatchIndicators
+
+# Indicators whose work runs in numpy and pandas code
+INDICATORS = ['SMA', 'EMA', ('BB', {'term': 'long'}), 'SD', 'IC']
+
+SYMBOLS = 256
+REPEATS = 3
+
+# Read data from csv file. Set the index to the correct column (dates column)
+df = pd.read_csv('../indicators/data/sample_data.csv', parse_dates = True, 
+    index_col = 0)
+
+# Symbols with the sample data scaled by a random factor
+random_generator = np.random.RandomState(0)
+data = {}
+for i in range(SYMBOLS):
+    data['S' + str(i)] = df * random_generator.uniform(0.5, 2.)
+
+print('Batch calculation of', len(INDICATORS), 'indicators for', SYMBOLS, 
+    'symbols of', len(df.index), 'periods, on', os.cpu_count(), 'processors.')
+print('\n threads | seconds | symbols/second | speedup')
+
+base_time = None
+for threads in [1, 2, 4, 8, 16, 32]:
+    
+    # Best time of the repeats
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        calculateBatchIndicators(data, INDICATORS, workers = threads, 
+            chunk_size = 4, executor = 'thread')
+        timings.append(time.perf_counter() - start)
+
+    elapsed = min(timings)
+    base_time = elapsed if base_time is None else base_time
+
+    print('{:8d} | {:7.3f} | {:14.1f} | {:7.2f}'.format(threads, elapsed, 
+        SYMBOLS/elapsed, base_time/elapsed))
@@ -5,7 +5,7 @@ with open('README.md', 'r') as fh:
 
 setuptools.setup(
     name = 'trading-technical-indicators',
-    version = '0.0.3',
+    version = '0.1.0',
     author= 'Vasileios Saveris',
     author_email = 'vsaveris@gmail.com',
     description = 'Trading Technical Indicators, Open Source Library, in Python',
@@ -18,8 +18,9 @@ setuptools.setup(
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
     ],
-    python_requires = '>=3.6',
+    python_requires = '>=3.7',
     install_requires=[
+          'numpy',
           'pandas',
           'matplotlib'
       ]
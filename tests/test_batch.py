@@ -0,0 +1,123 @@
+'''
+File name: test_batch.py
+    Tests of the batch calculation of the technical indicators for several
+    symbols, of the tradingti.engine package.
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.7
+'''
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from tradingti.engine import calculateBatchIndicators, calculatePanelIndicators
+
+
+def _stockData(periods, seed = 0, time_zone = None):
+    '''
+    Returns random stock data, with an integer `Volume` column.
+
+    Args:
+        periods (int): The number of periods.
+
+        seed (int): The seed of the random generator.
+
+        time_zone (string): The time zone of the dates, None for dates without
+            a time zone.
+
+    Raises:
+        -
+
+    Returns:
+        pandas.core.frame.DataFrame: The stock data. Index is of type date.
+    '''
+
+    rng = np.random.default_rng(seed)
+
+    close = 100. + np.cumsum(rng.standard_normal(periods))
+
+    return pd.DataFrame(index = pd.date_range('2000-01-01', periods = periods,
+        tz = time_zone, name = 'Date'), data = {'High': close + rng.random(
+        periods), 'Low': close - rng.random(periods), 'Close': close,
+        'Adj Close': close, 'Volume': rng.integers(1000, 5000, periods)})
+
+
+class TestBatchIndicators(unittest.TestCase):
+    '''
+    Compares the indicators calculated in parallel for several symbols with the
+    indicators calculated for the panel data of the symbols.
+    '''
+
+    indicators = ['SMA', ('EMA', {'span_periods': [12, 26]}), 'MACD', 'RSI',
+        'BB', 'DMI', 'FSO', 'IC', 'OBV']
+
+
+    def setUp(self):
+
+        # Symbols with different lengths
+        self.data = {ticker: _stockData(periods, seed = seed) for seed,
+            (ticker, periods) in enumerate([('AA', 300), ('BB', 260), ('CC',
+            320)])}
+
+        self.panel = pd.concat(self.data, names = ['Ticker', 'Date'])
+
+
+    def assertPanelEqual(self, results, expected):
+
+        self.assertEqual(len(results), len(expected))
+
+        for result, expected_result in zip(results, expected):
+            self.assertTrue(result.index.equals(expected_result.index))
+            self.assertEqual(list(result.columns), list(expected_result.
+                columns))
+            np.testing.assert_allclose(result.values.astype(np.float64),
+                expected_result.values, rtol = 1e-9, atol = 1e-9)
+
+
+    def testProcesses(self):
+
+        expected = calculatePanelIndicators(self.panel, self.indicators)
+
+        for data in [self.data, self.panel]:
+            self.assertPanelEqual(calculateBatchIndicators(data,
+                self.indicators, workers = 2, executor = 'process'), expected)
+
+
+    def testThreads(self):
+
+        expected = calculatePanelIndicators(self.panel, self.indicators)
+
+        for data in [self.data, self.panel]:
+            self.assertPanelEqual(calculateBatchIndicators(data,
+                self.indicators, workers = 2, chunk_size = 2, executor =
+                'thread'), expected)
+
+
+    def testTimeZone(self):
+
+        data = {ticker: frame.tz_localize('US/Eastern') for ticker, frame in
+            self.data.items()}
+
+        results = calculateBatchIndicators(data, ['SMA', 'OBV'], workers = 2,
+            executor = 'process')
+
+        for result in results:
+            self.assertTrue(result.index.get_level_values(1).equals(pd.concat(
+                data).index.get_level_values(1)))
+
+        data['BB'] = self.data['BB']
+
+        with self.assertRaises(ValueError):
+            calculateBatchIndicators(data, ['SMA'], workers = 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+'''
+File name: test_data_preprocessing.py
+    Tests of the data preprocessing methods of the tradingti.utils package.
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.7
+'''
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from tradingti.utils import fillMissingValues
+
+
+class TestFillMissingValues(unittest.TestCase):
+    '''
+    Compares fillMissingValues with the pandas forward and backward fill
+    passes, and checks when the input dataframe is copied.
+    '''
+
+    def testPandasFill(self):
+
+        rng = np.random.default_rng(0)
+
+        for trial in range(100):
+            periods = int(rng.integers(1, 40))
+            df_data = pd.DataFrame(index = pd.date_range('2000-01-01',
+                periods = periods), data = {'Close': rng.standard_normal(
+                periods), 'Adj Close': rng.standard_normal(periods),
+                'Volume': rng.integers(1000, 5000, periods)})
+
+            # Missing values at any period, and unsorted dates
+            for column in ['Close', 'Adj Close']:
+                df_data.loc[rng.random(periods) < rng.random(), column] = np.nan
+
+            if trial % 2 == 0:
+                df_data = df_data.sample(frac = 1, random_state = trial)
+
+            expected = df_data.sort_index().fillna(method = 'ffill').fillna(
+                method = 'bfill')
+
+            pd.testing.assert_frame_equal(fillMissingValues(df_data), expected)
+
+
+    def testCopy(self):
+
+        df_data = pd.DataFrame(index = pd.date_range('2000-01-01',
+            periods = 3), data = {'Adj Close': [1., 2., 3.]})
+
+        filled = fillMissingValues(df_data)
+
+        self.assertIsNot(filled, df_data)
+        self.assertFalse(np.shares_memory(filled.values, df_data.values))
+        self.assertIs(fillMissingValues(df_data, copy = False), df_data)
+
+        # Filled values are never written in the input dataframe
+        df_data.iloc[1, 0] = np.nan
+
+        for copy in [True, False]:
+            filled = fillMissingValues(df_data, copy = copy)
+
+            self.assertIsNot(filled, df_data)
+            self.assertTrue(np.isnan(df_data.iloc[1, 0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+'''
+File name: test_panel.py
+    Tests of the calculation of the technical indicators for panel data, of
+    the tradingti.engine package.
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from tradingti.engine import calculateIndicators, calculatePanelIndicators
+
+
+class TestWidePanel(unittest.TestCase):
+    '''
+    Compares the indicators calculated on wide format panel data with the
+    indicators calculated for each symbol separately.
+    '''
+
+    indicators = ['SMA', 'RSI', 'BB', 'SD']
+
+
+    def setUp(self):
+
+        rng = np.random.default_rng(0)
+        dates = pd.date_range('2000-01-01', periods = 400)
+
+        self.wide = pd.DataFrame({ticker: 100. + np.cumsum(rng.standard_normal(
+            len(dates))) for ticker in ['AA', 'BB', 'CC']}, index = dates)
+
+        # Interior gaps, and a symbol listed later and delisted earlier
+        self.wide.iloc[150:153, 0] = np.nan
+        self.wide.iloc[200, 1] = np.nan
+        self.wide.iloc[:30, 2] = np.nan
+        self.wide.iloc[370:, 2] = np.nan
+        self.wide.iloc[100:104, 2] = np.nan
+
+
+    def testInteriorGaps(self):
+
+        results = calculatePanelIndicators(self.wide, self.indicators)
+
+        for ticker in self.wide.columns:
+            prices = self.wide[ticker]
+            prices = prices.loc[prices.first_valid_index():
+                prices.last_valid_index()].to_frame('Adj Close')
+
+            for expected, result in zip(calculateIndicators(prices,
+                self.indicators), results):
+
+                values = result.loc[ticker]
+
+                # The dates of the gaps are kept, with the previous price
+                self.assertTrue(values.index.equals(prices.index))
+                np.testing.assert_allclose(values.values, expected.getTiData(
+                    ).values.astype(float), rtol = 1e-9, atol = 1e-9)
+
+
+    def testUnsortedDates(self):
+
+        results = calculatePanelIndicators(self.wide, self.indicators)
+        shuffled = calculatePanelIndicators(self.wide.sample(frac = 1,
+            random_state = 1), self.indicators)
+
+        for result, shuffled_result in zip(results, shuffled):
+            pd.testing.assert_frame_equal(result, shuffled_result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,196 @@
+'''
+File name: test_pipeline.py
+    Tests of the asynchronous pipeline of the streaming technical indicators,
+    of the tradingti.streaming package.
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.7
+'''
+
+import asyncio
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import tradingti.streaming as st
+from tradingti.streaming import _pipeline
+
+
+async def _bars(prices, produced = None, error = None):
+    '''
+    Yields the (timestamp, bar) records of a symbol.
+
+    Args:
+        prices (iterable): The `Adj Close` price of each bar.
+
+        produced (list): The number of the records yielded, updated in its
+            first member. None if not needed.
+
+        error (Exception): Raised after the last record, None for a source
+            which ends normally.
+
+    Raises:
+        Exception
+
+    Returns:
+        async generator of tuples: The (timestamp, bar) records.
+    '''
+
+    for timestamp, price in enumerate(prices):
+        if produced is not None:
+            produced[0] += 1
+        yield timestamp, {'Adj Close': price}
+
+    if error is not None:
+        raise error
+
+
+async def _collect(generator, results):
+    '''
+    Appends the records of an async generator to a list.
+
+    Args:
+        generator (async generator): The records.
+
+        results (list): The list of the records.
+
+    Raises:
+        -
+
+    Returns:
+        -
+    '''
+
+    async for record in generator:
+        results.append(record)
+
+
+class TestStreamIndicator(unittest.TestCase):
+    '''
+    Tests the micro-batches, the backpressure, the errors of the sources and
+    the cancellation of the streamIndicator pipeline.
+    '''
+
+    def setUp(self):
+
+        rng = np.random.default_rng(0)
+        self.prices = {symbol: (100. + np.cumsum(rng.standard_normal(
+            200))).tolist() for symbol in ['AA', 'BB', 'CC']}
+
+
+    def testMicroBatches(self):
+
+        batches = []
+        update_records = _pipeline._updateRecords
+
+        def update(state, symbol_ids, records):
+            batches.append(symbol_ids)
+            return update_records(state, symbol_ids, records)
+
+        async def run():
+            results = []
+            await _collect(st.streamIndicator({symbol: _bars(prices) for
+                symbol, prices in self.prices.items()}, ('RSI', {'look_back':
+                5}), list(self.prices), queue_size = 64, batch_size = 8),
+                results)
+            return results
+
+        with mock.patch.object(_pipeline, '_updateRecords', update):
+            results = asyncio.run(run())
+
+        # One bar of a symbol in a micro-batch, several symbols together
+        self.assertTrue(all(len(ids) == len(set(ids)) and len(ids) <= 8 for
+            ids in batches))
+        self.assertTrue(any(len(ids) > 1 for ids in batches))
+
+        # The bars of each symbol in the order of their source, with the values
+        # of the streaming indicator of the symbol
+        for symbol, prices in self.prices.items():
+            records = [record for record in results if record[0] == symbol]
+            self.assertEqual([record[1] for record in records], list(range(
+                len(prices))))
+
+            rsi = st.RSI(look_back = 5)
+            for (_, _, values, signal), price in zip(records, prices):
+                expected_values, expected_signal = rsi.update({'Adj Close':
+                    price})
+
+                np.testing.assert_array_equal(values, expected_values)
+                self.assertEqual(signal, expected_signal)
+
+
+    def testBackpressure(self):
+
+        produced = [0]
+
+        async def run():
+            generator = st.streamIndicator({'AA': _bars(range(1, 10001),
+                produced)}, 'SMA', ['AA'], queue_size = 4, batch_size = 2)
+
+            await generator.__anext__()
+            for _ in range(20):
+                await asyncio.sleep(0)
+
+            # The full queue, a micro-batch, a held bar and the bar waiting to
+            # be put in the queue
+            reading = produced[0]
+            await generator.aclose()
+
+            return reading
+
+        self.assertLessEqual(asyncio.run(run()), 4 + 2 + 2)
+
+
+    def testSourceError(self):
+
+        async def run():
+            results = []
+            with self.assertRaises(RuntimeError):
+                await _collect(st.streamIndicator({'AA': _bars(
+                    self.prices['AA'][:5], error = RuntimeError('source'))},
+                    'SMA', ['AA']), results)
+            return results
+
+        results = asyncio.run(run())
+
+        self.assertEqual([record[1] for record in results], list(range(5)))
+
+
+    def testCancellation(self):
+
+        produced = [0]
+
+        async def run():
+            results = []
+            consumer = asyncio.ensure_future(_collect(st.streamIndicator(
+                {'AA': _bars(range(1, 10**9), produced)}, 'SMA', ['AA'],
+                queue_size = 8), results))
+
+            while len(results) < 10:
+                await asyncio.sleep(0)
+
+            consumer.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await consumer
+
+            # The sources are not read after the cancellation
+            reading = produced[0]
+            for _ in range(20):
+                await asyncio.sleep(0)
+
+            return reading, produced[0]
+
+        reading, final_reading = asyncio.run(run())
+
+        self.assertEqual(reading, final_reading)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+'''
+File name: test_plot.py
+    Tests of the plotting methods of the tradingti.utils package.
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+import numpy as np
+import pandas as pd
+
+from tradingti.utils import linesGraph
+
+
+class TestLinesGraph(unittest.TestCase):
+    '''
+    Checks that each graph is returned on its own figure, also when the graphs
+    are prepared from several threads.
+    '''
+
+    def setUp(self):
+
+        self.data = pd.DataFrame(index = pd.date_range('2000-01-01',
+            periods = 50), data = {'Adj Close': np.arange(50.)})
+
+
+    def tearDown(self):
+
+        plt.close('all')
+
+
+    def testReturnsFigure(self):
+
+        figure = linesGraph(data = [self.data, self.data], title = 'Graph')
+
+        self.assertIsInstance(figure, Figure)
+        self.assertEqual(len(figure.axes), 2)
+        self.assertEqual(figure.axes[0].get_title(), 'Graph')
+
+
+    def testThreads(self):
+
+        titles = ['Graph ' + str(i) for i in range(16)]
+
+        with ThreadPoolExecutor(max_workers = 4) as executor:
+            figures = list(executor.map(lambda title: linesGraph(data =
+                self.data, title = title), titles))
+
+        self.assertEqual(len(set(id(figure) for figure in figures)),
+            len(titles))
+
+        for figure, title in zip(figures, titles):
+            self.assertEqual(figure.axes[0].get_title(), title)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,217 @@
+'''
+File name: test_rolling_kernels.py
+    Tests of the rolling window kernels of the tradingti.utils package against
+    the pandas rolling window calculations.
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+import unittest
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from tradingti.utils._rolling_kernels import rollingMean, rollingMeanStd, \
+    rollingMax, rollingMin
+
+
+def _randomWalk(periods, level = 100., seed = 0):
+    '''
+    Returns a random walk of prices with some missing and constant periods.
+
+    Args:
+        periods (int): The number of periods.
+
+        level (float): The price level of the walk.
+
+        seed (int): The seed of the random generator.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: The prices.
+    '''
+
+    rng = np.random.default_rng(seed)
+    values = level + np.cumsum(rng.standard_normal(periods))
+
+    values[periods//10:periods//10 + 25] = values[periods//10 - 1]
+    values[rng.choice(periods, periods//20, replace = False)] = np.nan
+    values[periods//2:periods//2 + 30] = np.nan
+
+    return values
+
+
+def _rollingVariance(values, windows, **arguments):
+    '''
+    Returns the rolling variances, from the standard deviations of
+    rollingMeanStd.
+
+    Args:
+        values (numpy array): The input values.
+
+        windows (list of integers): The rolling windows.
+
+        arguments (dictionary): The other arguments of rollingMeanStd.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: The rolling variances.
+    '''
+
+    return rollingMeanStd(values, windows, **arguments)[1]**2
+
+
+class TestRollingKernels(unittest.TestCase):
+    '''
+    Compares the rolling kernels with the pandas rolling calculations, for one
+    and two dimensional inputs, missing values and several minimum numbers of
+    observations.
+    '''
+
+    windows = [1, 2, 3, 20, 200]
+
+
+    def assertPandasEqual(self, kernel, reference, values, **arguments):
+
+        results = kernel(values, self.windows, **arguments)
+
+        min_periods = arguments.get('min_periods', 1)
+
+        for i, window in enumerate(self.windows):
+            # Not accepted by pandas
+            if min_periods is not None and min_periods > window:
+                continue
+
+            expected = reference(pd.DataFrame(values).rolling(window,
+                min_periods = min_periods)).values
+
+            if values.ndim == 1:
+                expected = expected[:, 0]
+                result = results[:, i]
+            else:
+                result = results[:, i, :]
+
+            np.testing.assert_allclose(result, expected, rtol = 1e-8,
+                atol = 1e-8, err_msg = kernel.__name__ + ' window ' +
+                str(window))
+
+
+    def test1D(self):
+
+        values = _randomWalk(3000)
+
+        for min_periods in [1, 5, None]:
+            self.assertPandasEqual(rollingMean, lambda r: r.mean(), values,
+                min_periods = min_periods)
+            self.assertPandasEqual(_rollingVariance, lambda r: r.var(), values,
+                min_periods = min_periods)
+            self.assertPandasEqual(rollingMax, lambda r: r.max(), values,
+                min_periods = min_periods)
+            self.assertPandasEqual(rollingMin, lambda r: r.min(), values,
+                min_periods = min_periods)
+
+
+    def test2D(self):
+
+        values = np.column_stack([_randomWalk(1500, seed = i) for i in
+            range(4)])
+        values[:300, 2] = np.nan
+
+        self.assertPandasEqual(rollingMean, lambda r: r.mean(), values)
+        self.assertPandasEqual(_rollingVariance, lambda r: r.var(), values,
+            min_periods = None)
+        self.assertPandasEqual(rollingMax, lambda r: r.max(), values)
+        self.assertPandasEqual(rollingMin, lambda r: r.min(), values)
+
+        # Each column gets the results of the kernel on the column alone
+        means, stds = rollingMeanStd(values, self.windows)
+        for j in range(values.shape[1]):
+            column_means, column_stds = rollingMeanStd(values[:, j],
+                self.windows)
+            np.testing.assert_array_equal(means[:, :, j], column_means)
+            np.testing.assert_array_equal(stds[:, :, j], column_stds)
+
+
+    def testCompleteValues(self):
+
+        # Without missing and repeated values
+        rng = np.random.default_rng(2)
+        values = 100. + np.cumsum(rng.standard_normal(3000))
+
+        for min_periods in [1, None]:
+            self.assertPandasEqual(rollingMean, lambda r: r.mean(), values,
+                min_periods = min_periods)
+            self.assertPandasEqual(_rollingVariance, lambda r: r.var(), values,
+                min_periods = min_periods)
+            self.assertPandasEqual(rollingMax, lambda r: r.max(), values,
+                min_periods = min_periods)
+
+        self.assertPandasEqual(_rollingVariance, lambda r: r.var(),
+            values.reshape(-1, 3))
+
+
+    def testLongSeries(self):
+
+        values = _randomWalk(200000, level = 1e4)
+
+        self.assertPandasEqual(rollingMean, lambda r: r.mean(), values)
+        self.assertPandasEqual(rollingMax, lambda r: r.max(), values)
+
+
+    def testWindowIndependence(self):
+
+        values = _randomWalk(5000)
+
+        means, stds = rollingMeanStd(values, [20])
+        shared_means, shared_stds = rollingMeanStd(values, [200, 20, 3])
+
+        np.testing.assert_array_equal(means[:, 0], shared_means[:, 1])
+        np.testing.assert_array_equal(stds[:, 0], shared_stds[:, 1])
+
+
+    def testConstantWindows(self):
+
+        values = np.full(500, 1234.5678)
+        values[100:300] = 0.1
+
+        means, stds = rollingMeanStd(values, [3, 20])
+
+        np.testing.assert_array_equal(means[19:100], 1234.5678)
+        np.testing.assert_array_equal(stds[19:100], 0.)
+        np.testing.assert_array_equal(means[119:300], 0.1)
+        np.testing.assert_array_equal(stds[119:300], 0.)
+
+
+    def testVariancePrecision(self):
+
+        rng = np.random.default_rng(1)
+
+        for level in [1e2, 1e4, 1e6]:
+            values = level + np.cumsum(rng.standard_normal(20000))
+
+            for window in [3, 20, 200]:
+                exact = np.var(sliding_window_view(values.astype(
+                    np.longdouble), window), axis = 1, ddof = 1).astype(
+                    np.float64)
+                variances = _rollingVariance(values, [window],
+                    min_periods = None)[window - 1:, 0]
+
+                np.testing.assert_allclose(variances, exact, rtol = 1e-9,
+                    atol = 1e-11, err_msg = 'level ' + str(level) +
+                    ' window ' + str(window))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,232 @@
+'''
+File name: test_streaming.py
+    Tests of the streaming technical indicators of the tradingti.streaming
+    package, against the batch technical indicators of the tradingti.indicators
+    package.
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import tradingti.indicators as ti
+import tradingti.streaming as st
+import tradingti.streaming.panel as sp
+
+
+def _stockData(periods, seed = 0):
+    '''
+    Returns random stock data, with some constant periods.
+
+    Args:
+        periods (int): The number of periods.
+
+        seed (int): The seed of the random generator.
+
+    Raises:
+        -
+
+    Returns:
+        pandas.core.frame.DataFrame: The stock data. Index is of type date.
+    '''
+
+    rng = np.random.default_rng(seed)
+
+    close = 100. + np.cumsum(rng.standard_normal(periods))
+    close[50:60] = close[49]
+
+    return pd.DataFrame(index = pd.date_range('2000-01-01', periods =
+        periods), data = {'Open': close, 'High': close + rng.random(periods),
+        'Low': close - rng.random(periods), 'Close': close, 'Adj Close': close,
+        'Volume': rng.integers(1000, 5000, periods)})
+
+
+def _streamData(indicator, data):
+    '''
+    Updates a streaming indicator with each bar of the data.
+
+    Args:
+        indicator (StreamingTI): The streaming indicator.
+
+        data (pandas.core.frame.DataFrame): The stock data.
+
+    Raises:
+        -
+
+    Returns:
+        tuple (numpy array, numpy array): The values and the signal value of
+            each bar.
+    '''
+
+    rows, signals = [], []
+    for _, bar in data.iterrows():
+        row, signal = indicator.update(bar)
+        rows.append(row)
+        signals.append(signal[1])
+
+    return np.array(rows, dtype = np.float64), np.array(signals)
+
+
+def _streamPanelData(indicator, frames):
+    '''
+    Updates a streaming indicator of several symbols with the bars of the data
+    of each symbol, one bar of all the symbols at a time.
+
+    Args:
+        indicator (StreamingPanelTI): The streaming indicator.
+
+        frames (list of pandas.core.frame.DataFrame): The stock data of each
+            symbol, of the same length.
+
+    Raises:
+        -
+
+    Returns:
+        tuple (numpy array, numpy array): The values and the signal values of
+            each bar, of shape (periods, symbols, columns) and (periods,
+            symbols).
+    '''
+
+    symbol_ids = np.arange(len(frames))
+    rows, signals = [], []
+
+    for period in range(len(frames[0])):
+        row, signal = indicator.updateMany(symbol_ids, {column: np.array([
+            frame[column].iat[period] for frame in frames]) for column in
+            frames[0].columns})
+        rows.append(row)
+        signals.append(signal)
+
+    return np.array(rows), np.array(signals)
+
+
+class TestStreamingRSI(unittest.TestCase):
+    '''
+    Compares the streaming RSI indicators with the batch RSI indicator.
+    '''
+
+    def setUp(self):
+
+        self.frames = [_stockData(600, seed = seed) for seed in range(3)]
+
+
+    def testStreaming(self):
+
+        for look_back in [1, 5, 14]:
+            for data in self.frames:
+                batch = ti.RSI(data, look_back = look_back)
+                rows, signals = _streamData(st.RSI(look_back = look_back),
+                    data)
+
+                np.testing.assert_array_equal(rows, batch.getTiData().values)
+                np.testing.assert_array_equal(signals, batch.getSignals(
+                    ).values)
+
+
+    def testPanel(self):
+
+        for look_back in [1, 5, 14]:
+            rows, signals = _streamPanelData(sp.RSI(len(self.frames),
+                look_back = look_back), self.frames)
+
+            for i, data in enumerate(self.frames):
+                batch = ti.RSI(data, look_back = look_back)
+
+                np.testing.assert_array_equal(rows[:, i],
+                    batch.getTiData().values)
+                np.testing.assert_array_equal(signals[:, i],
+                    batch.getSignals().values)
+
+
+class TestStreamingSignals(unittest.TestCase):
+    '''
+    Compares the values and the signals of all the streaming indicators with
+    the batch indicators, also for the first bars, before the bars required by
+    an indicator are available.
+    '''
+
+    # Indicator name, arguments
+    indicators = [('SMA', {}), ('SMA', {'sma_periods': [1]}), ('SMA',
+        {'sma_periods': [5, 20]}), ('EMA', {}), ('EMA', {'span_periods': [1]}),
+        ('MACD', {}), ('ADX', {}), ('DMI', {}), ('DMI', {'adx': True}), ('FSO',
+        {}), ('SSO', {}), ('RSI', {}), ('IC', {}), ('BB', {}), ('BB', {'term':
+        'short'}), ('SD', {}), ('SD', {'periods': 1}), ('OBV', {})]
+
+
+    def setUp(self):
+
+        self.frames = [_stockData(300, seed = seed) for seed in range(3)]
+
+
+    def testStreaming(self):
+
+        for name, arguments in self.indicators:
+            for data in self.frames:
+                batch = getattr(ti, name)(data, **arguments)
+                rows, signals = _streamData(getattr(st, name)(**arguments),
+                    data)
+
+                np.testing.assert_allclose(rows, batch.getTiData().values.
+                    astype(np.float64), rtol = 1e-9, atol = 1e-9, err_msg =
+                    name)
+                np.testing.assert_array_equal(signals, batch.getSignals(
+                    ).values, err_msg = name)
+
+
+    def testPanel(self):
+
+        for name, arguments in self.indicators:
+            if not hasattr(sp, name):
+                continue
+
+            rows, signals = _streamPanelData(getattr(sp, name)(len(
+                self.frames), **arguments), self.frames)
+
+            for i, data in enumerate(self.frames):
+                batch = getattr(ti, name)(data, **arguments)
+
+                np.testing.assert_allclose(rows[:, i], batch.getTiData().
+                    values.astype(np.float64), rtol = 1e-9, atol = 1e-9,
+                    err_msg = name)
+                np.testing.assert_array_equal(signals[:, i], batch.getSignals(
+                    ).values, err_msg = name)
+
+
+class TestStreamingOBV(unittest.TestCase):
+    '''
+    Checks the type of the streaming OBV for integral and fractional volumes.
+    '''
+
+    def testFractionalVolumes(self):
+
+        obv = st.OBV()
+        values = [obv.update({'Adj Close': close, 'Volume': volume})[0][0] for
+            close, volume in [(1., 100), (2., 200), (3., 10.5), (2., 3)]]
+
+        self.assertEqual(values, [0, 200, 210.5, 207.5])
+        self.assertIsInstance(values[1], int)
+        self.assertIsInstance(values[3], float)
+
+
+    def testIntegralVolumes(self):
+
+        obv = st.OBV()
+        values = [obv.update({'Adj Close': close, 'Volume': volume})[0][0] for
+            close, volume in [(1., 100), (2., 200), (3., 10.), (2., 3)]]
+
+        self.assertEqual(values, [0, 200, 210, 207])
+        self.assertTrue(all(isinstance(value, int) for value in values))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,15 +8,15 @@ enail: vsaveris@gmail.com
 
 License: MIT
 
-Date last modified: 08.02.2020
+Date last modified: 18.10.2026
 
 Python Version: 3.6
 '''
 
-__version__ = '0.0.2'
+__version__ = '0.1.0'
 
 from ._constants import *
 from .utils._system_information import showSystemInfo
 from .utils._library_information import showLibraryInfo
 
-__all__ = ['utils', 'indicators', 'TRADE_SIGNALS']
\ No newline at end of file
+__all__ = ['utils', 'indicators', 'engine', 'streaming', 'TRADE_SIGNALS']
\ No newline at end of file
@@ -0,0 +1,21 @@
+'''
+File name: __init__.py
+    Trading Technical Indicators open source library, in python.
+    `tradingti.engine` package.
+           
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+from ._engine import calculateIndicators
+from ._panel import calculatePanelIndicators
+from ._batch import calculateBatchIndicators
+
+__all__ = ['calculateIndicators', 'calculatePanelIndicators', 
+    'calculateBatchIndicators']
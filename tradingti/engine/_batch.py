@@ -0,0 +1,401 @@
+'''
+File name: _batch.py
+    Batch calculation of the technical indicators for several symbols, defined
+    under the tradingti.engine package. The symbols are split in chunks, which
+    are calculated in parallel by a pool of worker processes, with the input
+    data passed to the workers through shared memory, or by a pool of threads.
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+import numpy as np
+import pandas as pd
+import pandas.core as pc
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+from ._engine import calculateIndicators
+from ._panel import _validatePanelData, _panelLayout
+from ..utils._data_validation import validateStockData, \
+    _validatedStockData
+
+
+def _splitPanelData(panel_data):
+    '''
+    Splits the panel data in the data of each symbol.
+
+    Args:
+        panel_data (pandas.core.frame.DataFrame): The panel data, see
+            calculatePanelIndicators.
+
+    Raises:
+        TypeError
+        ValueError
+
+    Returns:
+        tuple (list, list of pandas.core.frame.DataFrame, list): The symbols,
+            the validated data of each symbol and the names of the panel index
+            levels.
+    '''
+
+    panel_data = _validatePanelData(panel_data)
+
+    index = panel_data.index.remove_unused_levels()
+    _, _, lengths = _panelLayout(panel_data)
+
+    # Rows of a symbol are consecutive, in the order of the symbols
+    ends = np.cumsum(lengths)
+    frames = [panel_data.iloc[end-length:end].droplevel(0) for end, length in
+        zip(ends, lengths)]
+
+    return list(index.levels[0]), frames, list(panel_data.index.names)
+
+
+def _batchData(data):
+    '''
+    Validates the input of a batch calculation and returns the data of each
+    symbol.
+
+    Args:
+        data (dictionary or pandas.core.frame.DataFrame): The input data, see
+            calculateBatchIndicators.
+
+    Raises:
+        TypeError
+        ValueError
+
+    Returns:
+        tuple (list, list of pandas.core.frame.DataFrame, list): The symbols,
+            the validated data of each symbol and the names of the index levels
+            of the results.
+    '''
+
+    if isinstance(data, pc.frame.DataFrame):
+        return _splitPanelData(data)
+
+    if not isinstance(data, dict):
+        raise TypeError('The argument data should be a `dict` or a `pandas.' +\
+            'core.frame.DataFrame` but it is of type `' + str(type(data)) +\
+            '`.')
+
+    if len(data) == 0:
+        raise ValueError('The input data cannot be empty. data_len = 0.')
+
+    symbols = list(data)
+
+    # Columns available for all the symbols, in the order of the first symbol
+    columns = [column for column in data[symbols[0]].columns if all(column in
+        data[symbol].columns for symbol in symbols)]
+
+    frames = [validateStockData(data = data[symbol], required_columns =
+        columns, indicator_name = str(symbol)) for symbol in symbols]
+
+    return symbols, frames, [None, frames[0].index.name]
+
+
+def _batchDates(frames, name):
+    '''
+    Concatenates the dates of the symbols into one index. The dates of all the
+    symbols should have the same time zone, which is kept.
+
+    Args:
+        frames (list of pandas.core.frame.DataFrame): The validated data of
+            each symbol.
+
+        name (string): The name of the index.
+
+    Raises:
+        ValueError
+
+    Returns:
+        pandas.DatetimeIndex: The dates of all the symbols.
+    '''
+
+    time_zones = {str(frame.index.tz) for frame in frames}
+
+    if len(time_zones) > 1:
+        raise ValueError('The dates of all the symbols should have the same ' +\
+            'time zone, but they have the time zones ' + str(sorted(
+            time_zones)) + '.')
+
+    # The values of dates with a time zone are in UTC
+    dates = pd.DatetimeIndex(np.concatenate([frame.index.values for frame in
+        frames]), name = name)
+
+    if frames[0].index.tz is not None:
+        dates = dates.tz_localize('UTC').tz_convert(frames[0].index.tz)
+
+    return dates
+
+
+def _calculateSymbols(frames, indicators):
+    '''
+    Calculates the indicators for a chunk of symbols. The data of the symbols
+    are already validated, and they are not validated again.
+
+    Args:
+        frames (list of pandas.core.frame.DataFrame): The validated data of
+            each symbol of the chunk.
+
+        indicators (list): The requested indicators, see calculateIndicators.
+
+    Raises:
+        TypeError()
+        ValueError()
+
+    Returns:
+        list: For each symbol of the chunk, the values of each indicator (numpy
+            array) and the names of its columns.
+    '''
+
+    results = []
+    for df_data in frames:
+        ti_data = [indicator.getTiData() for indicator in
+            calculateIndicators(_validatedStockData(df_data), indicators)]
+        results.append([(frame.values, list(frame.columns)) for frame in
+            ti_data])
+
+    return results
+
+
+def _calculateChunk(task):
+    '''
+    Calculates the indicators for a chunk of symbols, whose data are read from
+    shared memory. It runs in the worker processes.
+
+    Args:
+        task (tuple): The name of the shared memory block, the layout of the
+            block (number of rows, columns and their dtypes, name of the date
+            index), the (start, end) rows of each symbol of the chunk and the
+            requested indicators.
+
+    Raises:
+        TypeError()
+        ValueError()
+
+    Returns:
+        list: For each symbol of the chunk, the values of each indicator (numpy
+            array) and the names of its columns.
+    '''
+
+    name, (rows, columns, index_name), segments, indicators = task
+
+    block = shared_memory.SharedMemory(name = name)
+
+    try:
+        # The dates are in the first slot of the block and each column in the
+        # next ones, all of them 8 bytes wide
+        dates = np.ndarray(rows, dtype = 'M8[ns]', buffer = block.buf)
+        values = {column: np.ndarray(rows, dtype = dtype, buffer = block.buf,
+            offset = 8*rows*(i + 1)) for i, (column, dtype) in
+            enumerate(columns)}
+
+        # The data of the symbols are copied out of the shared block
+        frames = [pd.DataFrame(index = pd.DatetimeIndex(dates[start:end].copy(),
+            name = index_name), data = {column: values[column][start:end].copy()
+            for column, _ in columns}) for start, end in segments]
+
+        # Views on the block should be released before closing it
+        del dates, values
+
+    finally:
+        block.close()
+
+    return _calculateSymbols(frames, indicators)
+
+
+def _runProcesses(frames, indicators, workers, chunk_size):
+    '''
+    Calculates the indicators for the chunks of symbols in a pool of worker
+    processes. The data of the symbols are passed through shared memory.
+
+    Args:
+        frames (list of pandas.core.frame.DataFrame): The validated data of
+            each symbol.
+
+        indicators (list): The requested indicators, see calculateIndicators.
+
+        workers (int): The number of worker processes, see
+            calculateBatchIndicators.
+
+        chunk_size (int): The number of symbols in each chunk.
+
+    Raises:
+        TypeError()
+        ValueError()
+
+    Returns:
+        list: The results of each chunk, in the order of the chunks, see
+            _calculateSymbols.
+    '''
+
+    lengths = np.array([len(frame.index) for frame in frames])
+    ends = np.cumsum(lengths)
+
+    # Integer columns (the volume) are kept integral, as in the data of each
+    # symbol, the other columns are stored as float
+    columns = []
+    for column in frames[0].columns:
+        dtype = np.result_type(*[frame[column].values.dtype for frame in
+            frames])
+        columns.append((column, '<i8' if np.issubdtype(dtype, np.integer) or
+            dtype == bool else '<f8'))
+
+    # Shared block with the dates and the columns of all the symbols, each one
+    # in a slot of rows x 8 bytes
+    rows = int(ends[-1])
+    block = shared_memory.SharedMemory(create = True, size = 8*rows*(
+        len(columns) + 1))
+
+    try:
+        dates = np.ndarray(rows, dtype = 'M8[ns]', buffer = block.buf)
+        dates[:] = np.concatenate([frame.index.values for frame in frames])
+
+        for i, (column, dtype) in enumerate(columns):
+            values = np.ndarray(rows, dtype = dtype, buffer = block.buf,
+                offset = 8*rows*(i + 1))
+            values[:] = np.concatenate([frame[column].values for frame in
+                frames])
+
+        del dates, values
+
+        segments = [(int(end - length), int(end)) for end, length in zip(ends,
+            lengths)]
+
+        tasks = [(block.name, (rows, columns, frames[0].index.name),
+            segments[i:i + chunk_size], indicators) for i in range(0,
+            len(segments), chunk_size)]
+
+        # Results are collected in the order of the tasks
+        if workers == 1:
+            return [_calculateChunk(task) for task in tasks]
+
+        with ProcessPoolExecutor(max_workers = workers) as executor:
+            return list(executor.map(_calculateChunk, tasks))
+
+    finally:
+        block.close()
+        block.unlink()
+
+
+def _runThreads(frames, indicators, workers, chunk_size):
+    '''
+    Calculates the indicators for the chunks of symbols in a pool of threads
+    of the calling process. The data of the symbols are shared, not copied.
+
+    Args:
+        frames (list of pandas.core.frame.DataFrame): The validated data of
+            each symbol.
+
+        indicators (list): The requested indicators, see calculateIndicators.
+
+        workers (int): The number of threads, see calculateBatchIndicators.
+
+        chunk_size (int): The number of symbols in each chunk.
+
+    Raises:
+        TypeError()
+        ValueError()
+
+    Returns:
+        list: The results of each chunk, in the order of the chunks, see
+            _calculateSymbols.
+    '''
+
+    chunks = [frames[i:i + chunk_size] for i in range(0, len(frames),
+        chunk_size)]
+
+    # Results are collected in the order of the chunks
+    with ThreadPoolExecutor(max_workers = workers) as executor:
+        return list(executor.map(partial(_calculateSymbols, indicators =
+            indicators), chunks))
+
+
+# The execution modes of the batch calculation
+_EXECUTORS = {'process': _runProcesses, 'thread': _runThreads}
+
+
+def calculateBatchIndicators(data, indicators, workers = None,
+    chunk_size = 1, executor = 'process'):
+    '''
+    Calculates several technical indicators for several symbols in parallel.
+    The symbols are split in chunks of chunk_size symbols, and the chunks are
+    calculated concurrently, with the indicators of a symbol calculated as in
+    calculateIndicators. Two execution modes are supported:
+        'process': Each chunk is calculated by a worker process. The input data
+            are written once in a shared memory block, which the workers read
+            without receiving a copy of them. Suited for the indicators with
+            recurrences running in python code (DMI, ADX).
+        'thread': Each chunk is calculated by a thread of the calling process,
+            without copying the input data or the results. Suited for the 
+            indicators whose work runs in numpy and pandas code, which releases
+            the GIL (SMA, EMA, BB, SD, IC).
+
+    Args:
+        data (dictionary or pandas.core.frame.DataFrame): The input data, either
+            a dictionary of symbol: data frame with the stock data of the symbol
+            (index is of type date), or panel data (see
+            calculatePanelIndicators). For a dictionary, the columns found in
+            the data of all the symbols are used.
+
+        indicators (list): The requested indicators, see calculateIndicators.
+
+        workers (int, default is None): The number of worker processes or 
+            threads. When None, the default of the concurrent.futures executor
+            is used. For processes, when 1, the chunks are calculated in the 
+            calling process.
+
+        chunk_size (int, default is 1): The number of symbols calculated by a
+            worker in each task.
+
+        executor (string, default is 'process'): The execution mode, 'process'
+            or 'thread'.
+
+    Raises:
+        TypeError()
+        ValueError()
+
+    Returns:
+        list of pandas.core.frame.DataFrame: The calculated values of each
+            indicator, in the order requested. Index is a (ticker, date)
+            MultiIndex, with the symbols in the order of the input data
+            (dictionary order, or sorted for panel data), and the dates in the
+            time zone of the input data.
+    '''
+
+    if workers is not None and (type(workers) != int or workers <= 0):
+        raise ValueError('The argument workers should be a positive integer ' +\
+            'or None, but it is ' + str(workers) + '.')
+
+    if type(chunk_size) != int or chunk_size <= 0:
+        raise ValueError('The argument chunk_size should be a positive ' +\
+            'integer, but it is ' + str(chunk_size) + '.')
+
+    if executor not in _EXECUTORS:
+        raise ValueError('Not allowed value for the \'executor\' argument. ' +\
+            'It should be one of the following: ' + str(list(_EXECUTORS)) +\
+            '. Value given is \'' + str(executor) + '\'.')
+
+    symbols, frames, index_names = _batchData(data)
+
+    dates = _batchDates(frames, index_names[1])
+
+    chunks = _EXECUTORS[executor](frames, indicators, workers, chunk_size)
+
+    results = [symbol_results for chunk in chunks for symbol_results in chunk]
+
+    # One data frame for each indicator, with the rows of all the symbols
+    index = pd.MultiIndex.from_arrays([np.repeat(np.array(symbols,
+        dtype = object), [len(frame.index) for frame in frames]), dates],
+        names = index_names)
+
+    return [pd.DataFrame(index = index, data = np.concatenate([
+        symbol_results[i][0] for symbol_results in results]),
+        columns = results[0][i][1]) for i in range(len(results[0]))]
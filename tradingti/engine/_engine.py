@@ -0,0 +1,372 @@
+'''
+File name: _engine.py
+    Calculation engine of the technical indicators, defined under the
+    tradingti.engine package. Several indicators are calculated for one input
+    data frame. The intermediate results shared by the indicators (moving
+    averages, rolling extrema, directional movement) are planned as a graph of
+    nodes, and each node is calculated only once.
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+import numpy as np
+import pandas as pd
+from ..indicators import SMA, EMA, MACD, ADX, DMI, FSO, SSO, RSI, IC, BB, SD, \
+    FR, OBV
+from ..indicators._trend import _exponentialMean, \
+    _movingAverageConvergenceDivergence, _directionalMovement, \
+    _averageDirectionalIndex
+from ..indicators._momentum import _fastStochastic, _slowStochastic, \
+    _ichimokuCloud, _relativeStrengthIndex
+from ..indicators._volatility import _bollingerBands, _standardDeviation
+from ..indicators._support_resistance import _fibonacciRetracement
+from ..indicators._volume import _onBalanceVolume
+from ..utils._rolling_kernels import rollingMean, rollingMeanStd, rollingMax, \
+    rollingMin
+from ..utils._data_validation import ValidatedStockData
+
+
+# The indicators supported by the engine, by name
+_INDICATORS = {'SMA': SMA, 'EMA': EMA, 'MACD': MACD, 'ADX': ADX, 'DMI': DMI,
+    'FSO': FSO, 'SSO': SSO, 'RSI': RSI, 'IC': IC, 'BB': BB, 'SD': SD, 'FR': FR,
+    'OBV': OBV}
+
+# Nodes derived from other nodes, calculated after them
+_DEPENDENCIES = {('macd',): [('ema', 12), ('ema', 26)], ('adx',): [('dm',)]}
+
+
+def _requiredNodes(indicator):
+    '''
+    Returns the intermediate results (nodes) needed by an indicator. A node is
+    a tuple with the type of the intermediate result and its window:
+        ('mean', w), ('std', w): Rolling mean and standard deviation of the
+            `Adj Close` prices.
+        ('ema', span): Exponential moving average of the `Adj Close` prices.
+        ('max', w), ('min', w): Rolling maximum of the `High` prices and
+            rolling minimum of the `Low` prices.
+        ('dm',): Directional movement (DMI+, DMI-, DX).
+        ('macd',), ('adx',): MACD lines and ADX, derived from other nodes.
+
+    Args:
+        indicator (TI): The indicator object.
+
+    Raises:
+        -
+
+    Returns:
+        list of tuples: The required nodes. An empty list means that the
+            indicator does not share intermediate results, its values are
+            calculated by the indicator itself.
+    '''
+
+    if isinstance(indicator, SMA):
+        return [('mean', w) for w in indicator._sma_periods]
+
+    if isinstance(indicator, EMA):
+        return [('ema', span) for span in indicator._span_periods]
+
+    if isinstance(indicator, MACD):
+        return [('macd',)]
+
+    if isinstance(indicator, ADX):
+        return [('adx',)]
+
+    if isinstance(indicator, DMI):
+        return [('dm',)] + ([('adx',)] if indicator._adx else [])
+
+    if isinstance(indicator, (FSO, SSO)):
+        return [('max', 14), ('min', 14)]
+
+    if isinstance(indicator, IC):
+        return [(kind, w) for kind in ['max', 'min'] for w in [9, 26, 52]]
+
+    if isinstance(indicator, BB):
+        return [('mean', indicator._term[0]), ('std', indicator._term[0])]
+
+    if isinstance(indicator, SD):
+        return [('std', indicator._periods)]
+
+    return []
+
+
+def _planNodes(indicators):
+    '''
+    Plans the graph of the intermediate results needed by the indicators.
+    Nodes requested by several indicators appear once, and the nodes needed to
+    derive other nodes are added.
+
+    Args:
+        indicators (list of TI): The indicator objects.
+
+    Raises:
+        -
+
+    Returns:
+        set of tuples: The nodes to be calculated.
+    '''
+
+    nodes = set()
+    pending = [node for indicator in indicators for node in
+        _requiredNodes(indicator)]
+
+    while len(pending) > 0:
+        node = pending.pop()
+        if node not in nodes:
+            nodes.add(node)
+            pending.extend(_DEPENDENCIES.get(node, []))
+
+    return nodes
+
+
+def _calculateNodes(input_data, nodes):
+    '''
+    Calculates the planned nodes. The rolling nodes of the same type are
+    calculated together, in one call of the rolling kernels for all their
+    windows, the exponential means in one pandas ewm pass for each span.
+
+    Args:
+        input_data (dictionary): The validated input columns, as column name:
+            numpy array. For panel data each array is two dimensional, with one
+            column per symbol.
+
+        nodes (set of tuples): The nodes to be calculated, see _planNodes.
+
+    Raises:
+        -
+
+    Returns:
+        dictionary: The value (numpy array) of each node. For panel data the
+            symbols are in the last dimension.
+    '''
+
+    values = {}
+    windows = {kind: sorted({node[1] for node in nodes if node[0] == kind})
+        for kind in ['mean', 'std', 'ema', 'max', 'min']}
+
+    # Rolling mean and standard deviation, together for the windows which need
+    # both
+    if len(windows['std']) > 0:
+        means, stds = rollingMeanStd(input_data['Adj Close'],
+            windows = windows['std'])
+        for i, window in enumerate(windows['std']):
+            values[('mean', window)] = means[:, i]
+            values[('std', window)] = stds[:, i]
+
+    mean_windows = [w for w in windows['mean'] if w not in windows['std']]
+    if len(mean_windows) > 0:
+        means = rollingMean(input_data['Adj Close'], windows = mean_windows)
+        for i, window in enumerate(mean_windows):
+            values[('mean', window)] = means[:, i]
+
+    for span in windows['ema']:
+        values[('ema', span)] = _exponentialMean(input_data['Adj Close'],
+            span = span)
+
+    # Rolling extrema of the high and low prices
+    for kind, rolling, column in [('max', rollingMax, 'High'),
+        ('min', rollingMin, 'Low')]:
+        if len(windows[kind]) > 0:
+            extrema = rolling(input_data[column], windows = windows[kind])
+            for i, window in enumerate(windows[kind]):
+                values[(kind, window)] = extrema[:, i]
+
+    if ('dm',) in nodes:
+        values[('dm',)] = _directionalMovement(high = input_data['High'],
+            low = input_data['Low'], close = input_data['Close'])
+
+    # Derived nodes
+    if ('macd',) in nodes:
+        values[('macd',)] = _movingAverageConvergenceDivergence(
+            ema_12 = values[('ema', 12)], ema_26 = values[('ema', 26)])
+
+    if ('adx',) in nodes:
+        values[('adx',)] = _averageDirectionalIndex(values[('dm',)][:, 2])
+
+    return values
+
+
+def _assembleIndicator(indicator, values, input_data):
+    '''
+    Builds the calculated values of an indicator from the values of the nodes.
+    The indicators without nodes (RSI, FR, OBV) are calculated from the input
+    columns, this is used for panel data where the indicator objects do not 
+    hold the data of all the symbols.
+
+    Args:
+        indicator (TI): The indicator object.
+
+        values (dictionary): The value of each node, see _calculateNodes.
+
+        input_data (dictionary): The validated input columns, as column name:
+            numpy array.
+
+    Raises:
+        -
+
+    Returns:
+        tuple (numpy array, list of strings): The calculated values of the
+            indicator and the names of its columns. For panel data the values
+            are of shape (periods, columns, symbols).
+    '''
+
+    if isinstance(indicator, SMA):
+        return np.stack([values[('mean', w)] for w in
+            indicator._sma_periods], axis = 1), ['SMA-' + str(w) for w in
+            indicator._sma_periods]
+
+    if isinstance(indicator, EMA):
+        return np.stack([values[('ema', span)] for span in
+            indicator._span_periods], axis = 1), ['EMA-' + str(span) for span 
+            in indicator._span_periods]
+
+    if isinstance(indicator, MACD):
+        return values[('macd',)], ['MACD', 'Signal Line']
+
+    if isinstance(indicator, ADX):
+        return values[('adx',)], ['ADX']
+
+    if isinstance(indicator, DMI):
+        if not indicator._adx:
+            return values[('dm',)], ['DMI+', 'DMI-', 'DX']
+
+        return np.concatenate([values[('dm',)], values[('adx',)][:, None]],
+            axis = 1), ['DMI+', 'DMI-', 'DX', 'ADX']
+
+    if isinstance(indicator, FSO):
+        return _fastStochastic(close = input_data['Close'],
+            lowest_low = values[('min', 14)],
+            highest_high = values[('max', 14)]), ['%K', '%D']
+
+    if isinstance(indicator, SSO):
+        return _slowStochastic(close = input_data['Close'],
+            lowest_low = values[('min', 14)],
+            highest_high = values[('max', 14)]), ['%K', '%D']
+
+    if isinstance(indicator, IC):
+        return _ichimokuCloud(highest_high = np.stack([values[('max', w)] for 
+            w in [9, 26, 52]], axis = 1), lowest_low = np.stack([values[('min',
+            w)] for w in [9, 26, 52]], axis = 1)), ['Tenkan Sen', 'Kijun Sen',
+            'Senkou A', 'Senkou B']
+
+    if isinstance(indicator, BB):
+        window, deviations = indicator._term
+        return _bollingerBands(rolling_mean = values[('mean', window)],
+            rolling_std = values[('std', window)], deviations = deviations), \
+            ['SMA', 'Upper Band', 'Lower Band']
+
+    if isinstance(indicator, SD):
+        return _standardDeviation(rolling_std = values[('std',
+            indicator._periods)], periods = indicator._periods), ['SD']
+
+    if isinstance(indicator, RSI):
+        return _relativeStrengthIndex(input_data['Adj Close'], 
+            look_back = indicator._look_back), ['RSI']
+
+    if isinstance(indicator, FR):
+        levels = _fibonacciRetracement(input_data['Adj Close'])
+        return levels, ['RL' + str(i) for i in range(levels.shape[1])]
+
+    if isinstance(indicator, OBV):
+        return _onBalanceVolume(close = input_data['Adj Close'], 
+            volume = input_data['Volume']), ['OBV']
+
+
+def _createIndicators(df_data, indicators):
+    '''
+    Creates the requested indicator objects, without calculating their values.
+    The arguments of each indicator are validated by its constructor.
+
+    Args:
+        df_data (ValidatedStockData): The validated input data.
+
+        indicators (list): The requested indicators, see calculateIndicators.
+
+    Raises:
+        TypeError()
+        ValueError()
+
+    Returns:
+        list of TI: The indicator objects, in the order requested.
+    '''
+
+    if not isinstance(indicators, list):
+        raise TypeError('The argument indicators should be a `list` but it ' +\
+            'is of type `' + str(type(indicators)) + '`.')
+
+    objects = []
+    for indicator in indicators:
+        name, arguments = indicator if isinstance(indicator, tuple) else \
+            (indicator, {})
+
+        if name not in _INDICATORS:
+            raise ValueError('Not supported indicator `' + str(name) + '`. ' +\
+                'Supported indicators are ' + str(list(_INDICATORS)) + '.')
+
+        if not isinstance(arguments, dict):
+            raise TypeError('The arguments of the indicator `' + name + '` ' +\
+                'should be a `dict` but they are of type `' +\
+                str(type(arguments)) + '`.')
+
+        objects.append(_INDICATORS[name](df_data, **arguments))
+
+    return objects
+
+
+def calculateIndicators(df_data, indicators):
+    '''
+    Calculates several technical indicators for one input data frame. The
+    intermediate results shared by the indicators, such as the 12 and 26
+    periods EMA (EMA, MACD), the rolling means and standard deviations (SMA,
+    BB, SD), the 14 periods rolling extrema (FSO, SSO, IC) and the directional
+    movement (DMI, ADX), are calculated only once.
+
+    Args:
+        df_data (pandas dataframe or ValidatedStockData): The input data to the
+            Technical Indicators. Index is of type date. It should contain the 
+            stock data required by the requested indicators ('High', 'Low', 
+            'Close', 'Adj Close', 'Volume'). The data are validated once for 
+            all the indicators.
+
+        indicators (list): The requested indicators. Each member is either the
+            name of an indicator (for example 'MACD') or a tuple with the name
+            of the indicator and a dictionary with its arguments (for example
+            ('SMA', {'sma_periods': [20, 50]})).
+
+    Raises:
+        TypeError()
+        ValueError()
+
+    Returns:
+        list of TI: The indicator objects, in the order requested, with their
+            values already calculated.
+    '''
+
+    # The input data are validated once, for all the indicators
+    if not isinstance(df_data, ValidatedStockData):
+        df_data = ValidatedStockData(df_data)
+
+    objects = _createIndicators(df_data, indicators)
+
+    # Validated input columns, shared by all the indicators
+    input_data = {column: values.values for column, values in 
+        df_data.getData().items()}
+
+    values = _calculateNodes(input_data, _planNodes(objects))
+
+    for indicator in objects:
+        if len(_requiredNodes(indicator)) == 0:
+            # No shared intermediate results, calculated by the indicator
+            indicator.getTiData()
+        else:
+            data, columns = _assembleIndicator(indicator, values, input_data)
+            indicator._setTiData(pd.DataFrame(index =
+                indicator._input_data.index, data = data, columns = columns))
+
+    return objects
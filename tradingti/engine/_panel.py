@@ -0,0 +1,222 @@
+'''
+File name: _panel.py
+    Calculation of the technical indicators for panel data (several symbols),
+    defined under the tradingti.engine package. The prices of all the symbols
+    are arranged in one matrix, with one column per symbol, and each indicator
+    is calculated for all the symbols in one vectorized pass.
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+import numpy as np
+import pandas as pd
+import pandas.core as pc
+from pandas.api.types import is_numeric_dtype
+from ._engine import _createIndicators, _planNodes, _calculateNodes, \
+    _assembleIndicator
+from ..utils._data_validation import ValidatedStockData
+
+
+def _isSorted(index):
+    '''
+    Checks if a (ticker, date) MultiIndex is sorted, from the codes of its
+    levels. It avoids the comparison of the index tuples.
+
+    Args:
+        index (pandas.MultiIndex): The index to be checked.
+
+    Raises:
+        -
+
+    Returns:
+        boolean: True if the index is sorted in ascending order.
+    '''
+
+    index = index.remove_unused_levels()
+
+    if not all(level.is_monotonic_increasing for level in index.levels):
+        return False
+
+    tickers, dates = [np.diff(codes) for codes in index.codes]
+
+    return bool(np.all((tickers > 0) | ((tickers == 0) & (dates >= 0))))
+
+
+def _validatePanelData(panel_data):
+    '''
+    Validates the panel data and returns them in long format. The panel data
+    are given either in long format, a data frame with a (ticker, date)
+    MultiIndex and one column for each stock data, or in wide format, a data
+    frame with a date index and one column of `Adj Close` prices for each
+    ticker. Missing values are filled for each ticker separately, by executing
+    first a forward pass and then a backward pass.
+
+    Args:
+        panel_data (pandas.core.frame.DataFrame): The panel data.
+
+    Raises:
+        TypeError
+        ValueError
+
+    Returns:
+        pandas.core.frame.DataFrame: The panel data in long format, sorted on
+            ticker and date, with missing values filled.
+    '''
+
+    if not isinstance(panel_data, pc.frame.DataFrame):
+        raise TypeError('The argument should be of type `pandas.core.frame`.' +\
+            'DataFrame but it is of type `' + str(type(panel_data)) + '`.')
+
+    # Wide format, the missing prices between the first and the last date of
+    # each ticker are filled before the stacking, the ones before the first
+    # and after the last date are dropped by the stacking
+    if isinstance(panel_data.index, pc.indexes.datetimes.DatetimeIndex):
+        if not panel_data.index.is_monotonic_increasing:
+            panel_data = panel_data.sort_index(ascending = True)
+
+        observed = panel_data.notna()
+        within = observed.cummax() & observed[::-1].cummax()[::-1]
+
+        panel_data = panel_data.fillna(method = 'ffill').fillna(
+            method = 'bfill').where(within).stack().swaplevel().to_frame(
+            'Adj Close')
+
+    # Validate that the index is a (ticker, date) MultiIndex
+    if not isinstance(panel_data.index, pd.MultiIndex) or \
+        panel_data.index.nlevels != 2 or not isinstance(
+        panel_data.index.levels[1], pc.indexes.datetimes.DatetimeIndex):
+        raise TypeError('The index of the panel data should be a (ticker, '  +\
+            'date) `pandas.MultiIndex`, with dates of type `pandas.core.'     +\
+            'indexes.datetimes.DatetimeIndex`, or a `pandas.core.indexes.'    +\
+            'datetimes.DatetimeIndex` for the wide format.')
+
+    if panel_data.empty:
+        raise ValueError('The input data cannot be empty. data_len = ' +\
+            str(len(panel_data.index)) + '.')
+
+    for column, dtype in panel_data.dtypes.items():
+        if not is_numeric_dtype(dtype):
+            raise ValueError('The input data frame must hold columns of ' +\
+                'numeric type. column `' + str(column) + '`, is_numeric = ' +\
+                str(is_numeric_dtype(dtype)) + '.')
+
+    # Sort on ticker and date, only when not already sorted
+    if not _isSorted(panel_data.index):
+        panel_data = panel_data.sort_index(ascending = True)
+
+    # Fill the missing values within each ticker
+    if any(values.hasnans for _, values in panel_data.items()):
+        panel_data = panel_data.groupby(level = 0, sort = False).fillna(
+            method = 'ffill')
+        panel_data = panel_data.groupby(level = 0, sort = False).fillna(
+            method = 'bfill')
+
+    return panel_data
+
+
+def _panelLayout(panel_data):
+    '''
+    Arranges the rows of the long format panel data in a matrix of periods x
+    symbols. The data of each symbol start at the first row of its column, the
+    rows after the last period of a symbol are NaN.
+
+    Args:
+        panel_data (pandas.core.frame.DataFrame): The validated panel data, in
+            long format.
+
+    Raises:
+        -
+
+    Returns:
+        tuple (numpy array, numpy array, numpy array): The column of each row
+            of the panel data, its row in the matrix and the number of periods
+            of each symbol.
+    '''
+
+    tickers = panel_data.index.remove_unused_levels()
+
+    codes = np.asarray(tickers.codes[0], dtype = np.intp)
+    lengths = np.bincount(codes, minlength = len(tickers.levels[0]))
+
+    # Rows of a symbol are consecutive, the row in the matrix is the position
+    # from the first row of the symbol
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    positions = np.arange(len(codes)) - starts[codes]
+
+    return codes, positions, lengths
+
+
+def calculatePanelIndicators(panel_data, indicators):
+    '''
+    Calculates several technical indicators for the symbols of panel data.
+    Each indicator is calculated for all the symbols together, in one
+    vectorized pass over a matrix with one column per symbol, and the rolling
+    windows and recurrences do not cross from one symbol to another. The
+    intermediate results shared by the indicators are calculated only once, as
+    in calculateIndicators.
+
+    The arguments of the indicators are validated on the symbol with the most
+    periods. The values of a symbol with less periods than a rolling window
+    are calculated on the available periods.
+
+    Args:
+        panel_data (pandas.core.frame.DataFrame): The panel data, either in long
+            format with a (ticker, date) MultiIndex and the stock data required
+            by the requested indicators as columns ('High', 'Low', 'Close',
+            'Adj Close', 'Volume'), or in wide format with a date index and one
+            column of 'Adj Close' prices for each ticker.
+
+        indicators (list): The requested indicators. Each member is either the
+            name of an indicator (for example 'MACD') or a tuple with the name
+            of the indicator and a dictionary with its arguments (for example
+            ('SMA', {'sma_periods': [20, 50]})).
+
+    Raises:
+        TypeError()
+        ValueError()
+
+    Returns:
+        list of pandas.core.frame.DataFrame: The calculated values of each
+            indicator, in the order requested. Index is the (ticker, date)
+            MultiIndex of the long format panel data. The values are of float
+            type.
+    '''
+
+    panel_data = _validatePanelData(panel_data)
+
+    codes, positions, lengths = _panelLayout(panel_data)
+
+    # The arguments of the indicators are validated on the longest symbol
+    longest = np.flatnonzero(codes == np.argmax(lengths))
+    objects = _createIndicators(ValidatedStockData(panel_data.iloc[longest].
+        droplevel(0)), indicators)
+
+    # Matrix of periods x symbols for each input column, the periods of each
+    # symbol are contiguous in memory
+    input_data = {}
+    for column, values in panel_data.items():
+        matrix = np.full((len(lengths), lengths.max()), np.nan, 
+            dtype = np.float64)
+        matrix[codes, positions] = values.values
+        input_data[column] = matrix.T
+
+    values = _calculateNodes(input_data, _planNodes(objects))
+
+    results = []
+    for indicator in objects:
+        data, columns = _assembleIndicator(indicator, values, input_data)
+
+        # Back to the rows of the panel data, (periods, columns, symbols)
+        data = data.reshape(len(data), -1, len(lengths))[positions, :, codes]
+
+        results.append(pd.DataFrame(index = panel_data.index, data = data,
+            columns = columns))
+
+    return results
@@ -13,12 +13,18 @@ Date last modified: 27.01.2020
 Python Version: 3.6
 '''
 
-from ._technical_indicator import TI
+import numpy as np
+from ._technical_indicator import TI, _previousValues, _selectSignals
 from .._constants import *
 from ..utils._data_validation import validateStockData
 from ..utils._data_preprocessing import fillMissingValues
 
 
+# Colors used in rotation for the MA lines, when no colors are given
+_MA_COLORS = ['cornflowerblue', 'tomato', 'limegreen', 'orange', 'purple', 
+    'brown']
+
+
 class AverageTI(TI):
     '''
     Average Technical Indicator class implementation.
@@ -29,18 +35,21 @@ class AverageTI(TI):
             Closed price of a given stock.
             
         calculate_MA (object method): Reference to a method in child class, 
-            which calculates the MA for the given input data.
+            which calculates the MA for the given input data. It is called on
+            the first access to the indicator values.
         
         indicator_name (string): The name of the Technical Indicator.
         
         lines_color (list of matplotlib colors): The colors to be used
-            when generating the plot for a Technical Indicator. Default value is
-            None (default colors will be used).
+            when generating the plot for a Technical Indicator. If None, black
+            is used for the price and one color of the _MA_COLORS list for each
+            period.
                 
         periods (object): The periods (rolling windows, span periods, etc.) for 
             which the technical indicator is calculated. Is a list of integers, 
-            with one (representing the long term MA) or two (representing the 
-            short term and the long term MA) members at most.
+            with one (representing the long term MA) or more members. When 
+            more than one is given, the largest one represents the long term MA
+            and the smallest one the short term MA.
 
     Attributes:
         _indicator_name (string): The name of the Technical Indicator.
@@ -54,6 +63,9 @@ class AverageTI(TI):
     
         getSignal(): Calculates and returns the signal of the technical 
             indicator.
+
+        _calculateSignals(): Calculates the signal of the technical indicator
+            for each date.
         
     Raises:
         TypeError()
@@ -69,18 +81,22 @@ class AverageTI(TI):
             ['Adj Close'], indicator_name = indicator_name)
         
         # Validate the MA input (specific to the indicator)
-        self._inputValidation(df_data, periods)
+        self._inputValidation(input_data, periods)
             
         # If contains only one member, this is considered as long term SMA
-        # If contains two members, then the larger value is considered as the 
-        # long term SMA and the shorter one is considered as the short term SMA
+        # If contains more members, then the largest value is considered as the
+        # long term SMA and the shortest one is considered as the short term SMA
         self._periods = periods
         self._indicator_name = indicator_name
+
+        if lines_color is None:
+            lines_color = ['black'] + [_MA_COLORS[i % len(_MA_COLORS)] for i in
+                range(len(periods))]
             
         # Parent class constructor (all job is done here, parent class provides 
         # the public interface for accessing the data of the indicator)    
         super().__init__(input_data = input_data, 
-            ti_data = calculate_MA(input_data), indicator_name = indicator_name, 
+            ti_data = calculate_MA, indicator_name = indicator_name, 
             plotted_input_columns = ['Adj Close'], y_label = 'Price', 
             lines_color = lines_color, alpha_values = [0.5] + \
             [1.0] * len(self._periods), subplots = False)
@@ -108,14 +124,14 @@ class AverageTI(TI):
         
         # Validate that the periods is a list
         if not isinstance(periods, list):
-            message = 'periods must be a list of one or two positive integers. '+\
+            message = 'periods must be a list of positive integers. '+\
                 'periods_type = ' + str(type(periods)) + '.'          
             raise(TypeError(message))
         
         # Validate that the periods is valid (not empty list of postive integers)
-        if len(periods) == 0 or len(periods) > 2:
-            message = 'periods must contain one or two positive integers with values' +\
-                'less than the number of the input data points. '+\
+        if len(periods) == 0:
+            message = 'periods must contain at least one positive integer with ' +\
+                'value less than the number of the input data points. '+\
                 'periods = ' + str(periods) + ' contains ' + str(len(periods)) + '.'           
             raise(ValueError(message))
             
@@ -169,6 +185,8 @@ class AverageTI(TI):
                 
         else:
             long_term_signal = TRADE_SIGNALS['Hold']
+
+        signal = long_term_signal
         
         # Signal from short term MA
         if len(self._periods) > 1:
@@ -205,4 +223,66 @@ class AverageTI(TI):
                 signal = signal / 2
  
         return (list(TRADE_SIGNALS.keys())[list(TRADE_SIGNALS.values()).
-            index(signal)], signal) 
\ No newline at end of file
+            index(signal)], signal)
+
+
+    def _crossingSignals(self, values, moving_average):
+        '''
+        Calculates the signal of the values crossing a moving average, for each
+        date.
+
+        Args:
+            values (numpy array): The crossing values (prices or the short term
+                MA), sorted on date.
+
+            moving_average (numpy array): The crossed moving average values.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The signal value of each date, 'Buy' when the values
+                cross above the moving average, 'Sell' when they cross below it.
+        '''
+
+        distance = values - moving_average
+
+        crossing = _previousValues(distance)*distance < 0
+
+        return np.where(crossing & (distance > 0), TRADE_SIGNALS['Buy'], 
+            np.where(crossing & (distance < 0), TRADE_SIGNALS['Sell'], 
+            TRADE_SIGNALS['Hold']))
+
+
+    def _calculateSignals(self):
+        '''
+        Calculates the signal of the technical indicator for each date, see the
+        getSignal method. The long term and the short term signals are merged
+        for all the dates together.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The signal value of each date.
+        '''
+
+        ma_name = self._indicator_name.split('-')[0] + '-'
+        long_term_MA = self._ti_data[ma_name + str(max(self._periods))].values
+
+        # Signal from long term MA, prices crosses the long term MA
+        signals = self._crossingSignals(self._input_data.iloc[:, 0].values,
+            long_term_MA)
+
+        # Signal from short term MA, MAs crosses each other
+        if len(self._periods) > 1:
+            signals = signals + self._crossingSignals(self._ti_data[ma_name +
+                str(min(self._periods))].values, long_term_MA)
+
+        # Merged signals are normalized
+        return _selectSignals([(signals <= -1, TRADE_SIGNALS['Buy']), 
+            (signals >= 1, TRADE_SIGNALS['Sell'])], 
+            periods = max(max(self._periods), 2))
@@ -17,11 +17,159 @@ Date last modified: 09.02.2020
 Python Version: 3.6
 '''
 
+import numpy as np
 import pandas as pd
 from .._constants import *
-from ._technical_indicator import TI
+from ._technical_indicator import TI, _previousValues, _selectSignals
 from ..utils._data_validation import validateStockData
 from ..utils._data_preprocessing import fillMissingValues
+from ..utils._rolling_kernels import rollingMax, rollingMin, rollingMean
+
+
+def _fastStochastic(close, lowest_low, highest_high):
+    '''
+    Calculates the fast stochastic oscillator (%K, %D) from the close prices and
+    the 14 periods rolling extrema.
+
+    Args:
+        close (numpy array): The `Close` prices, sorted on date.
+
+        lowest_low (numpy array): The lowest `Low` price of the last 14 periods.
+
+        highest_high (numpy array): The highest `High` price of the last 14 
+            periods.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: Array of shape (len(close), 2), or (len(close), 2, symbols)
+            for panel prices with one column per symbol, holding the '%K' and 
+            the '%D' values.
+    '''
+
+    fso = np.zeros((len(close), 2) + close.shape[1:], dtype = np.float64)
+
+    # Fast oscillating (%K), the first 13 periods are left to zero
+    fso[13:, 0] = np.round(100*(close[13:] - lowest_low[13:])/(
+        highest_high[13:] - lowest_low[13:]), 2)
+
+    # Moving average of fast oscillating (%D)
+    fso[:, 1] = np.round(rollingMean(fso[:, 0], windows = [3])[:, 0], 2)
+
+    return fso
+
+
+def _slowStochastic(close, lowest_low, highest_high):
+    '''
+    Calculates the slow stochastic oscillator (%K, %D) from the close prices and
+    the 14 periods rolling extrema.
+
+    Args:
+        close (numpy array): The `Close` prices, sorted on date.
+
+        lowest_low (numpy array): The lowest `Low` price of the last 14 periods.
+
+        highest_high (numpy array): The highest `High` price of the last 14 
+            periods.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: Array of shape (len(close), 2), or (len(close), 2, symbols)
+            for panel prices with one column per symbol, holding the '%K' and 
+            the '%D' values.
+    '''
+
+    sso = np.zeros((len(close), 2) + close.shape[1:], dtype = np.float64)
+
+    C_L14 = close - lowest_low
+    H14_L14 = highest_high - lowest_low
+
+    # Sum of the last three periods (C - L14) and (H14 - L14), summed from
+    # the most recent period backwards
+    sum_C_L14 = C_L14[15:] + C_L14[14:-1] + C_L14[13:-2]
+    sum_H14_L14 = H14_L14[15:] + H14_L14[14:-1] + H14_L14[13:-2]
+
+    # Slow oscillating (%K), the first 15 periods are left to zero
+    sso[15:, 0] = np.round(100*sum_C_L14/sum_H14_L14, 2)
+
+    # Moving average of slow oscillating (%D)
+    sso[:, 1] = np.round(rollingMean(sso[:, 0], windows = [3])[:, 0], 2)
+
+    return sso
+
+
+def _ichimokuCloud(highest_high, lowest_low):
+    '''
+    Calculates the Ichimoku Cloud lines from the rolling extrema of the 9, 26 
+    and 52 periods windows.
+
+    Args:
+        highest_high (numpy array): Array of shape (periods, 3), the highest 
+            `High` price of the last 9, 26 and 52 periods.
+
+        lowest_low (numpy array): Array of shape (periods, 3), the lowest `Low`
+            price of the last 9, 26 and 52 periods.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: Array of shape (periods, 4), or (periods, 4, symbols) for
+            panel extrema of shape (periods, 3, symbols), holding the 'Tenkan 
+            Sen', the 'Kijun Sen', the 'Senkou A' and the 'Senkou B' values.
+    '''
+
+    ic = np.full((len(highest_high), 4) + highest_high.shape[2:], np.nan, 
+        dtype = np.float64)
+
+    # Tenkan Sen and Kijun Sen
+    ic[:, 0] = (highest_high[:, 0] + lowest_low[:, 0])/2
+    ic[:, 1] = (highest_high[:, 1] + lowest_low[:, 1])/2
+
+    # Is optional, not needed in this version of the indicator. Column
+    # removed also from the ic dataframe definition.
+    #ic['Chiku Span'] = input_data['Adj Close'].shift(-26)
+
+    # Senkou A and Senkou B, shifted 26 periods ahead
+    ic[26:, 2] = ((ic[:, 0] + ic[:, 1])/2)[:-26]
+    ic[26:, 3] = ((highest_high[:, 2] + lowest_low[:, 2])/2)[:-26]
+
+    return ic
+
+
+def _stochasticSignals(oscillator, signal_line):
+    '''
+    Calculates the signal of a stochastic oscillator (FSO, SSO) for each date,
+    see the getSignal method of the FSO and the SSO technical indicators.
+
+    Args:
+        oscillator (numpy array): The '%K' values, sorted on date.
+
+        signal_line (numpy array): The '%D' values, sorted on date.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: The signal value of each date.
+    '''
+
+    previous = _previousValues(oscillator)
+
+    return _selectSignals([
+        # The oscillator crosses back below 80 / back above 20
+        ((previous > 80.) & (oscillator < 80.), TRADE_SIGNALS['Sell']),
+        ((previous < 20.) & (oscillator > 20.), TRADE_SIGNALS['Buy']),
+        # A decreasing %K line crosses below the %D line in the overbought
+        # region, an increasing %K line crosses above the %D line in the
+        # oversold region
+        ((previous - oscillator > 0.) & (oscillator - signal_line < 0.) & 
+            (oscillator > 80.), TRADE_SIGNALS['Sell']),
+        ((previous - oscillator < 0.) & (oscillator - signal_line > 0.) & 
+            (oscillator < 20.), TRADE_SIGNALS['Buy'])], periods = 2)
 
 
 class FSO(TI):
@@ -54,7 +202,7 @@ class FSO(TI):
         # Parent class constructor (all job is done here, parent class provides 
         # the public interface for accessing the data of the indicator)    
         super().__init__(input_data = input_data, 
-            ti_data = self._calculateIndicator(input_data),
+            ti_data = self._calculateIndicator,
             indicator_name = 'FSO', plotted_input_columns = ['Adj Close'], 
             y_label = 'Percentage | Price', lines_color = ['black', 
             'cornflowerblue', 'tomato'], subplots = True)
@@ -77,32 +225,15 @@ class FSO(TI):
                 '%K', '%D'.
         '''
         
-        fso = pd.DataFrame(index = input_data.index)
-        
-        # Fast oscillating (%K), initialize the first 13 periods to zero
-        K = [0.0]*13
-
-        for i in range(13, len(input_data.index)):
+        # Lowest low and highest high for the last 14 periods, computed for the
+        # whole series in one pass
+        fso = _fastStochastic(close = input_data['Close'].values, 
+            lowest_low = rollingMin(input_data['Low'].values, 
+            windows = [14])[:, 0], highest_high = rollingMax(
+            input_data['High'].values, windows = [14])[:, 0])
 
-            # Lowest low for the last 14 periods
-            L14 = min(input_data.iloc[i-13:i+1, input_data.columns.
-                get_loc('Low')].values)
-            
-            # Highest high for the last 14 periods
-            H14 = max(input_data.iloc[i-13:i+1, input_data.columns.
-                get_loc('High')].values)
-            
-            K.append(round(100*(input_data.iat[i, input_data.columns.
-                get_loc('Close')] - L14)/(H14 - L14), 2))
-        
-        fso['%K'] = K
-        
-        # Moving average of fast oscillating (%D)
-        fso = pd.concat([fso, fso.rolling(window = 3, min_periods = 1, 
-            center = False, win_type = None, on = None, axis = 0, closed = None)
-            .mean().round(2)], axis = 1)
-        
-        fso.columns = ['%K', '%D']
+        fso = pd.DataFrame(index = input_data.index, data = fso, 
+            columns = ['%K', '%D'])
         
         return fso
     
@@ -148,8 +279,27 @@ class FSO(TI):
             return ('Buy', TRADE_SIGNALS['Buy'])
         
         return ('Hold', TRADE_SIGNALS['Hold'])
-        
-        
+
+
+    def _calculateSignals(self):
+        '''
+        Calculates the signal of the technical indicator for each date, see the
+        getSignal method.
+    
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The signal value of each date.
+        '''
+
+        return _stochasticSignals(oscillator = self._ti_data['%K'].values, 
+            signal_line = self._ti_data['%D'].values)
+
+
 class SSO(TI):
     '''
     Slow Stochastic Oscillator (SSO) Technical Indicator class implementation.
@@ -180,7 +330,7 @@ class SSO(TI):
         # Parent class constructor (all job is done here, parent class provides 
         # the public interface for accessing the data of the indicator)    
         super().__init__(input_data = input_data, 
-            ti_data = self._calculateIndicator(input_data),
+            ti_data = self._calculateIndicator,
             indicator_name = 'SSO', plotted_input_columns = ['Adj Close'], 
             y_label = 'Percentage | Price', lines_color = ['black', 
             'cornflowerblue', 'tomato'], subplots = True)
@@ -204,38 +354,15 @@ class SSO(TI):
                 the '%K', '%D'.
         '''
         
-        sso = pd.DataFrame(index = input_data.index)
-        
-        # Slow oscillating (%K), initialize the first 13 periods to zero
-        K = [0.0]*15
-
-        for i in range(15, len(input_data.index)):
+        # Lowest low and highest high for the last 14 periods, computed once 
+        # for the whole series
+        sso = _slowStochastic(close = input_data['Close'].values, 
+            lowest_low = rollingMin(input_data['Low'].values, 
+            windows = [14])[:, 0], highest_high = rollingMax(
+            input_data['High'].values, windows = [14])[:, 0])
 
-            # Lowest low for the last 14 periods, sum of three periods low
-            # Highest high for the last 14 periods, sum of three periods high
-            sum_C_L14 = 0
-            sum_H14_L14 = 0
-            for j in range(3):
-                L14 = min(input_data.iloc[i-13-j:i-j+1, input_data.columns.
-                    get_loc('Low')].values)
-                H14 = max(input_data.iloc[i-13-j:i-j+1, input_data.columns.
-                    get_loc('High')].values)
-                
-                sum_H14_L14 += H14 - L14
-                sum_C_L14 += input_data.iat[i-j, input_data.columns.
-                    get_loc('Close')] - L14
-            
-            K.append(round(100*sum_C_L14/sum_H14_L14, 2))
-        
-        sso['%K'] = K
-        
-        # Moving average of slow oscillating (%D)
-        sso = pd.concat([sso, sso.rolling(window = 3, min_periods = 1, 
-            center = False,
-                win_type = None, on = None, axis = 0, closed = None).mean().
-                    round(2)], axis = 1)
-        
-        sso.columns = ['%K', '%D']
+        sso = pd.DataFrame(index = input_data.index, data = sso, 
+            columns = ['%K', '%D'])
         
         return sso
     
@@ -283,6 +410,108 @@ class SSO(TI):
         return ('Hold', TRADE_SIGNALS['Hold'])
 
 
+    def _calculateSignals(self):
+        '''
+        Calculates the signal of the technical indicator for each date, see the
+        getSignal method.
+    
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The signal value of each date.
+        '''
+
+        return _stochasticSignals(oscillator = self._ti_data['%K'].values, 
+            signal_line = self._ti_data['%D'].values)
+
+
+def _lookBackTotals(changes, look_back):
+    '''
+    Calculates the total of the price changes in each look_back window, from
+    the running sums of the changes. The rounding error of each addition of a
+    running sum is kept exactly (two-sum) and added up in a second running sum,
+    and the total of a window is the difference of the two running sums at its
+    ends. The totals are within a unit in the last place of the exact totals,
+    independent of the length of the history, so a RSI value on a 70 or 30
+    level gives the same signal as the exact sum. A window without changes
+    totals exactly 0. The same summation is used by the streaming RSI
+    indicators.
+
+    Args:
+        changes (numpy array): The upward or downward price changes, sorted on
+            date. Two dimensional for panel prices, with one column per symbol.
+
+        look_back (int): The number of changes in each window.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: The total of each full window, the first one ends at the
+            look_back change.
+    '''
+
+    start = np.zeros((1,) + changes.shape[1:], dtype = np.float64)
+
+    # Running sums, from zero before the first change
+    sums = np.concatenate([start, np.cumsum(changes, axis = 0)])
+
+    # Rounding error of each addition (two-sum), and their running sums
+    added = sums[1:] - sums[:-1]
+    errors = (sums[:-1] - (sums[1:] - added)) + (changes - added)
+    errors = np.concatenate([start, np.cumsum(errors, axis = 0)])
+
+    return (sums[look_back:] - sums[:-look_back]) + (errors[look_back:] -
+        errors[:-look_back])
+
+
+def _relativeStrengthIndex(prices, look_back):
+    '''
+    Calculates the relative strength index of the prices.
+
+    Args:
+        prices (numpy array): The `Adj Close` prices, sorted on date. Two 
+            dimensional for panel prices, with one column per symbol.
+
+        look_back (int): The number of periods used for the averages.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: The 'RSI' values, of the same shape as the prices. The 
+            first look_back periods are NaN.
+    '''
+
+    rsi = np.full(prices.shape, np.nan, dtype = np.float64)
+
+    # Upward and downward price changes for each period
+    delta = np.diff(prices, axis = 0)
+    upward_price_change = np.where(delta >= 0., delta, 0.)
+    downward_price_change = np.where(delta < 0., -delta, 0.)
+
+    # Total upward and downward changes in each look_back window, the 
+    # windows are available from the look_back period onwards. A window
+    # without changes in one direction sums to exactly 0.
+    upward_total = _lookBackTotals(upward_price_change, look_back)
+    downward_total = _lookBackTotals(downward_price_change, look_back)
+
+    # Calculate the averages for upward and downward changes
+    upward_average = upward_total/look_back
+    downward_average = downward_total/look_back
+    
+    # Set RSI for each period (first look_back periods are skipped)
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        rsi[look_back:] = np.where(downward_average == 0., 100., 
+            100-(100/(1+(upward_average/downward_average))))
+
+    return rsi
+
+
 class RSI(TI):
     '''
     Relative Strength Index (RSI) Technical Indicator class implementation.
@@ -316,10 +545,10 @@ class RSI(TI):
 
         # Validate look_back values
         if type(look_back) != int or look_back <= 0 or \
-            look_back > len(df_data.index):
+            look_back > len(input_data.index):
             raise(ValueError('`look_back` argument should be a positive ' +\
                 'integer less than the number of input periods ('         +\
-                str(len(df_data.index))+ '), but look_back = ' +\
+                str(len(input_data.index))+ '), but look_back = ' +\
                 str(look_back) + '.'))
                 
         self._look_back = look_back
@@ -327,7 +556,7 @@ class RSI(TI):
         # Parent class constructor (all job is done here, parent class provides 
         # the public interface for accessing the data of the indicator)    
         super().__init__(input_data = input_data, 
-            ti_data = self._calculateIndicator(input_data),
+            ti_data = self._calculateIndicator,
             indicator_name = 'RSI-' + str(self._look_back), 
             plotted_input_columns = ['Adj Close'], y_label = 'RSI | Price', 
             lines_color = ['black', 'tomato'], subplots = True)
@@ -350,37 +579,12 @@ class RSI(TI):
                 indicator. Index is of type date. It contains one column 'RSI'.
         '''
 
-        rsi = pd.DataFrame(data = None, index = input_data.index, 
+        rsi = _relativeStrengthIndex(input_data['Adj Close'].values, 
+            look_back = self._look_back)
+
+        rsi = pd.DataFrame(index = input_data.index, data = rsi, 
             columns = ['RSI'])
-    
-        # Calculate RSI for each period (first look_back periods are skipped)
-        for i in range (self._look_back, len(input_data.index)):
-            
-            # Initialize for each look_back period
-            upward_price_change = 0
-            downward_price_change = 0
-
-            # Calculate the total upward and downward changes in the look_back
-            # period
-            for t in range(i - self._look_back+1, i+1):
-
-                delta = input_data.iat[t, 0] - input_data.iat[t-1, 0]
-     
-                if delta >= 0.:
-                    upward_price_change += delta
-                else:
-                    downward_price_change -= delta
-
-            # Calculate the averages for upward and downward changes
-            upward_average = upward_price_change/self._look_back
-            downward_average = downward_price_change/self._look_back
-            
-            # Set RSI for the day i
-            if downward_average == 0.:
-                rsi.iat[i, 0] = 100
-            else:           
-                rsi.iat[i, 0] = 100-(100/(1+(upward_average/downward_average)))
-        
+
         return rsi        
 
         
@@ -409,8 +613,33 @@ class RSI(TI):
             return ('Buy', TRADE_SIGNALS['Buy'])
         
         return ('Hold', TRADE_SIGNALS['Hold'])
-        
-        
+
+
+    def _calculateSignals(self):
+        '''
+        Calculates the signal of the technical indicator for each date, see the
+        getSignal method.
+    
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The signal value of each date.
+        '''
+
+        rsi = self._ti_data['RSI'].values
+        previous_rsi = _previousValues(rsi)
+
+        # Overbought region, oversold region
+        return _selectSignals([
+            ((previous_rsi < 70.) & (rsi > 70.), TRADE_SIGNALS['Sell']),
+            ((previous_rsi > 30.) & (rsi < 30.), TRADE_SIGNALS['Buy'])], 
+            periods = max(self._look_back, 2))
+
+
 class IC(TI):
     '''
     Ichimoku Cloud (IC) Technical Indicator class implementation.
@@ -438,16 +667,15 @@ class IC(TI):
         input_data = validateStockData(data = df_data, required_columns = 
             ['High', 'Low', 'Close', 'Adj Close'], indicator_name = 'IC')
 
-        ti_data = self._calculateIndicator(input_data) # used in areas below
-        
         # Parent class constructor (all job is done here, parent class provides 
         # the public interface for accessing the data of the indicator)    
         super().__init__(input_data = input_data, 
-            ti_data = ti_data, indicator_name = 'IC', plotted_input_columns = 
-            ['Adj Close'], y_label = 'Price', lines_color = ['black', 
-            'cornflowerblue', 'tomato', 'limegreen', 'orange', 'purple'], 
-            areas = [{'x': ti_data.index, 'y1': ti_data['Senkou A'], 'y2': 
-            ti_data['Senkou B'], 'color': 'lightblue'}], subplots = False)
+            ti_data = self._calculateIndicator, indicator_name = 'IC', 
+            plotted_input_columns = ['Adj Close'], y_label = 'Price', 
+            lines_color = ['black', 'cornflowerblue', 'tomato', 'limegreen', 
+            'orange', 'purple'], areas = [{'x': input_data.index, 'y1': 
+            'Senkou A', 'y2': 'Senkou B', 'color': 'lightblue'}], 
+            subplots = False)
             
     
     def _calculateIndicator(self, input_data):
@@ -467,27 +695,14 @@ class IC(TI):
                 'Tenkan Sen', 'Kijun Sen', 'Senkou A', 'Senkou B'.
         '''
         
-        # Build the indicator's dataframe 
-        ic = pd.DataFrame(index = input_data.index, columns = ['Tenkan Sen', 
-            'Kijun Sen', 'Senkou A', 'Senkou B'], data = None)
-        
-        ic['Tenkan Sen'] = (input_data['High'].rolling(window = 9, 
-            min_periods = 1).max() + input_data['Low'].rolling(window = 9,  
-            min_periods = 1).min())/2
-
-        ic['Kijun Sen'] = (input_data['High'].rolling(window = 26,
-            min_periods = 1).max() + input_data['Low'].rolling(window = 26,
-            min_periods = 1).min())/2
-
-        # Is optional, not needed in this version of the indicator. Column
-        # removed also from the ic dataframe definition.
-        #ic['Chiku Span'] = input_data['Adj Close'].shift(-26)
+        # Highest high and lowest low for the 9, 26 and 52 periods windows, 
+        # computed together
+        ic = _ichimokuCloud(highest_high = rollingMax(input_data['High'].values,
+            windows = [9, 26, 52]), lowest_low = rollingMin(
+            input_data['Low'].values, windows = [9, 26, 52]))
 
-        ic['Senkou A'] = ((ic['Tenkan Sen'] + ic['Kijun Sen'])/2).shift(26) 
-        
-        ic['Senkou B'] = ((input_data['High'].rolling(window = 52, 
-            min_periods = 1).max() + input_data['Low'].rolling(window = 52, 
-            min_periods = 1).min())/2).shift(26)
+        ic = pd.DataFrame(index = input_data.index, data = ic, 
+            columns = ['Tenkan Sen', 'Kijun Sen', 'Senkou A', 'Senkou B'])
         
         return ic
 
@@ -515,6 +730,39 @@ class IC(TI):
         ordered_values.sort()
         
         return ordered_values.index(value) - 1
+
+
+    def _whereInCloudValues(self, values, cloud_a, cloud_b):
+        '''
+        Checks the relative position of each value to the cloud of its date,
+        see the _whereInCloud method.
+
+        Args:
+            values (numpy array): The values for which the relative position to
+                the cloud should be calculated, sorted on date.
+
+            cloud_a, cloud_b (numpy array): Bounds of the cloud of each date, in
+                not guaranteed order.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The relative position of each value, see the 
+                _whereInCloud method.
+        '''
+
+        # The position of a value is the number of cloud bounds below it
+        positions = (cloud_a < values).astype(np.int64) + (cloud_b < values) - 1
+
+        # The ordering of a missing bound (the first 26 dates of the Senkou 
+        # lines) is left to the _whereInCloud method
+        for i in np.flatnonzero(np.isnan(values) | np.isnan(cloud_a) | 
+            np.isnan(cloud_b)):
+            positions[i] = self._whereInCloud(values[i], [cloud_a[i], 
+                cloud_b[i]])
+
+        return positions
         
     
     def getSignal(self):
@@ -557,4 +805,37 @@ class IC(TI):
             [self._ti_data.iat[-1,2], self._ti_data.iat[-1,3]]) == -1:
             return ('Sell', TRADE_SIGNALS['Sell'])
             
-        return ('Hold', TRADE_SIGNALS['Hold'])
\ No newline at end of file
+        return ('Hold', TRADE_SIGNALS['Hold'])
+
+
+    def _calculateSignals(self):
+        '''
+        Calculates the signal of the technical indicator for each date, see the
+        getSignal method.
+    
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The signal value of each date.
+        '''
+
+        tenkan_sen = self._ti_data['Tenkan Sen'].values
+        kijun_sen = self._ti_data['Kijun Sen'].values
+        cloud = (self._ti_data['Senkou A'].values, 
+            self._ti_data['Senkou B'].values)
+
+        # Position of the price, the Tenkan Sen and the Kijun Sen to the cloud
+        positions = [self._whereInCloudValues(values, *cloud) for values in 
+            [self._input_data['Adj Close'].values, tenkan_sen, kijun_sen]]
+
+        # The Tenkan Sen crosses above the Kijun Sen while all are above the 
+        # cloud, or below the Kijun Sen while all are below the cloud
+        return _selectSignals([
+            ((tenkan_sen > kijun_sen) & np.all(np.equal(positions, 1), 
+                axis = 0), TRADE_SIGNALS['Buy']),
+            ((tenkan_sen < kijun_sen) & np.all(np.equal(positions, -1), 
+                axis = 0), TRADE_SIGNALS['Sell'])], periods = 1)
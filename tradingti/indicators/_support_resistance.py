@@ -14,13 +14,45 @@ Date last modified: 02.02.2020
 Python Version: 3.6
 '''
 
+import numpy as np
 import pandas as pd
-from ._technical_indicator import TI
+from ._technical_indicator import TI, _previousValues, _selectSignals
 from ..utils._data_validation import validateStockData
 from ..utils._data_preprocessing import fillMissingValues
 from .._constants import *
 
 
+def _fibonacciRetracement(prices):
+    '''
+    Calculates the Fibonacci retracement levels of the prices.
+
+    Args:
+        prices (numpy array): The `Adj Close` prices, sorted on date. Two 
+            dimensional for panel prices, with one column per symbol (missing
+            values are ignored).
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: Array of shape (len(prices), 5), or (len(prices), 5, 
+            symbols) for panel prices, holding the five retracement levels. It
+            is a read-only view of the levels, the same for each period.
+    '''
+
+    total_max = np.nanmax(prices, axis = 0)
+    total_min = np.nanmin(prices, axis = 0)
+
+    max_min_difference = total_max - total_min
+    
+    retracement_levels = np.array([total_max - c*max_min_difference for c in 
+        [0.0, 0.236, 0.382, 0.618, 1.0]], dtype = np.float64)
+    
+    # Levels are constant, a view repeats them for each period of the input
+    return np.broadcast_to(retracement_levels, (len(prices),) + 
+        retracement_levels.shape)
+
+
 class FR(TI):
     '''
     Fibonacci Retracement (FR) Technical Indicator class implementation.
@@ -51,7 +83,7 @@ class FR(TI):
         # Parent class constructor (all job is done here, parent class provides 
         # the public interface for accessing the data of the indicator)    
         super().__init__(input_data = input_data, 
-            ti_data = self._calculateIndicator(input_data),
+            ti_data = self._calculateIndicator,
             indicator_name = 'FR', plotted_input_columns = ['Adj Close'], 
             lines_color = ['black', 'limegreen', 'brown', 'peru', 
             'orange', 'red'], subplots = False)
@@ -74,18 +106,11 @@ class FR(TI):
                 resistance levels 'RL0', 'RL1', 'RL2', 'RL3' and 'RL4'.
         '''
 
-        total_max = input_data['Adj Close'].max()
-        total_min = input_data['Adj Close'].min()
+        levels = _fibonacciRetracement(input_data['Adj Close'].values)[0]
 
-        max_min_difference = total_max - total_min
-        
-        retracement_levels = [total_max - c*max_min_difference for c in 
-            [0.0, 0.236, 0.382, 0.618, 1.0]]
-            
-        fr = pd.DataFrame(index = input_data.index, 
-            data = [[retracement_levels[i] for i in 
-            range(len(retracement_levels))]]*len(input_data.index), 
-            columns = ['RL' + str(i) for i in range(len(retracement_levels))])
+        # One column for each level, filled with the level
+        fr = pd.DataFrame(index = input_data.index, data = {'RL' + str(i):
+            level for i, level in enumerate(levels)}, dtype = np.float64)
         
         return fr
         
@@ -106,30 +131,58 @@ class FR(TI):
             constant.
         '''
         
+        # The retracement levels, same for all the periods
+        levels = self._ti_data.values[-1]
+
         # Moves from in RL to another in downward direction
-        if self._input_data.iat[-2,0] > self._ti_data.iat[-2,3] and\
-            self._input_data.iat[-1,0] < self._ti_data.iat[-1,3]:
-            return ('Sell', TRADE_SIGNALS['Sell'])
-            
-        if self._input_data.iat[-2,0] > self._ti_data.iat[-2,2] and\
-            self._input_data.iat[-1,0] < self._ti_data.iat[-1,2]:
-            return ('Sell', TRADE_SIGNALS['Sell'])
-            
-        if self._input_data.iat[-2,0] > self._ti_data.iat[-2,1] and\
-            self._input_data.iat[-1,0] < self._ti_data.iat[-1,1]:
-            return ('Sell', TRADE_SIGNALS['Sell'])
+        for level in [3, 2, 1]:
+            if self._input_data.iat[-2,0] > levels[level] and\
+                self._input_data.iat[-1,0] < levels[level]:
+                return ('Sell', TRADE_SIGNALS['Sell'])
             
         # Moves from in RL to another in the upward direction
-        if self._input_data.iat[-2,0] < self._ti_data.iat[-2,3] and\
-            self._input_data.iat[-1,0] > self._ti_data.iat[-1,3]:
-            return ('Buy', TRADE_SIGNALS['Buy'])
-            
-        if self._input_data.iat[-2,0] < self._ti_data.iat[-2,2] and\
-            self._input_data.iat[-1,0] > self._ti_data.iat[-1,2]:
-            return ('Buy', TRADE_SIGNALS['Buy'])
-            
-        if self._input_data.iat[-2,0] < self._ti_data.iat[-2,1] and\
-            self._input_data.iat[-1,0] > self._ti_data.iat[-1,1]:
-            return ('Buy', TRADE_SIGNALS['Buy'])
+        for level in [3, 2, 1]:
+            if self._input_data.iat[-2,0] < levels[level] and\
+                self._input_data.iat[-1,0] > levels[level]:
+                return ('Buy', TRADE_SIGNALS['Buy'])
             
         return ('Hold', TRADE_SIGNALS['Hold'])
+
+
+    def _calculateSignals(self):
+        '''
+        Calculates the signal of the technical indicator for each date, see the
+        getSignal method. The retracement levels of a date are the ones of the
+        prices up to this date, calculated from the running maximum and minimum
+        price.
+    
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The signal value of each date.
+        '''
+
+        prices = self._input_data.iloc[:, 0].values
+        previous_prices = _previousValues(prices)
+
+        # Running maximum and minimum, missing values are ignored
+        running_max = np.fmax.accumulate(self._input_data['Adj Close'].values)
+        running_min = np.fmin.accumulate(self._input_data['Adj Close'].values)
+        max_min_difference = running_max - running_min
+
+        # Moves from in RL to another in downward or upward direction, for the
+        # retracement levels 1 to 3
+        downward = np.zeros(len(prices), dtype = bool)
+        upward = np.zeros(len(prices), dtype = bool)
+
+        for c in [0.618, 0.382, 0.236]:
+            level = running_max - c*max_min_difference
+            downward |= (previous_prices > level) & (prices < level)
+            upward |= (previous_prices < level) & (prices > level)
+
+        return _selectSignals([(downward, TRADE_SIGNALS['Sell']), 
+            (upward, TRADE_SIGNALS['Buy'])], periods = 2)
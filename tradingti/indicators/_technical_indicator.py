@@ -7,15 +7,70 @@ enail: vsaveris@gmail.com
 
 License: MIT
 
-Date last modified: 08.02.2020
+Date last modified: 18.10.2026
 
 Python Version: 3.6
 '''
 
+import threading
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
 from ..utils import linesGraph
 from ..utils._data_validation import validateDataFrame
+from .._constants import *
+
+
+def _previousValues(values, periods = 1):
+    '''
+    Shifts the values of a series forward, so that each period holds the value
+    of `periods` periods before it.
+
+    Args:
+        values (numpy array): The values, sorted on date.
+
+        periods (int): The number of periods to shift. Default value is 1.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: The shifted values, as float. The first periods are NaN.
+    '''
+
+    previous = np.full(len(values), np.nan, dtype = np.float64)
+    previous[periods:] = values[:len(values) - periods]
+
+    return previous
+
+
+def _selectSignals(rules, periods):
+    '''
+    Selects the signal of each period from the rules of a getSignal method. The
+    rules are checked in the order given, and the first one which applies gives
+    the signal of the period. Periods to which no rule applies are 'Hold'.
+
+    Args:
+        rules (list of tuples (numpy array, integer)): The rules of the signal,
+            as boolean mask of the periods to which the rule applies, signal
+            value.
+
+        periods (int): The number of periods the indicator and its signal
+            rules require. The signal of the earlier periods is 'Hold'.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: The signal value of each period, see TRADE_SIGNALS package
+            constant.
+    '''
+
+    signals = np.select([mask for mask, _ in rules], [signal for _, signal in 
+        rules], TRADE_SIGNALS['Hold']).astype(np.int64)
+    signals[:periods - 1] = TRADE_SIGNALS['Hold']
+
+    return signals
 
 
 class TI(ABC):
@@ -30,9 +85,13 @@ class TI(ABC):
             stock related data such `High`, `Low`, `Volume`, `Close`, 
             `Adj Close`, depending the Technical Indicator.
             
-        ti_data (pandas dataframe): The calculated values of the Technical
-            indicator. Index is of type date. It contains a number of columns
-            depending the Technical Indicator.
+        ti_data (pandas dataframe or callable): The calculated values of the 
+            Technical indicator. Index is of type date. It contains a number of
+            columns depending the Technical Indicator. When a callable is given
+            (the _calculateIndicator method of the indicator), it is called with
+            the input_data on the first access to the indicator values and its
+            result is cached (lazy evaluation). The calculation runs once,
+            also when the values are first accessed from several threads.
     
         indicator_name (string): The name of the Technical Indicator.
                 
@@ -57,7 +116,8 @@ class TI(ABC):
             the fill_between matplotlib method. Each member of the list should
             be a dictionary with the below keys:
             {'x':, 'y1':, 'y2':, 'color':}, see fill_between matplotlib method
-            for more details.
+            for more details. The 'y1' and 'y2' values can also be given as the
+            name of a column of the calculated values of the indicator.
             
         subplots (boolean): Indicates if the technical indicator graph should
             contain subplots.
@@ -66,7 +126,7 @@ class TI(ABC):
         _input_data (pandas dataframe): The input to the Technical Indicator.
 
         _ti_data (pandas dataframe): The calculated values of the Technical
-            indicator.
+            indicator, calculated on first access when lazy evaluation is used.
     
         _indicator_name (string): The name of the Technical Indicator.
                 
@@ -96,6 +156,8 @@ class TI(ABC):
   
         getSignal(): Abstract method for Technical Indicator signal calculation.
 
+        getSignals(): Returns the Technical Indicator signal for each date.
+
         getTiValue(): Returns the Technical Indicator value for a given date.
         
     Raises:
@@ -110,9 +172,18 @@ class TI(ABC):
         validateDataFrame(input_data)
         self._input_data = input_data
         
-        # Validate the type of the calculate indicator data and then store them
-        validateDataFrame(ti_data)
-        self._ti_data = ti_data
+        # Store the calculated indicator data, or the method which calculates 
+        # them on first access
+        if callable(ti_data):
+            self._calculate_ti_data = ti_data
+            self._calculated_ti_data = None
+        else:
+            validateDataFrame(ti_data)
+            self._calculate_ti_data = None
+            self._calculated_ti_data = ti_data
+
+        # Guards the lazy calculation against concurrent first accesses
+        self._calculation_lock = threading.Lock()
         
         self._indicator_name = indicator_name
         self._plotted_input_columns = plotted_input_columns
@@ -122,6 +193,98 @@ class TI(ABC):
         self._areas = areas
         self._subplots = subplots
     
+
+    @property
+    def _ti_data(self):
+        '''
+        The calculated values of the Technical Indicator. In case of lazy
+        evaluation, the values are calculated on the first access and cached.
+
+        Args:
+            -
+
+        Raises:
+            TypeError (Exception raised from the validateDataFrame called 
+                method)
+
+        Returns:
+            pandas dataframe: The calculated values of the Technical Indicator.
+        '''
+
+        if self._calculated_ti_data is None:
+
+            # Checked again under the lock, another thread may have calculated
+            # the values in the meantime
+            with self._calculation_lock:
+                if self._calculated_ti_data is None:
+                    self._setTiData(self._calculate_ti_data(self._input_data))
+
+        return self._calculated_ti_data
+
+
+    def __getstate__(self):
+        '''
+        Returns the state of the object for pickling, without the calculation
+        lock which cannot be pickled.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            dictionary: The attributes of the object.
+        '''
+
+        state = self.__dict__.copy()
+        del state['_calculation_lock']
+
+        return state
+
+
+    def __setstate__(self, state):
+        '''
+        Restores the state of the object after unpickling, with a new
+        calculation lock.
+
+        Args:
+            state (dictionary): The attributes of the object.
+
+        Raises:
+            -
+
+        Returns:
+            -
+        '''
+
+        self.__dict__.update(state)
+        self._calculation_lock = threading.Lock()
+
+
+    def _setTiData(self, ti_data):
+        '''
+        Validates and caches the calculated values of the Technical Indicator.
+        Used also by the calculation engine, which provides values calculated
+        from shared intermediate results.
+
+        Args:
+            ti_data (pandas dataframe): The calculated values of the Technical
+                Indicator.
+
+        Raises:
+            TypeError (Exception raised from the validateDataFrame called 
+                method)
+
+        Returns:
+            -
+        '''
+
+        # Validate the type of the calculated indicator data and then cache 
+        # them
+        validateDataFrame(ti_data)
+        self._calculated_ti_data = ti_data
+
         
     def getTiPlot(self):
         '''
@@ -135,7 +298,7 @@ class TI(ABC):
             -
             
         Returns:
-            matplotlib object: The generated plot.
+            matplotlib.figure.Figure: The generated plot.
         '''
             
         if self._subplots:
@@ -145,9 +308,16 @@ class TI(ABC):
             data = pd.concat([self._input_data[self._plotted_input_columns], 
                 self._ti_data], axis = 1)
         
+        # Areas given by column name are read from the indicator values
+        areas = None
+        if self._areas is not None:
+            areas = [{key: self._ti_data[value] if key in ['y1', 'y2'] and 
+                isinstance(value, str) else value for key, value in a.items()} 
+                for a in self._areas]
+
         return linesGraph(data = data, title = self._indicator_name, 
             y_label = self._y_label, lines_color = self._lines_color, 
-            alpha_values = self._alpha_values, areas = self._areas)
+            alpha_values = self._alpha_values, areas = areas)
 
 
     def getTiData(self):
@@ -186,8 +356,53 @@ class TI(ABC):
         '''
         
         pass
-        
-        
+
+
+    @abstractmethod
+    def _calculateSignals(self):
+        '''
+        Abstract method for the Technical Indicator signal calculation for each
+        date. The implemented method should return a numpy array with the 
+        signal value of each period of the input data, the one returned by the
+        getSignal method for the input data up to this period, calculated with
+        vectorized operations over all the periods.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            -
+        '''
+
+        pass
+
+
+    def getSignals(self):
+        '''
+        Returns the Technical Indicator signal for each date. The signal of a
+        date is the one returned by the getSignal method of the indicator
+        calculated for the input data up to this date. For the first dates,
+        which are less than the periods required by the indicator or by its
+        signal rules, the signal is 'Hold'.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            pandas.Series: The signal value of each date (see TRADE_SIGNALS 
+                package constant). Index is of type date.
+        '''
+
+        return pd.Series(index = self._input_data.index, data = 
+            self._calculateSignals(), name = 'Signal')
+
+
     def getTiValue(self, date = None):
         '''
         Returns the Technical Indicator value for a given date. If the date
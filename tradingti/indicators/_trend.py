@@ -18,12 +18,75 @@ Date last modified: 06.02.2020
 Python Version: 3.6
 '''
 
+import numpy as np
 import pandas as pd
 from .._constants import *
 from ._average_technical_indicator import AverageTI
-from ._technical_indicator import TI
+from ._technical_indicator import TI, _previousValues, _selectSignals
 from ..utils._data_validation import validateStockData
 from ..utils._data_preprocessing import fillMissingValues
+from ..utils._rolling_kernels import rollingMean
+
+
+def _exponentialMean(values, span):
+    '''
+    Calculates the exponential moving average of the values, with the pandas
+    ewm recurrence. The average is adjusted for the beginning periods, as with
+    adjust = True in pandas ewm. Several spans are calculated one after the
+    other, each span is one pass of the compiled recurrence and a recurrence
+    advancing several spans together in numpy is slower.
+
+    Args:
+        values (numpy array): The input values, sorted on date. Two dimensional
+            for panel values, with one column per symbol.
+
+        span (int): The span period from which the decay is calculated.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: The exponential moving average, of the same shape as the
+            values.
+    '''
+
+    values = pd.DataFrame(values, dtype = np.float64, copy = False) if \
+        np.ndim(values) == 2 else pd.Series(values, dtype = np.float64, 
+        copy = False)
+
+    return values.ewm(span = span, min_periods = 0, adjust = True).mean(
+        ).values
+
+
+def _movingAverageConvergenceDivergence(ema_12, ema_26):
+    '''
+    Calculates the MACD line and the signal line from the 12 and 26 periods 
+    exponential moving averages.
+
+    Args:
+        ema_12 (numpy array): The 12 periods EMA of the prices, sorted on date.
+            Two dimensional for panel prices, with one column per symbol.
+
+        ema_26 (numpy array): The 26 periods EMA of the prices, sorted on date.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: Array of shape (len(ema_12), 2), or (len(ema_12), 2, 
+            symbols) for panel prices, holding the 'MACD' and the 'Signal Line'
+            values.
+    '''
+
+    macd = np.zeros((len(ema_12), 2) + ema_12.shape[1:], dtype = np.float64)
+
+    # MACD line is the difference of the 12 and 26 periods EMA
+    macd[:, 0] = ema_12 - ema_26
+
+    # Signal line is the 9 periods EMA of the MACD line
+    macd[:, 1] = _exponentialMean(macd[:, 0], span = 9)
+
+    return macd
 
 
 class SMA(AverageTI):
@@ -37,9 +100,10 @@ class SMA(AverageTI):
                 
         sma_periods (object): The sma periods for which the rolling mean of the
             input data should be calculated. Is a list of integers, with one 
-            (representing the long term SMA) or two (representing the short term
-            and the long term SMA) members at most. Default values are [50, 200]
-            50 for the short term and 200 for the long term.
+            (representing the long term SMA) or more members. When more than 
+            one is given, the largest one represents the long term SMA and the
+            smallest one the short term SMA. Default values are [50, 200] 50 
+            for the short term and 200 for the long term.
             
     Attributes:
         _sma_periods (object): The sma periods for which the rolling mean of the
@@ -57,14 +121,9 @@ class SMA(AverageTI):
 
         self._sma_periods = sma_periods
         
-        if len(sma_periods) == 1:
-            lines_color = ['black', 'cornflowerblue']
-        else:
-            lines_color = ['black', 'cornflowerblue', 'tomato']
-        
         super().__init__(df_data = df_data, calculate_MA = 
             self._calculateIndicator, indicator_name = 'SMA-' + \
-            str(sma_periods), lines_color = lines_color, periods = sma_periods)
+            str(sma_periods), lines_color = None, periods = sma_periods)
         
     
     def _calculateIndicator(self, input_data):
@@ -80,20 +139,14 @@ class SMA(AverageTI):
 
         Returns:
             pandas dataframe: The calculated values of the Technical
-                indicator. Index is of type date. It contains one or two
-                columns depending the requested sma periods.
+                indicator. Index is of type date. It contains one column for
+                each requested sma period.
         '''
     
-        sma = pd.DataFrame(index = input_data.index)
-
-        # Calculate SMA for each requested rolling window (concat results to a 
-        # single dataframe)
-        for sma_period in self._sma_periods:
-            sma = pd.concat([sma, input_data.rolling(window = sma_period, 
-                min_periods = 1, center = False, win_type = None, on = None, 
-                axis = 0, closed = None).mean()], axis = 1)
-        
-        sma.columns = ['SMA-' + str(x) for x in self._sma_periods]
+        # Rolling mean for all the requested windows, computed together
+        sma = pd.DataFrame(index = input_data.index, data = rollingMean(
+            input_data['Adj Close'].values, windows = self._sma_periods), 
+            columns = ['SMA-' + str(x) for x in self._sma_periods])
             
         return sma
 
@@ -109,9 +162,10 @@ class EMA(AverageTI):
                 
         span_periods (object): The span periods from which the decay is 
             calculated. Is a list of integers, with one (representing the long 
-            term EMA) or two (representing the short term and the long term EMA)
-            members at most. Default values are [26, 200], 26 for the short term
-            and 200 for the long term.
+            term EMA) or more members. When more than one is given, the largest
+            one represents the long term EMA and the smallest one the short term
+            EMA. Default values are [26, 200], 26 for the short term and 200 for
+            the long term.
 
     Attributes:
         _span_periods (object): The span periods from which the decay is 
@@ -129,15 +183,9 @@ class EMA(AverageTI):
         
         self._span_periods = span_periods
 
-        if len(span_periods) == 1:
-            lines_color = ['black', 'cornflowerblue']
-        else:
-            lines_color = ['black', 'cornflowerblue', 'tomato']
-        
         super().__init__(df_data = df_data, calculate_MA = 
             self._calculateIndicator, indicator_name = 'EMA-' + \
-            str(span_periods), lines_color = lines_color, periods = 
-            span_periods)
+            str(span_periods), lines_color = None, periods = span_periods)
         
     
     def _calculateIndicator(self, input_data):
@@ -153,19 +201,15 @@ class EMA(AverageTI):
 
         Returns:
             pandas dataframe: The calculated values of the Technical
-                indicator. Index is of type date. It contains one or two
-                columns depending the requested ema periods.
+                indicator. Index is of type date. It contains one column for
+                each requested ema period.
         '''
     
-        ema = pd.DataFrame(index = input_data.index)
-        
-        # Calculate EMA for each requested span period (concat results to a 
-        # single dataframe)
-        for span_period in self._span_periods:
-            ema = pd.concat([ema, input_data.ewm(span = span_period,
-                min_periods = 0, adjust = True, axis = 0).mean()], axis = 1)
-        
-        ema.columns = ['EMA-' + str(x) for x in self._span_periods]
+        # Exponential moving average for each requested span, one column each
+        ema = pd.DataFrame(index = input_data.index, data = np.column_stack([
+            _exponentialMean(input_data['Adj Close'].values, span = x) for x in
+            self._span_periods]), columns = ['EMA-' + str(x) for x in 
+            self._span_periods])
             
         return ema
         
@@ -198,10 +242,16 @@ class MACD(TI):
         input_data = validateStockData(data = df_data, required_columns = 
             ['Adj Close'], indicator_name = 'MACD')
 
+        # The long term EMA requires at least 26 periods
+        if len(input_data.index) < 26:
+            raise(ValueError('The input data should contain at least 26 ' +\
+                'periods for the MACD calculation, but it contains ' +\
+                str(len(input_data.index)) + '.'))
+
         # Parent class constructor (all job is done here, parent class provides 
         # the public interface for accessing the data of the indicator)    
         super().__init__(input_data = input_data, 
-            ti_data = self._calculateIndicator(input_data),
+            ti_data = self._calculateIndicator,
             indicator_name = 'MACD', plotted_input_columns = ['Adj Close'], 
             y_label = 'MACD | Price', lines_color = ['black', 'cornflowerblue', 
             'tomato'], subplots = True)
@@ -224,20 +274,14 @@ class MACD(TI):
                 'MACD' and the 'Signal Line'.
         '''
         
-        EMA_26 = EMA(input_data, span_periods = [26]).getTiData()
-        EMA_26.columns = ['EMA']
-        
-        EMA_12 = EMA(input_data, span_periods = [12]).getTiData()
-        EMA_12.columns = ['EMA']
-        
-        macd = EMA_12.subtract(EMA_26)
-        macd.columns = ['Adj Close'] # For calling EMA below
-        
-        signal_line = EMA(macd, span_periods = [9]).getTiData()
+        # MACD line is calculated from the 12 and 26 periods EMA
+        macd = _movingAverageConvergenceDivergence(ema_12 = _exponentialMean(
+            input_data['Adj Close'].values, span = 12), ema_26 = 
+            _exponentialMean(input_data['Adj Close'].values, span = 26))
         
         # Indicator holds the MACD and the Signal Line data
-        macd = pd.concat([macd, signal_line], axis = 1)
-        macd.columns = ['MACD', 'Signal Line']
+        macd = pd.DataFrame(index = input_data.index, data = macd, 
+            columns = ['MACD', 'Signal Line'])
         
         return macd  
         
@@ -298,7 +342,140 @@ class MACD(TI):
         
         return (list(TRADE_SIGNALS.keys())[list(TRADE_SIGNALS.values()).
             index(signal)], signal)
-  
+
+
+    def _calculateSignals(self):
+        '''
+        Calculates the signal of the technical indicator for each date, see the
+        getSignal method. The signal votes are counted for all the dates
+        together.
+    
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The signal value of each date.
+        '''
+
+        macd = self._ti_data['MACD'].values
+        signal_line = self._ti_data['Signal Line'].values
+
+        previous_macd = _previousValues(macd)
+        previous_signal_line = _previousValues(signal_line)
+
+        # Each condition of the getSignal method gives one vote
+        votes = [
+            # MACD crossing above zero / below zero
+            ((previous_macd < 0.) & (macd > 0.), TRADE_SIGNALS['Buy']),
+            ((previous_macd > 0.) & (macd < 0.), TRADE_SIGNALS['Sell']),
+            # MACD turns up from below zero / down from above zero
+            ((previous_macd < macd) & (macd < 0.), TRADE_SIGNALS['Buy']),
+            ((previous_macd > macd) & (macd > 0.), TRADE_SIGNALS['Sell']),
+            # MACD line crosses above / below the signal line
+            ((previous_macd < previous_signal_line) & (macd > signal_line), 
+                TRADE_SIGNALS['Buy']),
+            ((previous_macd > previous_signal_line) & (macd < signal_line), 
+                TRADE_SIGNALS['Sell'])]
+
+        signals = sum(np.where(condition, vote, 0) for condition, vote in votes)
+
+        # Signal voting
+        return _selectSignals([(signals <= -1, TRADE_SIGNALS['Buy']), 
+            (signals >= 1, TRADE_SIGNALS['Sell'])], periods = 26)
+
+
+def _directionalMovement(high, low, close):
+    '''
+    Calculates the normalized smoothed directional movement (DMI+, DMI-) and the
+    directional movement index (DX) for already validated input data. Shared by
+    the DMI and the ADX technical indicators.
+
+    Args:
+        high (numpy array): The `High` prices, sorted on date.
+
+        low (numpy array): The `Low` prices, sorted on date.
+
+        close (numpy array): The `Close` prices, sorted on date.
+
+        For panel prices the arrays are two dimensional, with one column per
+        symbol, and the recurrence runs for all the symbols together.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: Array of shape (len(close), 3), or (len(close), 3, 
+            symbols) for panel prices, holding the 'DMI+', 'DMI-' and 'DX' 
+            values. The first 5 periods are NaN.
+    '''
+
+    periods = len(close)
+
+    # True range of each period (not defined for the first period)
+    true_range = np.full(close.shape, np.nan, dtype = np.float64)
+    true_range[1:] = np.maximum(high[1:] - low[1:], np.maximum(
+        np.abs(high[1:] - close[:-1]), np.abs(low[1:] - close[:-1])))
+
+    # Directional moves of each period (zero for the first period)
+    up_move = high[1:] - high[:-1]
+    down_move = low[:-1] - low[1:]
+
+    di_plus = np.zeros(close.shape, dtype = np.float64)
+    di_plus[1:] = np.where(up_move > down_move, up_move, 0.0)
+
+    di_minus = np.zeros(close.shape, dtype = np.float64)
+    di_minus[1:] = np.where(up_move < down_move, down_move, 0.0)
+
+    # Smoothed directional moves and true range. The first value is the sum
+    # of the first 5 periods, the next ones follow the recurrence 
+    # S(i) = S(i-1) - S(i-1)/5 + X(i), which is the compiled pandas ewm 
+    # recurrence (adjust = False) with alpha = 1/5 and the inputs 5*X(i)
+    dmi = np.full((periods, 3) + close.shape[1:], np.nan, dtype = np.float64)
+    smoothed_true_range = np.full(close.shape, np.nan, dtype = np.float64)
+
+    if periods > 5:
+        moves = 5.*np.stack([di_plus[5:], di_minus[5:], true_range[5:]],
+            axis = 1)
+        moves[0] = np.sum(np.stack([di_plus[1:5], di_minus[1:5],
+            true_range[1:5]], axis = 1), axis = 0)
+
+        smoothed = pd.DataFrame(moves.reshape(len(moves), -1)).ewm(alpha = 
+            0.2, adjust = False).mean().values.reshape(moves.shape)
+
+        dmi[5:, :2] = smoothed[:, :2]
+        smoothed_true_range[5:] = smoothed[:, 2]
+
+    # Normalize the smoothed directional moves and calculate the DX
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        dmi[:, 0] = 100*dmi[:, 0]/smoothed_true_range
+        dmi[:, 1] = 100*dmi[:, 1]/smoothed_true_range
+        dmi[:, 2] = 100*(np.abs(dmi[:, 0] - dmi[:, 1]))/(dmi[:, 0] + 
+            dmi[:, 1])
+
+    return dmi
+
+
+def _averageDirectionalIndex(dx):
+    '''
+    Calculates the average directional movement index (ADX) from the 
+    directional movement index (DX) values.
+
+    Args:
+        dx (numpy array): The DX values, as returned in the third column by the
+            _directionalMovement function.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: The ADX values.
+    '''
+
+    return rollingMean(dx, windows = [5])[:, 0]
+
 
 class DMI(TI):
     '''
@@ -309,9 +486,14 @@ class DMI(TI):
         df_data (pandas dataframe): The input data to the Technical Indicator.
             Index is of type date. The indicator requires the following stock
             data: 'High', 'Low', 'Close', 'Adj Close'
+
+        adx (boolean): If True, the Average Directional Movement Index (ADX) is
+            calculated in the same pass and added as a fourth column 'ADX'. 
+            Default value is False.
     
     Attributes:
-        -
+        _adx (boolean): Indicates if the ADX is included in the calculated 
+            values of the indicator.
                                 
     Methods:
         -
@@ -321,21 +503,28 @@ class DMI(TI):
         ValueError (Raised from validateStockData method)
         
     '''
-    def __init__(self, df_data):
+    def __init__(self, df_data, adx = False):
         
         # Validate and tranform the input data, check tradingti.utils.
         # _data_validation module for more details
         input_data = validateStockData(data = df_data, required_columns = 
             ['High', 'Low', 'Close', 'Adj Close'], indicator_name = 'DMI')
 
+        # Validate the adx argument
+        if not isinstance(adx, bool):
+            raise TypeError('The argument adx should be a `bool` but it is ' +\
+                'of type `' + str(type(adx)) + '`.')
+
+        self._adx = adx
+
         # Parent class constructor (all job is done here, parent class provides 
         # the public interface for accessing the data of the indicator)    
         super().__init__(input_data = input_data, 
-            ti_data = self._calculateIndicator(input_data),
+            ti_data = self._calculateIndicator,
             indicator_name = 'DMI', plotted_input_columns = ['Adj Close'], 
             y_label = 'DMI | Price', lines_color = ['black', 'limegreen', 'red',
-            'cornflowerblue'], alpha_values = [1.0, 1.0, 1.0, 0.2], 
-            subplots = True)
+            'cornflowerblue', 'orange'], alpha_values = [1.0, 1.0, 1.0, 0.2, 
+            1.0], subplots = True)
 
         
     def _calculateIndicator(self, input_data):
@@ -352,49 +541,19 @@ class DMI(TI):
         Returns:
             pandas dataframe: The calculated values of the Technical
                 indicator. Index is of type date. It contains three columns, the
-                'DMI+', 'DMI-' and the 'DX'.
+                'DMI+', 'DMI-' and the 'DX', and the 'ADX' column when requested.
         '''
         
-        dmi = pd.DataFrame(index = input_data.index, columns = ['DI+', 'DI-', 
-            'DMI+', 'DMI-', 'True Range', 'Smoothed True Range', 'DX'], 
-            data = None)
-        
-        dmi.iloc[0,0:2] = 0.0
-        for i in range(1, len(input_data.index)):
-            
-            dmi.iat[i,4] =  max(input_data.iat[i,0] - input_data.iat[i,1],
-                abs(input_data.iat[i,0] - input_data.iat[i-1, 2]),
-                abs(input_data.iat[i,1] - input_data.iat[i-1, 2]))
-                
-            if input_data.iat[i,0] - input_data.iat[i-1,0] > \
-                input_data.iat[i-1,1] - input_data.iat[i,1]:
-                dmi.iat[i,0] = input_data.iat[i,0] - input_data.iat[i-1,0]
-            else:
-                dmi.iat[i,0] = 0.0
-            
-            if input_data.iat[i,0] - input_data.iat[i-1,0] < \
-                input_data.iat[i-1,1] - input_data.iat[i,1]:
-                dmi.iat[i,1] = input_data.iat[i-1,1] - input_data.iat[i,1]
-            else:
-                dmi.iat[i,1] = 0.0
-                
-            if i == 5:
-                dmi.iat[i,2] = dmi.iloc[i-5:i,0].sum()
-                dmi.iat[i,3] = dmi.iloc[i-5:i,1].sum()
-                dmi.iat[i,5] = dmi.iloc[i-5:i,4].sum()
-            elif i > 5:
-                dmi.iat[i,2] = dmi.iat[i-1,2] - dmi.iat[i-1,2]/5. + dmi.iat[i,0]
-                dmi.iat[i,3] = dmi.iat[i-1,3] - dmi.iat[i-1,3]/5. + dmi.iat[i,1]
-                dmi.iat[i,5] = dmi.iat[i-1,5] - dmi.iat[i-1,5]/5. + dmi.iat[i,4]
-                
-        for i in range(5, len(input_data.index)):
-            dmi.iat[i,2] = 100*dmi.iat[i,2]/dmi.iat[i,5]
-            dmi.iat[i,3] = 100*dmi.iat[i,3]/dmi.iat[i,5]
-            dmi.iat[i,6] = 100*(abs(dmi.iat[i,2] - dmi.iat[i,3]))/(dmi.iat[i,2] 
-                + dmi.iat[i,3])
-        
-        return dmi.drop(columns = ['DI+', 'DI-', 'True Range', 
-            'Smoothed True Range'])
+        dmi = _directionalMovement(high = input_data['High'].values, 
+            low = input_data['Low'].values, close = input_data['Close'].values)
+
+        if not self._adx:
+            return pd.DataFrame(index = input_data.index, data = dmi, 
+                columns = ['DMI+', 'DMI-', 'DX'])
+
+        return pd.DataFrame(index = input_data.index, data = np.column_stack(
+            [dmi, _averageDirectionalIndex(dmi[:, 2])]), columns = ['DMI+', 
+            'DMI-', 'DX', 'ADX'])
                   
         
     def getSignal(self):
@@ -427,6 +586,35 @@ class DMI(TI):
             return ('Hold', TRADE_SIGNALS['Hold'])
 
 
+    def _calculateSignals(self):
+        '''
+        Calculates the signal of the technical indicator for each date, see the
+        getSignal method.
+    
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The signal value of each date.
+        '''
+
+        dmi_plus = self._ti_data['DMI+'].values
+        dmi_minus = self._ti_data['DMI-'].values
+
+        previous_dmi_plus = _previousValues(dmi_plus)
+        previous_dmi_minus = _previousValues(dmi_minus)
+
+        # DMI- crosses above DMI+, DMI+ crosses above DMI-
+        return _selectSignals([
+            ((previous_dmi_plus > previous_dmi_minus) & (dmi_plus < dmi_minus),
+                TRADE_SIGNALS['Sell']),
+            ((previous_dmi_plus < previous_dmi_minus) & (dmi_plus > dmi_minus),
+                TRADE_SIGNALS['Buy'])], periods = 2)
+
+
 class ADX(TI):
     '''
     Average Directional Movement Index (ADX) Technical Indicator class 
@@ -458,7 +646,7 @@ class ADX(TI):
         # Parent class constructor (all job is done here, parent class provides 
         # the public interface for accessing the data of the indicator)    
         super().__init__(input_data = input_data, 
-            ti_data = self._calculateIndicator(input_data),
+            ti_data = self._calculateIndicator,
             indicator_name = 'ADX', plotted_input_columns = ['Adj Close'], 
             y_label = 'ADX | Price', lines_color = ['black', 'cornflowerblue'],
             subplots = True)
@@ -481,13 +669,13 @@ class ADX(TI):
                 'ADX'.
         '''
         
-        adx = DMI(input_data).getTiData()['DX'].to_frame().rolling(window = 5, 
-            min_periods = 1, center = False, win_type = None, on = None, 
-            axis = 0, closed = None).mean()
-        
-        adx.columns = ['ADX']
+        # Input data are already validated, the directional movement is 
+        # calculated directly on them
+        dmi = _directionalMovement(high = input_data['High'].values, 
+            low = input_data['Low'].values, close = input_data['Close'].values)
         
-        return adx
+        return pd.DataFrame(index = input_data.index, 
+            data = _averageDirectionalIndex(dmi[:, 2]), columns = ['ADX'])
         
         
     def getSignal(self):
@@ -520,3 +708,32 @@ class ADX(TI):
             
         else:
             return ('Hold', TRADE_SIGNALS['Hold'])
+
+
+    def _calculateSignals(self):
+        '''
+        Calculates the signal of the technical indicator for each date, see the
+        getSignal method.
+    
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The signal value of each date.
+        '''
+
+        prices = self._input_data.iloc[:, 0].values
+        strong_trend = self._ti_data['ADX'].values > 25
+
+        previous_prices = _previousValues(prices)
+        older_prices = _previousValues(prices, periods = 2)
+
+        # Price drops and strong trend, price raises and strong trend
+        return _selectSignals([
+            ((older_prices > previous_prices) & (previous_prices > prices) &
+                strong_trend, TRADE_SIGNALS['Sell']),
+            ((older_prices < previous_prices) & (previous_prices < prices) &
+                strong_trend, TRADE_SIGNALS['Buy'])], periods = 3)
@@ -15,14 +15,71 @@ Date last modified: 01.02.2020
 Python Version: 3.6
 '''
 
+import numpy as np
 import pandas as pd
-from ._technical_indicator import TI
-from ._trend import SMA
+from ._technical_indicator import TI, _selectSignals
 from ..utils._data_validation import validateStockData
 from ..utils._data_preprocessing import fillMissingValues
+from ..utils._rolling_kernels import rollingMean, rollingMeanStd
 from .._constants import *
 
 
+# Rolling window and bands distance (in standard deviations) of each BB term
+_BB_TERMS = {'short': (10, 1.5), 'medium': (20, 2.), 'long': (50, 2.5)}
+
+
+def _bollingerBands(rolling_mean, rolling_std, deviations):
+    '''
+    Calculates the Bollinger Bands from the rolling mean and the rolling 
+    standard deviation of the prices.
+
+    Args:
+        rolling_mean (numpy array): The rolling mean of the prices for the term
+            window.
+
+        rolling_std (numpy array): The rolling standard deviation of the prices
+            for the term window.
+
+        deviations (float): The distance of the bands from the mean, in 
+            standard deviations.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: Array of shape (len(rolling_mean), 3), or 
+            (len(rolling_mean), 3, symbols) for panel prices, with the 'SMA', 
+            the 'Upper Band' and the 'Lower Band'.
+    '''
+
+    return np.stack([rolling_mean, rolling_mean + deviations*rolling_std,
+        rolling_mean - deviations*rolling_std], axis = 1)
+
+
+def _standardDeviation(rolling_std, periods):
+    '''
+    Calculates the standard deviation indicator values from the rolling 
+    standard deviation of the prices. Periods without a full window are NaN.
+
+    Args:
+        rolling_std (numpy array): The rolling standard deviation of the prices
+            for the periods window.
+
+        periods (int): The rolling window.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: The 'SD' values.
+    '''
+
+    sd = rolling_std.copy()
+    sd[:periods-1] = np.nan
+
+    return sd
+
+
 class BB(TI):
     '''
     Bollinger Bands (BB) Technical Indicator class implementation.
@@ -40,10 +97,16 @@ class BB(TI):
                 deviations. (1.5 times the standard dev. +/- the SMA)
             - Medium term: 20 day moving average, bands at 2 standard deviations
             - Long term: 50 day moving average, bands at 2.5 standard deviations
+
+            The standard deviation is calculated on the same rolling window as 
+            the moving average.
             
     Attributes:
-        _term (string): The term type for which the indicator should be
+        _term_type (string): The term type for which the indicator should be
             calculated.
+
+        _term (tuple): The rolling window and the bands distance (in standard
+            deviations) of the term type.
                                 
     Methods:
         -
@@ -66,13 +129,19 @@ class BB(TI):
                 'It should be one of the following: \'short\', \'medium\', '+\
                 '\'long\'. Value given is \'' + str(term) + '\'.'))
 
-        self._term = {'short': (10, 1.5), 'medium': (20, 2.), 
-            'long': (50, 2.5)}[term]
+        self._term_type = term
+        self._term = _BB_TERMS[term]
+
+        # Validate that the rolling window of the term fits in the input data
+        if len(input_data.index) < self._term[0]:
+            raise(ValueError('The input data should contain at least ' +\
+                str(self._term[0]) + ' periods for the \'' + str(term) +\
+                '\' term, but it contains ' + str(len(input_data.index)) + '.'))
             
         # Parent class constructor (all job is done here, parent class provides 
         # the public interface for accessing the data of the indicator)    
         super().__init__(input_data = input_data, 
-            ti_data = self._calculateIndicator(input_data),
+            ti_data = self._calculateIndicator,
             indicator_name = 'BB (sma = ' + str(self._term[0]) + ', std = ' + \
             str(self._term[1]) + ')', plotted_input_columns = ['Adj Close'], 
             y_label = 'Price', lines_color = ['black', 'cornflowerblue', 
@@ -96,21 +165,16 @@ class BB(TI):
                 'SMA', the 'Upper Band' and the 'Lower Band'.
         '''
         
-        # Calculate Simple Moving Average
-        sma = SMA(input_data, sma_periods = [self._term[0]]).getTiData()
-        sma.columns = ['SMA']
-        
-        # Calculate Standard Deviation
-        std = input_data.std(axis = 0).values[0]
-        
-        upper_band = sma + self._term[1]*std
-        upper_band.columns = ['Upper Band']
-        
-        lower_band = sma - self._term[1]*std
-        lower_band.columns = ['Lower Band']
+        # Rolling mean and rolling standard deviation, from the same block
+        # running sums and sums of squares (the three term windows have the same
+        # block length, calculateIndicators gets them from one block pass)
+        rolling_mean, rolling_std = rollingMeanStd(
+            input_data['Adj Close'].values, windows = [self._term[0]])
+        bb = _bollingerBands(rolling_mean = rolling_mean[:, 0], 
+            rolling_std = rolling_std[:, 0], deviations = self._term[1])
         
-        # Indicator holds the MACD and the Signal Line data
-        bb = pd.concat([sma, upper_band, lower_band], axis = 1)
+        bb = pd.DataFrame(index = input_data.index, data = bb, 
+            columns = ['SMA', 'Upper Band', 'Lower Band'])
         
         return bb  
         
@@ -143,6 +207,30 @@ class BB(TI):
             return ('Hold', TRADE_SIGNALS['Hold'])
 
 
+    def _calculateSignals(self):
+        '''
+        Calculates the signal of the technical indicator for each date, see the
+        getSignal method.
+    
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The signal value of each date.
+        '''
+
+        prices = self._input_data.iloc[:, 0].values
+
+        # Price goes above upper band, price goes below lower band
+        return _selectSignals([
+            (prices > self._ti_data['Upper Band'].values, TRADE_SIGNALS['Sell']),
+            (prices < self._ti_data['Lower Band'].values, TRADE_SIGNALS['Buy'])],
+            periods = self._term[0])
+
+
 class SD(TI):
     '''
     Standard Deviation (SD) Technical Indicator class implementation.
@@ -176,9 +264,9 @@ class SD(TI):
 
         # Validate that periods is positive integer less than the number of the
         # input periods found in the dataframe.
-        if type(periods) != int or periods <= 0 or periods > len(df_data.index):
+        if type(periods) != int or periods <= 0 or periods > len(input_data.index):
             raise(ValueError('Not allowed value for the \'periods\' argument.'+\
-                ' It should be integer > 0 and < ' + str(len(df_data.index))  +\
+                ' It should be integer > 0 and < ' + str(len(input_data.index))  +\
                 '. Value given is ' + str(periods) + '.'))
 
         self._periods = periods
@@ -186,7 +274,7 @@ class SD(TI):
         # Parent class constructor (all job is done here, parent class provides 
         # the public interface for accessing the data of the indicator)    
         super().__init__(input_data = input_data, 
-            ti_data = self._calculateIndicator(input_data),
+            ti_data = self._calculateIndicator,
             indicator_name = 'SD-' +  str(periods), plotted_input_columns = 
             ['Adj Close'], y_label = 'SD | Price', lines_color = ['black', 
             'cornflowerblue'], subplots = True)
@@ -209,12 +297,34 @@ class SD(TI):
                 'SD'.
         '''
 
-        sd = input_data.rolling(self._periods).std()
-        sd.columns = ['SD']
+        sd = pd.DataFrame(index = input_data.index, data = _standardDeviation(
+            rolling_std = rollingMeanStd(input_data['Adj Close'].values, 
+            windows = [self._periods])[1][:, 0], periods = self._periods), 
+            columns = ['SD'])
 
         return sd
         
         
+    def _averagePrices(self):
+        '''
+        Calculates the average price of the last periods of each date, to which
+        the price is compared by the signal rules.
+    
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The average price of each date, NaN for the first
+                periods - 1 dates.
+        '''
+
+        return rollingMean(self._input_data['Adj Close'].values, windows = 
+            [self._periods], min_periods = None)[:, 0]
+
+
     def getSignal(self):
         '''
         Calculates and returns the signal of the technical indicator.
@@ -231,16 +341,42 @@ class SD(TI):
             constant.
         '''
         
-        sma = SMA(self._input_data, sma_periods = [self._periods])
+        # Average price of the last periods
+        sma = self._averagePrices()[-1]
         
         # Price above average and volatility is high
-        if self._input_data.iat[-1,0] > sma.getTiValue(self._input_data.index[-1]) and \
-            self._ti_data.iat[-1,0] > 3:
+        if self._input_data.iat[-1,0] > sma and self._ti_data.iat[-1,0] > 3:
             return ('Sell', TRADE_SIGNALS['Sell'])
             
         # Price below average and volatility is high
-        if self._input_data.iat[-1,0] < sma.getTiValue(self._input_data.index[-1]) and \
-            self._ti_data.iat[-1,0] > 3:
+        if self._input_data.iat[-1,0] < sma and self._ti_data.iat[-1,0] > 3:
             return ('Buy', TRADE_SIGNALS['Buy'])
         
         return ('Hold', TRADE_SIGNALS['Hold'])
+
+
+    def _calculateSignals(self):
+        '''
+        Calculates the signal of the technical indicator for each date, see the
+        getSignal method.
+    
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The signal value of each date.
+        '''
+
+        prices = self._input_data.iloc[:, 0].values
+        sma = self._averagePrices()
+        high_volatility = self._ti_data['SD'].values > 3
+
+        # Price above average and volatility is high, price below average and
+        # volatility is high
+        return _selectSignals([
+            ((prices > sma) & high_volatility, TRADE_SIGNALS['Sell']),
+            ((prices < sma) & high_volatility, TRADE_SIGNALS['Buy'])], 
+            periods = self._periods)
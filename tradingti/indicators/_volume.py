@@ -14,13 +14,46 @@ Date last modified: 06.02.2020
 Python Version: 3.6
 '''
 
+import numpy as np
 import pandas as pd
-from ._technical_indicator import TI
+from ._technical_indicator import TI, _previousValues, _selectSignals
 from .._constants import *
 from ..utils._data_validation import validateStockData
 from ..utils._data_preprocessing import fillMissingValues
 
 
+def _onBalanceVolume(close, volume):
+    '''
+    Calculates the on balance volume from the close prices and the volume.
+
+    Args:
+        close (numpy array): The `Adj Close` prices, sorted on date. Two 
+            dimensional for panel prices, with one column per symbol.
+
+        volume (numpy array): The `Volume`, of the same shape as the prices.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: The 'OBV' values, of the same shape as the prices. The 
+            values are integral when the volume is integral.
+    '''
+
+    # OBV is kept integral when the volume is integral
+    if np.issubdtype(volume.dtype, np.integer):
+        obv = np.zeros(close.shape, dtype = np.int64)
+    else:
+        obv = np.zeros(close.shape, dtype = np.float64)
+
+    # Volume is added when today's close is greater than yesterday's close,
+    # subtracted when it is less and ignored when it is equal
+    close_direction = np.sign(np.diff(close, axis = 0))
+    obv[1:] = np.cumsum(close_direction.astype(obv.dtype)*volume[1:], axis = 0)
+
+    return obv
+
+
 class OBV(TI):
     '''
     On Balance Volume (OBV) Technical Indicator class implementation.
@@ -51,7 +84,7 @@ class OBV(TI):
         # Parent class constructor (all job is done here, parent class provides 
         # the public interface for accessing the data of the indicator)    
         super().__init__(input_data = input_data, 
-            ti_data = self._calculateIndicator(input_data),
+            ti_data = self._calculateIndicator,
             indicator_name = 'OBV', plotted_input_columns = ['Adj Close'], 
             y_label = 'Volume | Price', lines_color = ['black', 'limegreen'], 
             subplots = True)
@@ -74,23 +107,11 @@ class OBV(TI):
                 'OBV'.
         '''
         
-        obv = pd.DataFrame(index = input_data.index, columns = ['OBV'], 
-            data = None)
-        
-        obv.iat[0, 0] = 0.0
-        for i in range(1, len(input_data.index)):
-
-            # Today's close is greater than yesterday's close
-            if input_data.iat[i, 1] > input_data.iat[i-1, 1]:
-                obv.iat[i, 0] = obv.iat[i-1, 0] + input_data.iat[i, 0]
-                
-            # Today's close is less than yesterday's close
-            elif input_data.iat[i, 1] < input_data.iat[i-1, 1]:
-                obv.iat[i, 0] = obv.iat[i-1, 0] - input_data.iat[i, 0]
-                
-            # Today's close is equal than yesterday's close
-            elif input_data.iat[i, 1] == input_data.iat[i-1, 1]:
-                obv.iat[i, 0] = obv.iat[i-1, 0]
+        obv = _onBalanceVolume(close = input_data['Adj Close'].values, 
+            volume = input_data['Volume'].values)
+
+        obv = pd.DataFrame(index = input_data.index, data = obv, 
+            columns = ['OBV'])
             
         return obv
         
@@ -120,4 +141,31 @@ class OBV(TI):
             return ('Buy', TRADE_SIGNALS['Buy'])
             
         else:
-            return ('Hold', TRADE_SIGNALS['Hold'])
\ No newline at end of file
+            return ('Hold', TRADE_SIGNALS['Hold'])
+
+
+    def _calculateSignals(self):
+        '''
+        Calculates the signal of the technical indicator for each date, see the
+        getSignal method.
+    
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The signal value of each date.
+        '''
+
+        obv = self._ti_data['OBV'].values
+
+        previous_obv = _previousValues(obv)
+        older_obv = _previousValues(obv, periods = 2)
+
+        return _selectSignals([
+            ((older_obv > previous_obv) & (previous_obv > obv), 
+                TRADE_SIGNALS['Sell']),
+            ((older_obv < previous_obv) & (previous_obv < obv), 
+                TRADE_SIGNALS['Buy'])], periods = 3)
@@ -0,0 +1,23 @@
+'''
+File name: __init__.py
+    Trading Technical Indicators open source library, in python.
+    `tradingti.streaming` package.
+           
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+from ._trend import SMA, EMA, MACD, ADX, DMI
+from ._momentum import FSO, SSO, RSI, IC
+from ._volatility import BB, SD
+from ._volume import OBV
+from ._pipeline import streamIndicator
+
+__all__ = ['SMA', 'EMA', 'MACD', 'ADX', 'DMI', 'FSO', 'SSO', 'RSI', 'IC', 'BB',
+    'SD', 'OBV', 'streamIndicator', 'panel']
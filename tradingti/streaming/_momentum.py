@@ -0,0 +1,562 @@
+'''
+File name: _momentum.py
+    Momentum streaming technical indicators implementation.
+    Implements the following streaming technical indicators:
+    - Fast Stochastic Oscillator (FSO class)
+    - Slow Stochastic Oscillator (SSO class)
+    - Relative Strength Index (RSI class)
+    - Ichimoku Cloud (IC class)
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+import math
+from collections import deque
+from ._streaming_indicator import StreamingTI, _divide
+from ._rolling_windows import _RollingExtremum, _RollingMoments
+from .._constants import *
+
+
+def _roundValue(value, decimals):
+    '''
+    Rounds a float as numpy does (round half to even of the value scaled by
+    10**decimals), so the rounded values are the same as the ones calculated
+    for the whole history.
+
+    Args:
+        value (float): The value to be rounded.
+
+        decimals (int): The number of decimals.
+
+    Raises:
+        -
+
+    Returns:
+        float: The rounded value, infinity and NaN are returned unchanged.
+    '''
+
+    if math.isinf(value) or value != value:
+        return value
+
+    factor = 10.**decimals
+
+    return round(value*factor)/factor
+
+
+def _stochasticSignal(rows):
+    '''
+    Calculates the signal of a stochastic oscillator from its two most recent
+    bars, with the rules of the getSignal method of the FSO and SSO classes.
+
+    Args:
+        rows (deque of lists): The '%K' and '%D' values of the two most recent
+            bars.
+
+    Raises:
+        -
+
+    Returns:
+        integer: The signal value, see TRADE_SIGNALS package constant.
+    '''
+
+    (previous_k, _), (k, d) = rows
+
+    # A sell signal is given when the oscillator is above the 80 level and
+    # then crosses back below 80.
+    if previous_k > 80. and k < 80.:
+        return TRADE_SIGNALS['Sell']
+
+    # A buy signal is given when the oscillator is below 20 and then crosses
+    # back above 20.
+    if previous_k < 20. and k > 20.:
+        return TRADE_SIGNALS['Buy']
+
+    # A sell signal occurs when a decreasing %K line crosses below the %D
+    # line in the overbought region (%K > 80.)
+    if previous_k - k > 0. and k - d < 0. and k > 80.:
+        return TRADE_SIGNALS['Sell']
+
+    # A buy signal occurs when an increasing %K line crosses above the %D
+    # line in the oversold region (%K < 20.)
+    if previous_k - k < 0. and k - d > 0. and k < 20.:
+        return TRADE_SIGNALS['Buy']
+
+    return TRADE_SIGNALS['Hold']
+
+
+class FSO(StreamingTI):
+    '''
+    Streaming Fast Stochastic Oscillator (FSO) Technical Indicator class
+    implementation.
+
+    Args:
+        -
+
+    Attributes:
+        _highest_high (_RollingExtremum): The state of the highest `High` price
+            of the last 14 periods.
+
+        _lowest_low (_RollingExtremum): The state of the lowest `Low` price of
+            the last 14 periods.
+
+        _k_mean (_RollingMoments): The state of the 3 periods mean of %K.
+
+    Methods:
+        -
+
+    Raises:
+        -
+
+    '''
+    def __init__(self):
+
+        self._highest_high = _RollingExtremum(14)
+        self._lowest_low = _RollingExtremum(14, maximum = False)
+        self._k_mean = _RollingMoments(3, variance = False)
+
+        super().__init__(indicator_name = 'FSO', required_columns = ['High',
+            'Low', 'Close'], columns = ['%K', '%D'], history = 2,
+            required_periods = 2)
+
+
+    def _updateState(self, values):
+        '''
+        Updates the rolling extrema and the %K mean with a new bar.
+
+        Args:
+            values (tuple): The values of the required stock data of the bar.
+
+        Raises:
+            -
+
+        Returns:
+            list of floats: The '%K' and '%D' values.
+        '''
+
+        high, low, close = [float(value) for value in values]
+
+        highest_high = self._highest_high.update(high)
+        lowest_low = self._lowest_low.update(low)
+
+        # Fast oscillating (%K), the first 13 periods are left to zero
+        if self._bars < 13:
+            k = 0.
+        else:
+            k = _roundValue(_divide(100*(close - lowest_low), highest_high -
+                lowest_low), 2)
+
+        return [k, _roundValue(self._k_mean.update(k)[0], 2)]
+
+
+    def _signal(self):
+        '''
+        Calculates the signal from the two most recent bars, see the getSignal
+        method of the tradingti.indicators.FSO class.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            integer: The signal value.
+        '''
+
+        return _stochasticSignal(self._rows)
+
+
+class SSO(StreamingTI):
+    '''
+    Streaming Slow Stochastic Oscillator (SSO) Technical Indicator class
+    implementation.
+
+    Args:
+        -
+
+    Attributes:
+        _highest_high (_RollingExtremum): The state of the highest `High` price
+            of the last 14 periods.
+
+        _lowest_low (_RollingExtremum): The state of the lowest `Low` price of
+            the last 14 periods.
+
+        _ranges (deque of tuples): The (C - L14) and (H14 - L14) values of the
+            last three periods.
+
+        _k_mean (_RollingMoments): The state of the 3 periods mean of %K.
+
+    Methods:
+        -
+
+    Raises:
+        -
+
+    '''
+    def __init__(self):
+
+        self._highest_high = _RollingExtremum(14)
+        self._lowest_low = _RollingExtremum(14, maximum = False)
+        self._ranges = deque(maxlen = 3)
+        self._k_mean = _RollingMoments(3, variance = False)
+
+        super().__init__(indicator_name = 'SSO', required_columns = ['High',
+            'Low', 'Close'], columns = ['%K', '%D'], history = 2,
+            required_periods = 2)
+
+
+    def _updateState(self, values):
+        '''
+        Updates the rolling extrema and the %K mean with a new bar.
+
+        Args:
+            values (tuple): The values of the required stock data of the bar.
+
+        Raises:
+            -
+
+        Returns:
+            list of floats: The '%K' and '%D' values.
+        '''
+
+        high, low, close = [float(value) for value in values]
+
+        highest_high = self._highest_high.update(high)
+        lowest_low = self._lowest_low.update(low)
+
+        self._ranges.appendleft((close - lowest_low, highest_high - 
+            lowest_low))
+
+        # Slow oscillating (%K), the first 15 periods are left to zero. The
+        # sums of the last three periods are summed from the most recent period
+        # backwards
+        if self._bars < 15:
+            k = 0.
+        else:
+            (c_0, h_0), (c_1, h_1), (c_2, h_2) = self._ranges
+            k = _roundValue(_divide(100*(c_0 + c_1 + c_2), h_0 + h_1 + h_2), 2)
+
+        return [k, _roundValue(self._k_mean.update(k)[0], 2)]
+
+
+    def _signal(self):
+        '''
+        Calculates the signal from the two most recent bars, see the getSignal
+        method of the tradingti.indicators.SSO class.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            integer: The signal value.
+        '''
+
+        return _stochasticSignal(self._rows)
+
+
+class _RollingSum:
+    '''
+    State of a rolling sum. The sum is the difference of the running sums of
+    the values at the two ends of the window, with the rounding error of each
+    addition kept in a second running sum, as in the _lookBackTotals function
+    of the tradingti.indicators package, so the sums are the ones of the batch
+    indicators.
+
+    Args:
+        window (int): The rolling window.
+
+    Attributes:
+        _sum (float): The running sum of the values.
+
+        _error (float): The running sum of the rounding errors of _sum.
+
+        _previous (deque of tuples): The running sum and the running error
+            before each value of the window.
+
+    Methods:
+        update(): Updates the sum with a new value.
+
+    Raises:
+        -
+    '''
+    def __init__(self, window):
+
+        self._sum = 0.
+        self._error = 0.
+        self._previous = deque([(0., 0.)], maxlen = window)
+
+
+    def update(self, value):
+        '''
+        Updates the sum with a new value, the oldest value leaves the window
+        when the window is full.
+
+        Args:
+            value (float): The new value.
+
+        Raises:
+            -
+
+        Returns:
+            float: The sum of the values in the window.
+        '''
+
+        # Rounding error of the addition (two-sum)
+        running_sum = self._sum + value
+        added = running_sum - self._sum
+        self._error = self._error + ((self._sum - (running_sum - added)) + (
+            value - added))
+        self._sum = running_sum
+
+        start_sum, start_error = self._previous[0]
+        self._previous.append((self._sum, self._error))
+
+        return (self._sum - start_sum) + (self._error - start_error)
+
+
+class RSI(StreamingTI):
+    '''
+    Streaming Relative Strength Index (RSI) Technical Indicator class
+    implementation.
+
+    Args:
+        look_back (int): Look back days for calculating the averages needed by
+            the RSI. Default value is 14.
+
+    Attributes:
+        _look_back (int): Look back days for calculating the averages needed by
+            the RSI.
+
+        _upward_total, _downward_total (_RollingSum): The state of the total
+            upward and downward price changes in the look_back window.
+
+    Methods:
+        -
+
+    Raises:
+        ValueError
+
+    '''
+    def __init__(self, look_back = 14):
+
+        # Validate look_back values
+        if type(look_back) != int or look_back <= 0:
+            raise(ValueError('`look_back` argument should be a positive ' +\
+                'integer, but look_back = ' + str(look_back) + '.'))
+
+        self._look_back = look_back
+        self._upward_total = _RollingSum(look_back)
+        self._downward_total = _RollingSum(look_back)
+
+        super().__init__(indicator_name = 'RSI-' + str(look_back),
+            required_columns = ['Adj Close'], columns = ['RSI'], history = 2,
+            required_periods = max(look_back, 2))
+
+
+    def _updateState(self, values):
+        '''
+        Updates the upward and downward price changes with a new bar.
+
+        Args:
+            values (tuple): The values of the required stock data of the bar.
+
+        Raises:
+            -
+
+        Returns:
+            list of floats: The 'RSI' value, NaN for the first look_back bars.
+        '''
+
+        if self._bars == 0:
+            return [math.nan]
+
+        # Upward and downward price change of the bar
+        delta = float(values[0]) - float(self._inputs[-1][0])
+
+        upward_total = self._upward_total.update(delta if delta >= 0. else 0.)
+        downward_total = self._downward_total.update(-delta if delta < 0. 
+            else 0.)
+
+        if self._bars < self._look_back:
+            return [math.nan]
+
+        # Calculate the averages for upward and downward changes
+        upward_average = upward_total/self._look_back
+        downward_average = downward_total/self._look_back
+
+        if downward_average == 0.:
+            return [100.]
+
+        return [100-(100/(1+(upward_average/downward_average)))]
+
+
+    def _signal(self):
+        '''
+        Calculates the signal from the two most recent bars, see the getSignal
+        method of the tradingti.indicators.RSI class.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            integer: The signal value.
+        '''
+
+        previous, current = self._rows[-2][0], self._rows[-1][0]
+
+        # Overbought region
+        if previous < 70. and current > 70.:
+            return TRADE_SIGNALS['Sell']
+
+        # Oversold region
+        if previous > 30. and current < 30.:
+            return TRADE_SIGNALS['Buy']
+
+        return TRADE_SIGNALS['Hold']
+
+
+def _whereInCloud(value, cloud):
+    '''
+    Checks the relative position of the value to the cloud, see the
+    _whereInCloud method of the tradingti.indicators.IC class.
+
+    Args:
+        value (float): The value for which the relative position to the cloud
+            should be calculated.
+
+        cloud (list of two floats): Bounds of the cloud in not guaranteed
+            order.
+
+    Raises:
+        -
+
+    Returns:
+        int: 0 means that value is within the cloud, 1 means that value is
+            above the cloud, -1 means that value is below the cloud.
+    '''
+
+    ordered_values = cloud + [value]
+    ordered_values.sort()
+
+    return ordered_values.index(value) - 1
+
+
+class IC(StreamingTI):
+    '''
+    Streaming Ichimoku Cloud (IC) Technical Indicator class implementation.
+
+    Args:
+        -
+
+    Attributes:
+        _highest_high (list of _RollingExtremum): The state of the highest
+            `High` price of the last 9, 26 and 52 periods.
+
+        _lowest_low (list of _RollingExtremum): The state of the lowest `Low`
+            price of the last 9, 26 and 52 periods.
+
+        _senkou (deque of tuples): The Senkou A and Senkou B values of the last
+            26 periods, which are shifted 26 periods ahead.
+
+    Methods:
+        -
+
+    Raises:
+        -
+
+    '''
+    def __init__(self):
+
+        self._highest_high = [_RollingExtremum(window) for window in
+            [9, 26, 52]]
+        self._lowest_low = [_RollingExtremum(window, maximum = False) for
+            window in [9, 26, 52]]
+        self._senkou = deque(maxlen = 26)
+
+        super().__init__(indicator_name = 'IC', required_columns = ['High',
+            'Low', 'Adj Close'], columns = ['Tenkan Sen', 'Kijun Sen',
+            'Senkou A', 'Senkou B'], history = 1, required_periods = 1)
+
+
+    def _updateState(self, values):
+        '''
+        Updates the rolling extrema with a new bar.
+
+        Args:
+            values (tuple): The values of the required stock data of the bar.
+
+        Raises:
+            -
+
+        Returns:
+            list of floats: The 'Tenkan Sen', 'Kijun Sen', 'Senkou A' and
+                'Senkou B' values, the Senkou values are NaN for the first 26
+                bars.
+        '''
+
+        high, low = float(values[0]), float(values[1])
+
+        highest_high = [extremum.update(high) for extremum in
+            self._highest_high]
+        lowest_low = [extremum.update(low) for extremum in self._lowest_low]
+
+        # Tenkan Sen and Kijun Sen
+        tenkan_sen = (highest_high[0] + lowest_low[0])/2
+        kijun_sen = (highest_high[1] + lowest_low[1])/2
+
+        # Senkou A and Senkou B, shifted 26 periods ahead
+        if len(self._senkou) == self._senkou.maxlen:
+            senkou_a, senkou_b = self._senkou[0]
+        else:
+            senkou_a, senkou_b = math.nan, math.nan
+
+        self._senkou.append(((tenkan_sen + kijun_sen)/2, (highest_high[2] +
+            lowest_low[2])/2))
+
+        return [tenkan_sen, kijun_sen, senkou_a, senkou_b]
+
+
+    def _signal(self):
+        '''
+        Calculates the signal from the most recent bar, see the getSignal
+        method of the tradingti.indicators.IC class.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            integer: The signal value.
+        '''
+
+        tenkan_sen, kijun_sen, senkou_a, senkou_b = self._rows[-1]
+        positions = [_whereInCloud(value, [senkou_a, senkou_b]) for value in
+            [self._inputs[-1][2], tenkan_sen, kijun_sen]]
+
+        # A buy signal is reinforced when the Tenkan Sen crosses above the Kijun
+        # Sen while the Tenkan Sen, Kijun Sen, and price are all above the cloud
+        if tenkan_sen > kijun_sen and positions == [1, 1, 1]:
+            return TRADE_SIGNALS['Buy']
+
+        # A sell signal is reinforced when the TenKan Sen crosses below the
+        # Kijun Sen while the Tenkan Sen, Kijun Sen, and price are all below the
+        # cloud.
+        if tenkan_sen < kijun_sen and positions == [-1, -1, -1]:
+            return TRADE_SIGNALS['Sell']
+
+        return TRADE_SIGNALS['Hold']
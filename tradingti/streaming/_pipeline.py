@@ -0,0 +1,370 @@
+'''
+File name: _pipeline.py
+    Asynchronous pipeline of the streaming technical indicators, defined under
+    the tradingti.streaming package. The bars are read from asynchronous
+    sources into a bounded queue, the bars of the symbols waiting in the queue
+    are updated together as a micro-batch, and the updates run in an executor,
+    so the event loop is not blocked by the calculations.
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+import asyncio
+import numpy as np
+from functools import partial
+from ._streaming_indicator import _signalTuple
+from ._trend import SMA, EMA, MACD, ADX, DMI
+from ._momentum import FSO, SSO, RSI, IC
+from ._volatility import BB, SD
+from ._volume import OBV
+from . import panel
+
+
+# Streaming indicators, the ones with a panel implementation are updated with
+# vectorized operations over the symbols of a micro-batch
+_INDICATORS = {'SMA': SMA, 'EMA': EMA, 'MACD': MACD, 'ADX': ADX, 'DMI': DMI,
+    'FSO': FSO, 'SSO': SSO, 'RSI': RSI, 'IC': IC, 'BB': BB, 'SD': SD,
+    'OBV': OBV}
+
+_PANEL_INDICATORS = {'SMA': panel.SMA, 'EMA': panel.EMA, 'MACD': panel.MACD,
+    'ADX': panel.ADX, 'DMI': panel.DMI, 'RSI': panel.RSI, 'BB': panel.BB,
+    'SD': panel.SD, 'OBV': panel.OBV}
+
+# Marker put in the queue by a source when it is exhausted (or failed)
+_END = object()
+
+
+class _StreamingObjects:
+    '''
+    Streaming indicator of several symbols, made of one streaming indicator
+    object for each symbol. It is used for the indicators without a panel
+    implementation, and has the updateMany interface of the StreamingPanelTI
+    class.
+
+    Args:
+        indicator (class): The streaming indicator class.
+
+        arguments (dictionary): The arguments of the indicator.
+
+        symbols (int): The number of the symbols.
+
+    Attributes:
+        _factory (callable): Creates the indicator object of a symbol.
+
+        _indicator_name (string): The name of the Technical Indicator.
+
+        _required_columns (list of strings): The stock data required in each
+            bar.
+
+        _objects (list): The indicator object of each symbol, None until the
+            first bar of the symbol.
+
+    Methods:
+        updateMany(): Updates the indicator with a new bar for several symbols.
+
+    Raises:
+        TypeError
+        ValueError
+    '''
+    def __init__(self, indicator, arguments, symbols):
+
+        self._factory = partial(indicator, **arguments)
+
+        # The arguments are validated by the constructor of the indicator
+        self._objects = [self._factory()] + [None]*(symbols - 1)
+        self._indicator_name = self._objects[0]._indicator_name
+        self._required_columns = self._objects[0]._required_columns
+
+
+    def updateMany(self, symbol_ids, bars):
+        '''
+        Updates the indicator with a new bar for several symbols, one symbol
+        after the other.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+            bars (dictionary): The stock data of the bars, as stock data name:
+                list with one value for each symbol id.
+
+        Raises:
+            TypeError
+            ValueError
+
+        Returns:
+            tuple (numpy array, numpy array): The calculated values and the
+                trading signal value of each symbol, see the updateMany method
+                of the StreamingPanelTI class.
+        '''
+
+        rows, signals = [], []
+        for i, symbol_id in enumerate(symbol_ids):
+            if self._objects[symbol_id] is None:
+                self._objects[symbol_id] = self._factory()
+
+            row, signal = self._objects[symbol_id].update({column:
+                bars[column][i] for column in self._required_columns})
+
+            rows.append(row)
+            signals.append(signal[1])
+
+        return np.array(rows, dtype = np.float64), np.array(signals,
+            dtype = np.int64)
+
+
+def _streamingState(indicator, symbols):
+    '''
+    Creates the state of the requested streaming indicator for several
+    symbols.
+
+    Args:
+        indicator (string or tuple): The requested indicator, see
+            streamIndicator.
+
+        symbols (int): The number of the symbols.
+
+    Raises:
+        TypeError
+        ValueError
+
+    Returns:
+        StreamingPanelTI or _StreamingObjects: The state of the indicator.
+    '''
+
+    name, arguments = indicator if isinstance(indicator, tuple) else \
+        (indicator, {})
+
+    if name not in _INDICATORS:
+        raise ValueError('Not supported indicator `' + str(name) + '`. ' +\
+            'Supported indicators are ' + str(list(_INDICATORS)) + '.')
+
+    if not isinstance(arguments, dict):
+        raise TypeError('The arguments of the indicator `' + name + '` ' +\
+            'should be a `dict` but they are of type `' +\
+            str(type(arguments)) + '`.')
+
+    if name in _PANEL_INDICATORS:
+        return _PANEL_INDICATORS[name](symbols, **arguments)
+
+    return _StreamingObjects(_INDICATORS[name], arguments, symbols)
+
+
+def _updateRecords(state, symbol_ids, records):
+    '''
+    Updates the indicator with the bars of a micro-batch. It runs in the
+    executor of the pipeline.
+
+    Args:
+        state (StreamingPanelTI or _StreamingObjects): The state of the
+            indicator.
+
+        symbol_ids (list of integers): The id of the symbol of each bar.
+
+        records (list of tuples): The (symbol, timestamp, bar) records of the
+            micro-batch.
+
+    Raises:
+        TypeError
+        ValueError
+
+    Returns:
+        list of tuples: The (symbol, timestamp, values, signal) record of each
+            bar, see streamIndicator.
+    '''
+
+    bars = {}
+    for column in state._required_columns:
+        try:
+            bars[column] = [bar[column] for _, _, bar in records]
+        except (KeyError, IndexError, TypeError):
+            raise ValueError('Required column `' + column + '` for the ' +\
+                'technical indicator `' + state._indicator_name + '` was ' +\
+                'not found in the bar.')
+
+    rows, signals = state.updateMany(np.array(symbol_ids, dtype = np.intp),
+        bars)
+
+    return [(symbol, timestamp, values, _signalTuple(signal)) for (symbol,
+        timestamp, _), values, signal in zip(records, rows.tolist(),
+        signals.tolist())]
+
+
+async def _readBars(source, queue, symbol = None):
+    '''
+    Reads the bars of a source into the queue, waiting while the queue is
+    full. The end of the source, or its error, is marked in the queue.
+
+    Args:
+        source (async iterable): The source of the bars, yielding (symbol,
+            timestamp, bar) records, or (timestamp, bar) records for the
+            source of one symbol.
+
+        queue (asyncio.Queue): The queue of the pipeline.
+
+        symbol (object): The symbol of the source, None for a source of several
+            symbols.
+
+    Raises:
+        -
+
+    Returns:
+        -
+    '''
+
+    try:
+        async for record in source:
+            await queue.put(tuple(record) if symbol is None else (symbol,) +
+                tuple(record))
+
+    except asyncio.CancelledError:
+        raise
+
+    except Exception as error:
+        await queue.put((_END, error))
+        return
+
+    await queue.put((_END, None))
+
+
+async def streamIndicator(bars, indicator, symbols, queue_size = 1024,
+    batch_size = 256, executor = None):
+    '''
+    Asynchronous pipeline from sources of bars to the values and the signals
+    of a streaming technical indicator. The bars are read into a bounded
+    queue, so a slow consumer of the results makes the pipeline stop reading
+    the sources (backpressure). The bars waiting in the queue are updated
+    together as a micro-batch, with one bar for each symbol, and the updates
+    run in an executor while the next bars are read. The bars of a symbol are
+    updated in the order of their source.
+
+    The indicators with a panel implementation (see the
+    tradingti.streaming.panel package) update the symbols of a micro-batch
+    with vectorized operations, the others (FSO, SSO, IC) use one streaming
+    indicator object for each symbol.
+
+    Args:
+        bars (async iterable or dictionary): The sources of the bars, either
+            one async iterable yielding (symbol, timestamp, bar) records for
+            interleaved symbols, or a dictionary of symbol: async iterable
+            yielding (timestamp, bar) records of the symbol. A bar is a
+            dictionary (or pandas.Series) of stock data name: value, see the
+            update method of the streaming indicators.
+
+        indicator (string or tuple): The requested indicator, either its name
+            (for example 'MACD') or a tuple with its name and a dictionary with
+            its arguments (for example ('SMA', {'sma_periods': [20, 50]})).
+
+        symbols (list): The symbols of the bars.
+
+        queue_size (int, default is 1024): The maximum number of bars waiting
+            in the queue.
+
+        batch_size (int, default is 256): The maximum number of bars in a
+            micro-batch.
+
+        executor (concurrent.futures.Executor, default is None): The executor
+            running the updates, None for the default executor of the event
+            loop.
+
+    Raises:
+        TypeError()
+        ValueError()
+
+    Returns:
+        async generator of tuples: The (symbol, timestamp, values, signal)
+            record of each bar, where values is the list of the calculated
+            values of the indicator and signal the trading signal tuple (see
+            TRADE_SIGNALS package constant). An error of a source is raised
+            after the records of the bars read before it.
+    '''
+
+    if not isinstance(symbols, list):
+        raise TypeError('The argument symbols should be a `list` but it is ' +\
+            'of type `' + str(type(symbols)) + '`.')
+
+    symbol_ids = {symbol: i for i, symbol in enumerate(symbols)}
+
+    if len(symbol_ids) == 0 or len(symbol_ids) != len(symbols):
+        raise ValueError('The argument symbols should contain at least one ' +\
+            'symbol, without duplicates.')
+
+    for name, value in [('queue_size', queue_size), ('batch_size',
+        batch_size)]:
+        if type(value) != int or value <= 0:
+            raise ValueError('The argument ' + name + ' should be a ' +\
+                'positive integer, but it is ' + str(value) + '.')
+
+    state = _streamingState(indicator, len(symbols))
+
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize = queue_size)
+
+    if isinstance(bars, dict):
+        readers = [asyncio.ensure_future(_readBars(source, queue, symbol))
+            for symbol, source in bars.items()]
+    else:
+        readers = [asyncio.ensure_future(_readBars(bars, queue))]
+
+    active_readers = len(readers)
+    held_record = None
+    source_error = None
+
+    try:
+        while held_record is not None or (active_readers > 0 and
+            source_error is None):
+
+            # Micro-batch of the bars waiting in the queue, a second bar of a
+            # symbol is held for the next micro-batch. The queue is not read
+            # after the error of a source.
+            records, batch_ids = [], set()
+
+            while len(records) < batch_size:
+                if held_record is not None:
+                    record, held_record = held_record, None
+                elif active_readers == 0 or source_error is not None:
+                    break
+                elif len(records) == 0:
+                    record = await queue.get()
+                elif queue.empty():
+                    break
+                else:
+                    record = queue.get_nowait()
+
+                if record[0] is _END:
+                    active_readers -= 1
+                    source_error = record[1]
+                    continue
+
+                if record[0] not in symbol_ids:
+                    raise ValueError('Bar of an unknown symbol `' +\
+                        str(record[0]) + '`.')
+
+                if symbol_ids[record[0]] in batch_ids:
+                    held_record = record
+                    break
+
+                records.append(record)
+                batch_ids.add(symbol_ids[record[0]])
+
+            if len(records) == 0:
+                continue
+
+            results = await loop.run_in_executor(executor, _updateRecords,
+                state, [symbol_ids[record[0]] for record in records], records)
+
+            for result in results:
+                yield result
+
+        if source_error is not None:
+            raise source_error
+
+    finally:
+        for reader in readers:
+            reader.cancel()
@@ -0,0 +1,247 @@
+'''
+File name: _rolling_windows.py
+    Rolling window states of the streaming technical indicators. Each state
+    keeps a fixed size ring buffer of the last window periods, and is updated
+    with one value at a time in constant (amortized) time. The updated values
+    are the ones calculated by the rolling window kernels of the tradingti.utils
+    package (with the default min_periods = 1) for the whole history.
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+import math
+from collections import deque
+from ..utils._rolling_kernels import _blockLength
+
+
+class _RollingExtremum:
+    '''
+    State of a rolling maximum (or minimum). A monotonic deque keeps the
+    candidate extrema of the window, the oldest of them being the extremum.
+    Each value enters and leaves the deque once, so an update costs constant
+    amortized time and the deque holds at most window values.
+
+    Args:
+        window (int): The rolling window.
+
+        maximum (boolean): If True the rolling maximum is calculated, otherwise
+            the rolling minimum. Default value is True.
+
+    Attributes:
+        _window (int): The rolling window.
+
+        _sign (float): 1. for the maximum, -1. for the minimum.
+
+        _candidates (deque of tuples): The (period, value) of the candidate
+            extrema, with decreasing (for the maximum) values.
+
+        _period (int): The number of the periods updated.
+
+    Methods:
+        update(): Updates the extremum with a new value.
+
+    Raises:
+        -
+    '''
+    def __init__(self, window, maximum = True):
+
+        self._window = window
+        self._sign = 1. if maximum else -1.
+        self._candidates = deque()
+        self._period = 0
+
+
+    def update(self, value):
+        '''
+        Updates the extremum with a new value, the oldest value leaves the
+        window when the window is full.
+
+        Args:
+            value (float): The new value.
+
+        Raises:
+            -
+
+        Returns:
+            float: The extremum of the values in the window.
+        '''
+
+        # Values dominated by the new value can not be an extremum anymore
+        while self._candidates and self._sign*self._candidates[-1][1] <= \
+            self._sign*value:
+            self._candidates.pop()
+
+        self._candidates.append((self._period, value))
+
+        # Drop the extremum which left the window
+        if self._candidates[0][0] <= self._period - self._window:
+            self._candidates.popleft()
+
+        self._period += 1
+
+        return self._candidates[0][1]
+
+
+class _RollingMoments:
+    '''
+    State of the rolling mean and variance for a window. It follows the
+    _rollingMoments kernel of the tradingti.utils package: the values are
+    expressed relative to a reference value (the first value of their block),
+    and the running sums of the deviations (and their squares) restart at each
+    block, whose length depends only on the window. A window sum is the
+    difference of two running sums, kept in a ring buffer of the last periods,
+    so the running sums stay small and the rounding error does not accumulate
+    on long histories. Windows in which all the values are equal get exact
+    results.
+
+    Args:
+        window (int): The rolling window.
+
+        variance (boolean): If True, the rolling variance is also calculated.
+            Default value is True.
+
+        ddof (int): Delta degrees of freedom of the variance. Default value is
+            1.
+
+    Attributes:
+        _window (int): The rolling window.
+
+        _variance (boolean): If True, the rolling variance is also calculated.
+
+        _ddof (int): Delta degrees of freedom of the variance.
+
+        _block (int): The length of the blocks in which the running sums
+            restart.
+
+        _period (int): The number of the periods updated.
+
+        _reference, _previous_reference (float): The reference value of the
+            current and of the previous block.
+
+        _sum, _squares (float): The running sums of the deviations and of
+            their squares in the current block.
+
+        _previous_sum, _previous_squares (float): The totals of the previous
+            block.
+
+        _exclusive_sums (deque of tuples): The running sums (and sums of
+            squares) before each of the last window periods.
+
+        _last_value (float): The value of the previous period.
+
+        _run_length (int): The number of the last periods with equal values.
+
+    Methods:
+        update(): Updates the moments with a new value.
+
+    Raises:
+        -
+    '''
+    def __init__(self, window, variance = True, ddof = 1):
+
+        self._window = window
+        self._variance = variance
+        self._ddof = ddof
+        self._block = _blockLength(window)
+
+        self._period = 0
+        self._reference = 0.
+        self._previous_reference = 0.
+        self._sum = 0.
+        self._squares = 0.
+        self._previous_sum = 0.
+        self._previous_squares = 0.
+        self._exclusive_sums = deque(maxlen = window)
+
+        self._last_value = None
+        self._run_length = 0
+
+
+    def update(self, value):
+        '''
+        Updates the moments with a new value.
+
+        Args:
+            value (float): The new value.
+
+        Raises:
+            -
+
+        Returns:
+            tuple (float, float): The rolling mean and variance of the window.
+                The variance is None if not requested, and NaN when the window
+                contains ddof values or less.
+        '''
+
+        value = float(value)
+        period = self._period
+        block_period = period % self._block
+        window = self._window
+
+        # A new block, restart the running sums from its first value
+        if block_period == 0:
+            self._previous_reference = self._reference
+            self._previous_sum = self._sum
+            self._previous_squares = self._squares
+            self._reference = value
+            self._sum = 0.
+            self._squares = 0.
+
+        self._exclusive_sums.append((self._sum, self._squares))
+
+        deviation = value - self._reference
+        self._sum += deviation
+        self._squares += deviation*deviation
+
+        self._run_length = self._run_length + 1 if value == \
+            self._last_value else 1
+        self._last_value = value
+        self._period += 1
+
+        count = min(period + 1, window)
+
+        if period < window - 1:
+            window_sum, window_squares = self._sum, self._squares
+
+        else:
+            start_sum, start_squares = self._exclusive_sums[0]
+
+            # The window crosses a block boundary, the part in the previous
+            # block is moved to the reference of the current block
+            if block_period < window - 1:
+                previous_sum = self._previous_sum - start_sum
+                previous_count = window - 1 - block_period
+                shift = self._previous_reference - self._reference
+
+                window_sum = self._sum + previous_sum + previous_count*shift
+                window_squares = self._squares + self._previous_squares - \
+                    start_squares + 2*shift*previous_sum + \
+                    previous_count*(shift*shift)
+
+            else:
+                window_sum = self._sum - start_sum
+                window_squares = self._squares - start_squares
+
+        constant = self._run_length >= count
+
+        relative_mean = window_sum/count
+        mean = value if constant else self._reference + relative_mean
+
+        if not self._variance:
+            return mean, None
+
+        if count <= self._ddof:
+            return mean, math.nan
+
+        if constant:
+            return mean, 0.
+
+        return mean, max((window_squares - window_sum*relative_mean)/(count -
+            self._ddof), 0.)
@@ -0,0 +1,309 @@
+'''
+File name: _streaming_indicator.py
+    Parent class for all the streaming technical indicators.
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+import math
+import numbers
+from abc import ABC, abstractmethod
+from collections import deque
+from .._constants import *
+
+
+def _signalTuple(signal):
+    '''
+    Returns the trading signal tuple for a signal value.
+
+    Args:
+        signal (integer): The signal value, see TRADE_SIGNALS package constant.
+
+    Raises:
+        -
+
+    Returns:
+        tuple (string, integer): The Trading signal.
+    '''
+
+    return (list(TRADE_SIGNALS.keys())[list(TRADE_SIGNALS.values()).
+        index(signal)], signal)
+
+
+def _divide(numerator, denominator):
+    '''
+    Divides two floats as numpy does, a division by zero returns infinity (or
+    NaN for 0/0) instead of raising an exception.
+
+    Args:
+        numerator (float): The numerator.
+
+        denominator (float): The denominator.
+
+    Raises:
+        -
+
+    Returns:
+        float: The result of the division.
+    '''
+
+    if denominator != 0.:
+        return numerator/denominator
+
+    if numerator == 0. or numerator != numerator:
+        return math.nan
+
+    return math.copysign(math.inf, numerator)*math.copysign(1., denominator)
+
+
+class StreamingTI(ABC):
+    '''
+    Streaming Technical Indicators class implementation. Is used as a parent
+    class for each streaming technical indicator. A streaming indicator is
+    updated with one bar (period) of stock data at a time, and keeps only the
+    state needed for the next update, so each update takes constant time. The
+    values calculated for each bar are the same as the values calculated by the
+    technical indicator (tradingti.indicators package) for the whole history.
+
+    Args:
+        indicator_name (string): The name of the Technical Indicator.
+
+        required_columns (list of strings): The stock data required in each bar.
+
+        columns (list of strings): The names of the calculated values.
+
+        history (int): The number of the most recent bars (input and calculated
+            values) kept for the signal calculation.
+
+        required_periods (int): The number of bars the indicator and its signal
+            rules require, see the getSignals method of the technical
+            indicator. The signal of the earlier bars is 'Hold'.
+
+    Attributes:
+        _indicator_name (string): The name of the Technical Indicator.
+
+        _required_columns (list of strings): The stock data required in each
+            bar.
+
+        _columns (list of strings): The names of the calculated values.
+
+        _inputs (deque of tuples): The input values of the most recent bars.
+
+        _rows (deque of lists): The calculated values of the most recent bars.
+
+        _required_periods (int): The number of bars the indicator and its
+            signal rules require.
+
+        _bars (int): The number of bars the indicator was updated with.
+
+    Methods:
+        update(): Updates the indicator with a new bar.
+
+        getColumns(): Returns the names of the calculated values.
+
+        getTiValue(): Returns the calculated values of the most recent bar.
+
+        getSignal(): Returns the trading signal of the most recent bar.
+
+    Raises:
+        -
+    '''
+    def __init__(self, indicator_name, required_columns, columns, history,
+        required_periods):
+
+        self._indicator_name = indicator_name
+        self._required_columns = required_columns
+        self._columns = columns
+        self._inputs = deque(maxlen = history)
+        self._rows = deque(maxlen = history)
+        self._required_periods = max(required_periods, history)
+        self._bars = 0
+
+
+    def _barValues(self, bar):
+        '''
+        Validates a bar and returns the values of the required stock data. A
+        missing value (NaN) is filled with the value of the previous bar, as the
+        forward pass of the fillMissingValues method.
+
+        Args:
+            bar (dictionary or pandas.Series): The stock data of the bar, as
+                stock data name: value.
+
+        Raises:
+            TypeError
+            ValueError
+
+        Returns:
+            tuple: The values of the required stock data, as python int (for
+                integral values) or float.
+        '''
+
+        values = []
+        for i, column in enumerate(self._required_columns):
+            try:
+                value = bar[column]
+            except (KeyError, IndexError, TypeError):
+                raise ValueError('Required column `' + column + '` for the ' +\
+                    'technical indicator `' + self._indicator_name + '` was ' +\
+                    'not found in the bar.')
+
+            if not isinstance(value, numbers.Number) or isinstance(value, bool):
+                raise TypeError('The bar must hold values of numeric type. ' +\
+                    'column `' + column + '` is of type `' + str(type(value)) +\
+                    '`.')
+
+            if value != value:
+                if len(self._inputs) == 0:
+                    raise ValueError('The value of column `' + column + '` ' +\
+                        'is missing in the first bar.')
+
+                value = self._inputs[-1][i]
+
+            # Python numbers are faster than numpy scalars in the updates
+            values.append(int(value) if isinstance(value, numbers.Integral)
+                else float(value))
+
+        return tuple(values)
+
+
+    @abstractmethod
+    def _updateState(self, values):
+        '''
+        Abstract method for updating the state of the indicator with the values
+        of a new bar. The implemented method should return the calculated values
+        for the bar.
+
+        Args:
+            values (tuple): The values of the required stock data of the bar.
+
+        Raises:
+            -
+
+        Returns:
+            -
+        '''
+
+        pass
+
+
+    @abstractmethod
+    def _signal(self):
+        '''
+        Abstract method for the signal calculation from the most recent bars.
+        The implemented method should return the signal value, see
+        TRADE_SIGNALS package constant.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            -
+        '''
+
+        pass
+
+
+    def update(self, bar):
+        '''
+        Updates the indicator with a new bar, in constant time.
+
+        Args:
+            bar (dictionary or pandas.Series): The stock data of the bar, as
+                stock data name: value. It should contain the stock data
+                required by the indicator.
+
+        Raises:
+            TypeError
+            ValueError
+
+        Returns:
+            tuple (list, tuple (string, integer)): The calculated values of the
+                indicator for the bar, and the trading signal. See getTiValue
+                and getSignal.
+        '''
+
+        values = self._barValues(bar)
+        row = self._updateState(values)
+
+        self._inputs.append(values)
+        self._rows.append(row)
+        self._bars += 1
+
+        return list(row), self.getSignal()
+
+
+    def getColumns(self):
+        '''
+        Returns the names of the calculated values, the columns of the data
+        frame returned by the getTiData method of the technical indicator.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            list of strings: The names of the calculated values.
+        '''
+
+        return list(self._columns)
+
+
+    def getTiValue(self):
+        '''
+        Returns the calculated values of the most recent bar.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            list of numbers: The calculated values, None if the indicator was
+                not updated yet.
+        '''
+
+        if len(self._rows) == 0:
+            return None
+
+        return list(self._rows[-1])
+
+
+    def getSignal(self):
+        '''
+        Calculates and returns the signal of the technical indicator for the
+        most recent bar. It is the signal returned by the getSignal method of
+        the technical indicator for the history up to this bar, and the signal
+        of this bar returned by its getSignals method. Until the bars required
+        by the indicator and its signal rules are available, the signal is
+        'Hold'.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            tuple (string, integer): The Trading signal. Possible values are
+            ('Hold', 0), ('Buy', -1), ('Sell', 1). See TRADE_SIGNALS package
+            constant.
+        '''
+
+        if self._bars < self._required_periods:
+            return _signalTuple(TRADE_SIGNALS['Hold'])
+
+        return _signalTuple(self._signal())
@@ -0,0 +1,743 @@
+'''
+File name: _trend.py
+    Trend streaming technical indicators implementation.
+    Implements the following streaming technical indicators:
+    - Simple Moving Average (SMA class)
+    - Exponential Moving Average (EMA class)
+    - Moving Average Convergence Divergence (MACD class)
+    - Average Directional Movement Index (ADX class)
+    - Directional Movement Index (DMI class)
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+import math
+from collections import deque
+from ._streaming_indicator import StreamingTI, _divide
+from ._rolling_windows import _RollingMoments
+from .._constants import *
+
+
+def _validatePeriods(periods):
+    '''
+    Validates the periods of a moving average, a not empty list of positive
+    integers.
+
+    Args:
+        periods (object): The periods (rolling windows, span periods) of the
+            moving average.
+
+    Raises:
+        TypeError
+        ValueError
+
+    Returns:
+        -
+    '''
+
+    if not isinstance(periods, list):
+        raise TypeError('periods must be a list of positive integers. ' +\
+            'periods_type = ' + str(type(periods)) + '.')
+
+    if len(periods) == 0:
+        raise ValueError('periods must contain at least one positive ' +\
+            'integer. periods = ' + str(periods) + ' contains ' +\
+            str(len(periods)) + '.')
+
+    for period in periods:
+        if not isinstance(period, int) or period <= 0:
+            raise ValueError('periods must contain only positive integers. ' +\
+                'periods = ' + str(periods) + ', ' + str(period) +\
+                ' is not a valid positive integer.')
+
+
+def _movingAverageSignal(prices, rows, periods):
+    '''
+    Calculates the signal of a moving average indicator from its two most
+    recent bars, with the rules of the AverageTI getSignal method. The long
+    term signal is given when the price crosses the long term average, and the
+    short term signal when the short term average crosses the long term one.
+
+    Args:
+        prices (deque of tuples): The input values of the two most recent bars,
+            the price is the first value.
+
+        rows (deque of lists): The calculated values of the two most recent
+            bars, one for each period.
+
+        periods (list of integers): The periods of the moving averages.
+
+    Raises:
+        -
+
+    Returns:
+        integer: The signal value, see TRADE_SIGNALS package constant. When one
+            period is given, the long term signal.
+    '''
+
+    long_term = periods.index(max(periods))
+
+    # Prices crosses the long term MA
+    if (prices[-2][0] - rows[-2][long_term])*(prices[-1][0] -
+        rows[-1][long_term]) < 0:
+        signal = TRADE_SIGNALS['Buy'] if prices[-1][0] - rows[-1][long_term] \
+            > 0 else TRADE_SIGNALS['Sell']
+    else:
+        signal = TRADE_SIGNALS['Hold']
+
+    if len(periods) == 1:
+        return signal
+
+    short_term = periods.index(min(periods))
+
+    # MAs crosses each other
+    if (rows[-2][short_term] - rows[-2][long_term])*(rows[-1][short_term] -
+        rows[-1][long_term]) < 0:
+        signal += TRADE_SIGNALS['Buy'] if rows[-1][short_term] - \
+            rows[-1][long_term] > 0 else TRADE_SIGNALS['Sell']
+
+    # Normalize signal if needed
+    if abs(signal) == 2:
+        signal = signal//2
+
+    return signal
+
+
+class _ExponentialMean:
+    '''
+    State of an exponential moving average. It follows the recurrence of the
+    pandas ewm mean (adjust = True), so the updated values are the same as the
+    values calculated for the whole history.
+
+    Args:
+        span (int): The span period from which the decay is calculated.
+
+    Attributes:
+        _old_weight_factor (float): The decay of the weight of the past values
+            in each update.
+
+        _old_weight (float): The total weight of the past values.
+
+        _mean (float): The current value of the average, None before the first
+            update.
+
+    Methods:
+        update(): Updates the average with a new value.
+
+    Raises:
+        -
+    '''
+    def __init__(self, span):
+
+        self._old_weight_factor = 1. - 1./(1. + (span - 1)/2.)
+        self._old_weight = 1.
+        self._mean = None
+
+
+    def update(self, value):
+        '''
+        Updates the average with a new value.
+
+        Args:
+            value (float): The new value.
+
+        Raises:
+            -
+
+        Returns:
+            float: The updated average.
+        '''
+
+        value = float(value)
+
+        if self._mean is None:
+            self._mean = value
+            return value
+
+        self._old_weight *= self._old_weight_factor
+
+        # Avoid numerical errors on constant series
+        if self._mean != value:
+            self._mean = (self._old_weight*self._mean + value)/(
+                self._old_weight + 1.)
+
+        self._old_weight += 1.
+
+        return self._mean
+
+
+class SMA(StreamingTI):
+    '''
+    Streaming Simple Moving Average (SMA) Technical Indicator class
+    implementation.
+
+    Args:
+        sma_periods (object): The sma periods for which the rolling mean of the
+            prices is calculated. Is a list of integers, with one (representing
+            the long term SMA) or more members. When more than one is given, the
+            largest one represents the long term SMA and the smallest one the
+            short term SMA. Default values are [50, 200], 50 for the short term
+            and 200 for the long term.
+
+    Attributes:
+        _sma_periods (object): The sma periods for which the rolling mean of the
+            prices is calculated.
+
+        _moments (list of _RollingMoments): The state of the rolling mean of
+            each sma period.
+
+    Methods:
+        -
+
+    Raises:
+        TypeError
+        ValueError
+
+    '''
+    def __init__(self, sma_periods = [50, 200]):
+
+        _validatePeriods(sma_periods)
+
+        self._sma_periods = sma_periods
+        self._moments = [_RollingMoments(x, variance = False) for x in
+            sma_periods]
+
+        super().__init__(indicator_name = 'SMA-' + str(sma_periods),
+            required_columns = ['Adj Close'], columns = ['SMA-' + str(x) for x
+            in sma_periods], history = 2, required_periods = max(max(
+            sma_periods), 2))
+
+
+    def _updateState(self, values):
+        '''
+        Updates the rolling mean of each sma period with the price of a new bar.
+
+        Args:
+            values (tuple): The values of the required stock data of the bar.
+
+        Raises:
+            -
+
+        Returns:
+            list of floats: The SMA of each sma period.
+        '''
+
+        return [moments.update(values[0])[0] for moments in self._moments]
+
+
+    def _signal(self):
+        '''
+        Calculates the signal from the two most recent bars, see the getSignal
+        method of the tradingti.indicators.SMA class.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            integer: The signal value.
+        '''
+
+        return _movingAverageSignal(self._inputs, self._rows,
+            self._sma_periods)
+
+
+class EMA(StreamingTI):
+    '''
+    Streaming EMA Technical Indicator class implementation.
+
+    Args:
+        span_periods (object): The span periods from which the decay is
+            calculated. Is a list of integers, with one (representing the long
+            term EMA) or more members. When more than one is given, the largest
+            one represents the long term EMA and the smallest one the short term
+            EMA. Default values are [26, 200], 26 for the short term and 200 for
+            the long term.
+
+    Attributes:
+        _span_periods (object): The span periods from which the decay is
+            calculated.
+
+        _means (list of _ExponentialMean): The state of the average of each
+            span period.
+
+    Methods:
+        -
+
+    Raises:
+        TypeError
+        ValueError
+
+    '''
+    def __init__(self, span_periods = [26, 200]):
+
+        _validatePeriods(span_periods)
+
+        self._span_periods = span_periods
+        self._means = [_ExponentialMean(span) for span in span_periods]
+
+        super().__init__(indicator_name = 'EMA-' + str(span_periods),
+            required_columns = ['Adj Close'], columns = ['EMA-' + str(x) for x
+            in span_periods], history = 2, required_periods = max(max(
+            span_periods), 2))
+
+
+    def _updateState(self, values):
+        '''
+        Updates the average of each span period with the price of a new bar.
+
+        Args:
+            values (tuple): The values of the required stock data of the bar.
+
+        Raises:
+            -
+
+        Returns:
+            list of floats: The EMA of each span period.
+        '''
+
+        return [mean.update(values[0]) for mean in self._means]
+
+
+    def _signal(self):
+        '''
+        Calculates the signal from the two most recent bars, see the getSignal
+        method of the tradingti.indicators.EMA class.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            integer: The signal value.
+        '''
+
+        return _movingAverageSignal(self._inputs, self._rows,
+            self._span_periods)
+
+
+class MACD(StreamingTI):
+    '''
+    Streaming Moving Average Convergence Divergence (MACD) Technical Indicator
+    class implementation.
+
+    Args:
+        -
+
+    Attributes:
+        _ema_12 (_ExponentialMean): The state of the 12 periods EMA of the
+            prices.
+
+        _ema_26 (_ExponentialMean): The state of the 26 periods EMA of the
+            prices.
+
+        _signal_line (_ExponentialMean): The state of the 9 periods EMA of the
+            MACD line.
+
+    Methods:
+        -
+
+    Raises:
+        -
+
+    '''
+    def __init__(self):
+
+        self._ema_12 = _ExponentialMean(12)
+        self._ema_26 = _ExponentialMean(26)
+        self._signal_line = _ExponentialMean(9)
+
+        super().__init__(indicator_name = 'MACD', required_columns =
+            ['Adj Close'], columns = ['MACD', 'Signal Line'], history = 2,
+            required_periods = 26)
+
+
+    def _updateState(self, values):
+        '''
+        Updates the EMAs with the price of a new bar.
+
+        Args:
+            values (tuple): The values of the required stock data of the bar.
+
+        Raises:
+            -
+
+        Returns:
+            list of floats: The 'MACD' and the 'Signal Line' values.
+        '''
+
+        macd = self._ema_12.update(values[0]) - self._ema_26.update(values[0])
+
+        return [macd, self._signal_line.update(macd)]
+
+
+    def _signal(self):
+        '''
+        Calculates the signal from the two most recent bars, see the getSignal
+        method of the tradingti.indicators.MACD class.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            integer: The signal value.
+        '''
+
+        (previous_macd, previous_signal_line), (macd, signal_line) = self._rows
+
+        signal = 0
+
+        # MACD crossing above zero is considered bullish, while crossing below
+        # zero is bearish.
+        if previous_macd < 0. and macd > 0.:
+            signal += TRADE_SIGNALS['Buy']
+
+        if previous_macd > 0. and macd < 0.:
+            signal += TRADE_SIGNALS['Sell']
+
+        # MACD turns up from below zero it is considered bullish.
+        # MACD turns down from above zero it is considered bearish.
+        if previous_macd < macd and macd < 0.:
+            signal += TRADE_SIGNALS['Buy']
+
+        if previous_macd > macd and macd > 0.:
+            signal += TRADE_SIGNALS['Sell']
+
+        # MACD line crosses the signal line
+        if previous_macd < previous_signal_line and macd > signal_line:
+            signal += TRADE_SIGNALS['Buy']
+
+        if previous_macd > previous_signal_line and macd < signal_line:
+            signal += TRADE_SIGNALS['Sell']
+
+        # Signal voting
+        if signal <= -1:
+            signal = TRADE_SIGNALS['Buy']
+        elif signal >= 1:
+            signal = TRADE_SIGNALS['Sell']
+
+        return signal
+
+
+class _DirectionalMovement:
+    '''
+    State of the smoothed directional movement. It follows the recurrence of
+    the _directionalMovement function of the tradingti.indicators package, the
+    first smoothed values are the sums of the first 5 periods and the next ones
+    follow S(i) = S(i-1) - S(i-1)/5 + X(i).
+
+    Args:
+        -
+
+    Attributes:
+        _periods (int): The number of the periods updated.
+
+        _previous (tuple): The 'High', 'Low' and 'Close' of the previous period.
+
+        _dm_plus, _dm_minus, _true_range (float): The smoothed directional
+            moves and true range (sums until the 5th period).
+
+    Methods:
+        update(): Updates the directional movement with a new period.
+
+    Raises:
+        -
+    '''
+    def __init__(self):
+
+        self._periods = 0
+        self._previous = None
+        self._dm_plus = 0
+        self._dm_minus = 0
+        self._true_range = 0
+
+
+    def update(self, high, low, close):
+        '''
+        Updates the directional movement with a new period.
+
+        Args:
+            high (float): The 'High' price of the period.
+
+            low (float): The 'Low' price of the period.
+
+            close (float): The 'Close' price of the period.
+
+        Raises:
+            -
+
+        Returns:
+            list of floats: The 'DMI+', 'DMI-' and 'DX' values, NaN for the
+                first 5 periods.
+        '''
+
+        high, low, close = float(high), float(low), float(close)
+
+        # Directional moves and true range (not defined for the first period)
+        if self._previous is None:
+            di_plus, di_minus, true_range = 0., 0., math.nan
+        else:
+            previous_high, previous_low, previous_close = self._previous
+
+            up_move = high - previous_high
+            down_move = previous_low - low
+
+            di_plus = up_move if up_move > down_move else 0.
+            di_minus = down_move if up_move < down_move else 0.
+            true_range = max(high - low, max(abs(high - previous_close),
+                abs(low - previous_close)))
+
+        self._previous = (high, low, close)
+        self._periods += 1
+
+        # Sums of the first 5 periods (the true range from the second period)
+        if self._periods <= 5:
+            self._dm_plus = self._dm_plus + di_plus
+            self._dm_minus = self._dm_minus + di_minus
+            if self._periods > 1:
+                self._true_range = self._true_range + true_range
+
+            return [math.nan, math.nan, math.nan]
+
+        if self._periods > 6:
+            self._dm_plus = self._dm_plus - self._dm_plus/5. + di_plus
+            self._dm_minus = self._dm_minus - self._dm_minus/5. + di_minus
+            self._true_range = self._true_range - self._true_range/5. + \
+                true_range
+
+        # Normalize the smoothed directional moves and calculate the DX
+        dmi_plus = _divide(100*self._dm_plus, self._true_range)
+        dmi_minus = _divide(100*self._dm_minus, self._true_range)
+
+        return [dmi_plus, dmi_minus, _divide(100*abs(dmi_plus - dmi_minus),
+            dmi_plus + dmi_minus)]
+
+
+class _AverageDirectionalIndex:
+    '''
+    State of the average directional movement index, the mean of the DX values
+    of the last 5 periods (missing values are ignored).
+
+    Args:
+        -
+
+    Attributes:
+        _dx (deque of floats): The DX values of the last 5 periods.
+
+    Methods:
+        update(): Updates the index with the DX value of a new period.
+
+    Raises:
+        -
+    '''
+    def __init__(self):
+
+        self._dx = deque(maxlen = 5)
+
+
+    def update(self, dx):
+        '''
+        Updates the index with the DX value of a new period.
+
+        Args:
+            dx (float): The DX value of the period.
+
+        Raises:
+            -
+
+        Returns:
+            float: The ADX value, NaN when the last 5 periods have no DX value.
+        '''
+
+        self._dx.append(dx)
+
+        values = [value for value in self._dx if value == value]
+
+        if len(values) == 0:
+            return math.nan
+
+        return sum(values)/len(values)
+
+
+class DMI(StreamingTI):
+    '''
+    Streaming Directional Movement Index (DMI) Technical Indicator class
+    implementation.
+
+    Args:
+        adx (boolean): If True, the Average Directional Movement Index (ADX) is
+            calculated in the same update and added as a fourth value 'ADX'.
+            Default value is False.
+
+    Attributes:
+        _adx (_AverageDirectionalIndex): The state of the ADX, None when the ADX
+            is not calculated.
+
+        _directional_movement (_DirectionalMovement): The state of the
+            directional movement.
+
+    Methods:
+        -
+
+    Raises:
+        TypeError
+
+    '''
+    def __init__(self, adx = False):
+
+        # Validate the adx argument
+        if not isinstance(adx, bool):
+            raise TypeError('The argument adx should be a `bool` but it is ' +\
+                'of type `' + str(type(adx)) + '`.')
+
+        self._adx = _AverageDirectionalIndex() if adx else None
+        self._directional_movement = _DirectionalMovement()
+
+        super().__init__(indicator_name = 'DMI', required_columns = ['High',
+            'Low', 'Close'], columns = ['DMI+', 'DMI-', 'DX'] + (['ADX'] if adx
+            else []), history = 2, required_periods = 2)
+
+
+    def _updateState(self, values):
+        '''
+        Updates the directional movement with a new bar.
+
+        Args:
+            values (tuple): The values of the required stock data of the bar.
+
+        Raises:
+            -
+
+        Returns:
+            list of floats: The 'DMI+', 'DMI-' and 'DX' values, and the 'ADX'
+                value when requested.
+        '''
+
+        dmi = self._directional_movement.update(*values)
+
+        if self._adx is not None:
+            dmi.append(self._adx.update(dmi[2]))
+
+        return dmi
+
+
+    def _signal(self):
+        '''
+        Calculates the signal from the two most recent bars, see the getSignal
+        method of the tradingti.indicators.DMI class.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            integer: The signal value.
+        '''
+
+        previous, current = self._rows
+
+        # A buy signal is given when DMI+ crosses above DMI-
+        # A sell signal is given when DMI- crosses above DMI+
+        if previous[0] > previous[1] and current[0] < current[1]:
+            return TRADE_SIGNALS['Sell']
+
+        if previous[0] < previous[1] and current[0] > current[1]:
+            return TRADE_SIGNALS['Buy']
+
+        return TRADE_SIGNALS['Hold']
+
+
+class ADX(StreamingTI):
+    '''
+    Streaming Average Directional Movement Index (ADX) Technical Indicator
+    class implementation.
+
+    Args:
+        -
+
+    Attributes:
+        _adx (_AverageDirectionalIndex): The state of the ADX.
+
+        _directional_movement (_DirectionalMovement): The state of the
+            directional movement.
+
+    Methods:
+        -
+
+    Raises:
+        -
+
+    '''
+    def __init__(self):
+
+        self._adx = _AverageDirectionalIndex()
+        self._directional_movement = _DirectionalMovement()
+
+        # The signal is calculated from the first of the input columns, as in
+        # the tradingti.indicators.ADX class for data in the usual column order
+        super().__init__(indicator_name = 'ADX', required_columns = ['High',
+            'Low', 'Close', 'Adj Close'], columns = ['ADX'], history = 3,
+            required_periods = 3)
+
+
+    def _updateState(self, values):
+        '''
+        Updates the directional movement with a new bar.
+
+        Args:
+            values (tuple): The values of the required stock data of the bar.
+
+        Raises:
+            -
+
+        Returns:
+            list of floats: The 'ADX' value.
+        '''
+
+        return [self._adx.update(self._directional_movement.update(
+            *values[:3])[2])]
+
+
+    def _signal(self):
+        '''
+        Calculates the signal from the three most recent bars, see the getSignal
+        method of the tradingti.indicators.ADX class.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            integer: The signal value.
+        '''
+
+        prices = [values[0] for values in self._inputs]
+        adx = self._rows[-1][0]
+
+        # Price drops and strong trend
+        if prices[0] > prices[1] and prices[1] > prices[2] and adx > 25:
+            return TRADE_SIGNALS['Sell']
+
+        # Price raises and strong trend
+        if prices[0] < prices[1] and prices[1] < prices[2] and adx > 25:
+            return TRADE_SIGNALS['Buy']
+
+        return TRADE_SIGNALS['Hold']
@@ -0,0 +1,209 @@
+'''
+File name: _volatility.py
+    Volatility streaming technical indicators implementation.
+    Implements the following streaming technical indicators:
+    - Bollinger Bands (BB class)
+    - Standard Deviation (SD class)
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+import math
+from ._streaming_indicator import StreamingTI
+from ._rolling_windows import _RollingMoments
+from ..indicators._volatility import _BB_TERMS
+from .._constants import *
+
+
+class BB(StreamingTI):
+    '''
+    Streaming Bollinger Bands (BB) Technical Indicator class implementation.
+
+    Args:
+        term (string): The term type for which the indicator should be
+            calculated, 'short', 'medium' or 'long'. See the
+            tradingti.indicators.BB class. Default value is 'medium'.
+
+    Attributes:
+        _term_type (string): The term type for which the indicator should be
+            calculated.
+
+        _term (tuple): The rolling window and the bands distance (in standard
+            deviations) of the term type.
+
+        _moments (_RollingMoments): The state of the rolling mean and variance
+            of the prices.
+
+    Methods:
+        -
+
+    Raises:
+        ValueError
+
+    '''
+    def __init__(self, term = 'medium'):
+
+        # Validate that term has one of the allowed values
+        if str(term) not in ['short', 'medium', 'long']:
+            raise(ValueError('Not allowed value for the \'term\' argument.' +\
+                ' It should be one of the following: \'short\', \'medium\', ' +\
+                '\'long\'. Value given is \'' + str(term) + '\'.'))
+
+        self._term_type = term
+        self._term = _BB_TERMS[term]
+        self._moments = _RollingMoments(self._term[0])
+
+        super().__init__(indicator_name = 'BB (sma = ' + str(self._term[0]) +\
+            ', std = ' + str(self._term[1]) + ')', required_columns =
+            ['Adj Close'], columns = ['SMA', 'Upper Band', 'Lower Band'],
+            history = 1, required_periods = self._term[0])
+
+
+    def _updateState(self, values):
+        '''
+        Updates the rolling mean and variance with the price of a new bar.
+
+        Args:
+            values (tuple): The values of the required stock data of the bar.
+
+        Raises:
+            -
+
+        Returns:
+            list of floats: The 'SMA', 'Upper Band' and 'Lower Band' values, the
+                bands are NaN for the first bar.
+        '''
+
+        mean, variance = self._moments.update(values[0])
+        std = math.sqrt(variance)
+
+        return [mean, mean + self._term[1]*std, mean - self._term[1]*std]
+
+
+    def _signal(self):
+        '''
+        Calculates the signal from the most recent bar, see the getSignal
+        method of the tradingti.indicators.BB class.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            integer: The signal value.
+        '''
+
+        price = self._inputs[-1][0]
+        _, upper_band, lower_band = self._rows[-1]
+
+        # Price goes above upper band
+        if price > upper_band:
+            return TRADE_SIGNALS['Sell']
+
+        # Price goes below lower band
+        if price < lower_band:
+            return TRADE_SIGNALS['Buy']
+
+        return TRADE_SIGNALS['Hold']
+
+
+class SD(StreamingTI):
+    '''
+    Streaming Standard Deviation (SD) Technical Indicator class implementation.
+
+    Args:
+        periods (int): The past periods on which standard deviation should be
+            calculated. Default value is 20.
+
+    Attributes:
+        _periods (int): The past periods on which standard deviation should be
+            calculated.
+
+        _moments (_RollingMoments): The state of the rolling mean and variance
+            of the prices.
+
+        _mean (float): The average price of the last periods, for the signal
+            calculation.
+
+    Methods:
+        -
+
+    Raises:
+        ValueError
+
+    '''
+    def __init__(self, periods = 20):
+
+        # Validate that periods is positive integer
+        if type(periods) != int or periods <= 0:
+            raise(ValueError('Not allowed value for the \'periods\' argument.'+\
+                ' It should be integer > 0. Value given is ' + str(periods) +\
+                '.'))
+
+        self._periods = periods
+        self._moments = _RollingMoments(periods)
+        self._mean = None
+
+        super().__init__(indicator_name = 'SD-' + str(periods),
+            required_columns = ['Adj Close'], columns = ['SD'], history = 1,
+            required_periods = periods)
+
+
+    def _updateState(self, values):
+        '''
+        Updates the rolling mean and variance with the price of a new bar.
+
+        Args:
+            values (tuple): The values of the required stock data of the bar.
+
+        Raises:
+            -
+
+        Returns:
+            list of floats: The 'SD' value, NaN for the first periods - 1 bars.
+        '''
+
+        self._mean, variance = self._moments.update(values[0])
+
+        if self._bars < self._periods - 1:
+            return [math.nan]
+
+        return [math.sqrt(variance)]
+
+
+    def _signal(self):
+        '''
+        Calculates the signal from the most recent bar, see the getSignal
+        method of the tradingti.indicators.SD class.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            integer: The signal value.
+        '''
+
+        price = self._inputs[-1][0]
+        sd = self._rows[-1][0]
+
+        # Price above average and volatility is high
+        if price > self._mean and sd > 3:
+            return TRADE_SIGNALS['Sell']
+
+        # Price below average and volatility is high
+        if price < self._mean and sd > 3:
+            return TRADE_SIGNALS['Buy']
+
+        return TRADE_SIGNALS['Hold']
@@ -0,0 +1,109 @@
+'''
+File name: _volume.py
+    Volume streaming technical indicators implementation.
+    Implements the following streaming technical indicators:
+    - On Balance Volume (OBV class)
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+import numbers
+from ._streaming_indicator import StreamingTI
+from .._constants import *
+
+
+class OBV(StreamingTI):
+    '''
+    Streaming On Balance Volume (OBV) Technical Indicator class implementation.
+
+    Args:
+        -
+
+    Attributes:
+        _obv (number): The running OBV, integral while the volumes of the bars
+            are integral.
+
+    Methods:
+        -
+
+    Raises:
+        -
+
+    '''
+    def __init__(self):
+
+        self._obv = None
+
+        super().__init__(indicator_name = 'OBV', required_columns = ['Volume',
+            'Adj Close'], columns = ['OBV'], history = 3, required_periods = 3)
+
+
+    def _updateState(self, values):
+        '''
+        Updates the running OBV with a new bar.
+
+        Args:
+            values (tuple): The values of the required stock data of the bar.
+
+        Raises:
+            -
+
+        Returns:
+            list of numbers: The 'OBV' value.
+        '''
+
+        volume, close = values
+
+        # OBV is kept integral when the volume is integral
+        if self._obv is None:
+            self._obv = 0 if isinstance(volume, numbers.Integral) else 0.
+            return [self._obv]
+
+        # OBV is promoted to float when a non integral volume arrives
+        if isinstance(self._obv, int) and not isinstance(volume,
+            numbers.Integral) and not float(volume).is_integer():
+            self._obv = float(self._obv)
+
+        volume = int(volume) if isinstance(self._obv, int) else float(volume)
+
+        # Volume is added when today's close is greater than yesterday's close,
+        # subtracted when it is less and ignored when it is equal
+        previous_close = self._inputs[-1][1]
+        close_direction = (close > previous_close) - (close < previous_close)
+
+        self._obv += type(self._obv)(close_direction)*volume
+
+        return [self._obv]
+
+
+    def _signal(self):
+        '''
+        Calculates the signal from the three most recent bars, see the getSignal
+        method of the tradingti.indicators.OBV class.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            integer: The signal value.
+        '''
+
+        obv = [row[0] for row in self._rows]
+
+        if obv[0] > obv[1] and obv[1] > obv[2]:
+            return TRADE_SIGNALS['Sell']
+
+        if obv[0] < obv[1] and obv[1] < obv[2]:
+            return TRADE_SIGNALS['Buy']
+
+        return TRADE_SIGNALS['Hold']
@@ -0,0 +1,131 @@
+'''
+File name: _momentum.py
+    Momentum streaming technical indicators of several symbols implementation.
+    Implements the following streaming technical indicators:
+    - Relative Strength Index (RSI class)
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+import numpy as np
+from ._streaming_panel_indicator import StreamingPanelTI
+from ._panel_states import _RollingSums
+from ..._constants import *
+
+
+class RSI(StreamingPanelTI):
+    '''
+    Streaming Relative Strength Index (RSI) Technical Indicator of several
+    symbols class implementation. The total upward and downward price changes
+    are summed as in the tradingti.indicators.RSI class.
+
+    Args:
+        symbols (int): The number of the symbols.
+
+        look_back (int): Look back days for calculating the averages needed by
+            the RSI. Default value is 14.
+
+    Attributes:
+        _look_back (int): Look back days for calculating the averages needed by
+            the RSI.
+
+        _upward_changes, _downward_changes (_RollingSums): The state of the
+            total upward and downward price changes in the look_back window.
+
+    Methods:
+        -
+
+    Raises:
+        ValueError
+
+    '''
+    def __init__(self, symbols, look_back = 14):
+
+        # Validate look_back values
+        if type(look_back) != int or look_back <= 0:
+            raise(ValueError('`look_back` argument should be a positive ' +\
+                'integer, but look_back = ' + str(look_back) + '.'))
+
+        super().__init__(indicator_name = 'RSI-' + str(look_back),
+            required_columns = ['Adj Close'], columns = ['RSI'], history = 2,
+            required_periods = max(look_back, 2), symbols = symbols)
+
+        self._look_back = look_back
+        self._upward_changes = _RollingSums(look_back, symbols)
+        self._downward_changes = _RollingSums(look_back, symbols)
+
+
+    def _updateState(self, symbol_ids, values):
+        '''
+        Updates the upward and downward price changes with a new bar.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+            values (numpy array): The values of the required stock data of the
+                bars.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The 'RSI' values, NaN for the first look_back bars of
+                a symbol.
+        '''
+
+        rsi = np.full((len(symbol_ids), 1), np.nan, dtype = np.float64)
+
+        # The price changes start from the second bar of a symbol
+        bars = self._bars[symbol_ids]
+        changed = bars > 0
+        symbol_ids = symbol_ids[changed]
+
+        # Upward and downward price change of the bar
+        delta = values[changed, 0] - self._recentInputs(symbol_ids, 0)[:, 0]
+
+        upward_total = self._upward_changes.update(symbol_ids, np.where(
+            delta >= 0., delta, 0.))
+        downward_total = self._downward_changes.update(symbol_ids, np.where(
+            delta < 0., -delta, 0.))
+
+        # Calculate the averages for upward and downward changes
+        upward_average = upward_total/self._look_back
+        downward_average = downward_total/self._look_back
+
+        rsi[changed, 0] = np.where(bars[changed] < self._look_back, np.nan,
+            np.where(downward_average == 0., 100., 100-(100/(1+(
+            upward_average/downward_average)))))
+
+        return rsi
+
+
+    def _signal(self, symbol_ids):
+        '''
+        Calculates the signal from the two most recent bars, see the getSignal
+        method of the tradingti.indicators.RSI class.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The signal values.
+        '''
+
+        previous = self._recentRows(symbol_ids, 1)[:, 0]
+        current = self._recentRows(symbol_ids, 0)[:, 0]
+
+        # Overbought region
+        # Oversold region
+        return np.where((previous < 70.) & (current > 70.),
+            TRADE_SIGNALS['Sell'], np.where((previous > 30.) & (current < 30.),
+            TRADE_SIGNALS['Buy'], TRADE_SIGNALS['Hold']))
@@ -0,0 +1,502 @@
+'''
+File name: _panel_states.py
+    States of the streaming technical indicators of several symbols. Each state
+    keeps numpy arrays with one slot for each symbol, and updates the slots of
+    a micro-batch of symbols with vectorized operations. The operations are the
+    ones of the states of the tradingti.streaming package, applied element
+    wise, so the updated values are the same.
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+import numpy as np
+from ...utils._rolling_kernels import _blockLength
+
+
+class _ExponentialMeans:
+    '''
+    State of the exponential moving average of each symbol, see the
+    _ExponentialMean class of the tradingti.streaming package.
+
+    Args:
+        span (int): The span period from which the decay is calculated.
+
+        symbols (int): The number of the symbols.
+
+    Attributes:
+        _old_weight_factor (float): The decay of the weight of the past values
+            in each update.
+
+        _old_weights (numpy array): The total weight of the past values of each
+            symbol.
+
+        _means (numpy array): The current value of the average of each symbol.
+
+        _started (numpy array): True for the symbols updated at least once.
+
+    Methods:
+        update(): Updates the averages with a new value for several symbols.
+
+    Raises:
+        -
+    '''
+    def __init__(self, span, symbols):
+
+        self._old_weight_factor = 1. - 1./(1. + (span - 1)/2.)
+        self._old_weights = np.ones(symbols, dtype = np.float64)
+        self._means = np.full(symbols, np.nan, dtype = np.float64)
+        self._started = np.zeros(symbols, dtype = bool)
+
+
+    def update(self, symbol_ids, values):
+        '''
+        Updates the averages with a new value for several symbols.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+            values (numpy array): The new value of each symbol.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The updated average of each symbol.
+        '''
+
+        first = ~self._started[symbol_ids]
+        old_weights = np.where(first, 1., self._old_weights[symbol_ids]*
+            self._old_weight_factor)
+        means = self._means[symbol_ids]
+
+        # Avoid numerical errors on constant series
+        means = np.where(first, values, np.where(means != values, (old_weights*
+            means + values)/(old_weights + 1.), means))
+
+        self._old_weights[symbol_ids] = np.where(first, old_weights,
+            old_weights + 1.)
+        self._means[symbol_ids] = means
+        self._started[symbol_ids] = True
+
+        return means
+
+
+class _RollingMoments:
+    '''
+    State of the rolling mean and variance of each symbol for a window, see the
+    _RollingMoments class of the tradingti.streaming package. The running sums
+    before each of the last periods are kept in a ring buffer with one slot for
+    each symbol.
+
+    Args:
+        window (int): The rolling window.
+
+        symbols (int): The number of the symbols.
+
+        ddof (int): Delta degrees of freedom of the variance. Default value is
+            1.
+
+    Attributes:
+        _window (int): The rolling window.
+
+        _ddof (int): Delta degrees of freedom of the variance.
+
+        _block (int): The length of the blocks in which the running sums
+            restart.
+
+        _periods (numpy array): The number of the periods updated for each
+            symbol.
+
+        _references, _previous_references (numpy array): The reference value of
+            the current and of the previous block of each symbol.
+
+        _sums, _squares (numpy array): The running sums of the deviations and of
+            their squares in the current block of each symbol.
+
+        _previous_sums, _previous_squares (numpy array): The totals of the
+            previous block of each symbol.
+
+        _exclusive_sums, _exclusive_squares (numpy array): Ring buffers of
+            shape (window, symbols) with the running sums before each
+            of the last periods.
+
+        _last_values (numpy array): The value of the previous period of each
+            symbol.
+
+        _run_lengths (numpy array): The number of the last periods with equal
+            values of each symbol.
+
+    Methods:
+        update(): Updates the moments with a new value for several symbols.
+
+    Raises:
+        -
+    '''
+    def __init__(self, window, symbols, ddof = 1):
+
+        self._window = window
+        self._ddof = ddof
+        self._block = _blockLength(window)
+
+        self._periods = np.zeros(symbols, dtype = np.int64)
+        self._references = np.zeros(symbols, dtype = np.float64)
+        self._previous_references = np.zeros(symbols, dtype = np.float64)
+        self._sums = np.zeros(symbols, dtype = np.float64)
+        self._squares = np.zeros(symbols, dtype = np.float64)
+        self._previous_sums = np.zeros(symbols, dtype = np.float64)
+        self._previous_squares = np.zeros(symbols, dtype = np.float64)
+        self._exclusive_sums = np.zeros((window, symbols), dtype = np.float64)
+        self._exclusive_squares = np.zeros((window, symbols),
+            dtype = np.float64)
+
+        self._last_values = np.full(symbols, np.nan, dtype = np.float64)
+        self._run_lengths = np.zeros(symbols, dtype = np.int64)
+
+
+    def update(self, symbol_ids, values):
+        '''
+        Updates the moments with a new value for several symbols.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+            values (numpy array): The new value of each symbol.
+
+        Raises:
+            -
+
+        Returns:
+            tuple (numpy array, numpy array): The rolling mean and variance of
+                the window, for each symbol. The variance is NaN when the
+                window contains ddof values or less.
+        '''
+
+        periods = self._periods[symbol_ids]
+        block_periods = periods % self._block
+
+        # A new block, restart the running sums from its first value
+        new_block = block_periods == 0
+
+        references = self._references[symbol_ids]
+        sums = self._sums[symbol_ids]
+        squares = self._squares[symbol_ids]
+
+        previous_references = np.where(new_block, references,
+            self._previous_references[symbol_ids])
+        previous_sums = np.where(new_block, sums,
+            self._previous_sums[symbol_ids])
+        previous_squares = np.where(new_block, squares,
+            self._previous_squares[symbol_ids])
+
+        references = np.where(new_block, values, references)
+        sums = np.where(new_block, 0., sums)
+        squares = np.where(new_block, 0., squares)
+
+        slots = periods % len(self._exclusive_sums)
+        self._exclusive_sums[slots, symbol_ids] = sums
+        self._exclusive_squares[slots, symbol_ids] = squares
+
+        deviations = values - references
+        sums = sums + deviations
+        squares = squares + deviations*deviations
+
+        run_lengths = np.where(values == self._last_values[symbol_ids],
+            self._run_lengths[symbol_ids] + 1, 1)
+
+        self._periods[symbol_ids] = periods + 1
+        self._references[symbol_ids] = references
+        self._previous_references[symbol_ids] = previous_references
+        self._sums[symbol_ids] = sums
+        self._squares[symbol_ids] = squares
+        self._previous_sums[symbol_ids] = previous_sums
+        self._previous_squares[symbol_ids] = previous_squares
+        self._last_values[symbol_ids] = values
+        self._run_lengths[symbol_ids] = run_lengths
+
+        window = self._window
+        counts = np.minimum(periods + 1, window)
+
+        start_slots = (periods - window + 1) % len(self._exclusive_sums)
+        start_sums = self._exclusive_sums[start_slots, symbol_ids]
+        start_squares = self._exclusive_squares[start_slots, symbol_ids]
+
+        # Windows crossing a block boundary, the part in the previous block is
+        # moved to the reference of the current block
+        previous_part = previous_sums - start_sums
+        previous_counts = window - 1 - block_periods
+        shifts = previous_references - references
+
+        crossing = block_periods < window - 1
+        partial = periods < window - 1
+
+        window_sums = np.where(partial, sums, np.where(crossing, sums +
+            previous_part + previous_counts*shifts, sums - start_sums))
+        window_squares = np.where(partial, squares, np.where(crossing,
+            squares + previous_squares - start_squares + 2*shifts*
+            previous_part + previous_counts*(shifts*shifts), squares -
+            start_squares))
+
+        constant = run_lengths >= counts
+
+        relative_means = window_sums/counts
+        means = np.where(constant, values, references + relative_means)
+
+        variances = np.where(counts <= self._ddof, np.nan, np.where(
+            constant, 0., np.maximum((window_squares - window_sums*
+            relative_means)/(counts - self._ddof), 0.)))
+
+        return means, variances
+
+
+class _RollingSums:
+    '''
+    State of the rolling sum of each symbol, see the _RollingSum class of the
+    tradingti.streaming package. The running sums and running errors of the
+    last periods are kept in ring buffers with one slot for each symbol.
+
+    Args:
+        window (int): The rolling window.
+
+        symbols (int): The number of the symbols.
+
+    Attributes:
+        _sums, _errors (numpy array): The running sum of the values and of the
+            rounding errors of the running sum, for each symbol.
+
+        _previous_sums, _previous_errors (numpy array): Ring buffers of shape
+            (window, symbols) with the running sums and the running errors of
+            the last periods of each symbol.
+
+        _periods (numpy array): The number of the periods updated for each
+            symbol.
+
+    Methods:
+        update(): Updates the sums with a new value for several symbols.
+
+    Raises:
+        -
+    '''
+    def __init__(self, window, symbols):
+
+        self._sums = np.zeros(symbols, dtype = np.float64)
+        self._errors = np.zeros(symbols, dtype = np.float64)
+        self._previous_sums = np.zeros((window, symbols), dtype = np.float64)
+        self._previous_errors = np.zeros((window, symbols), dtype = np.float64)
+        self._periods = np.zeros(symbols, dtype = np.int64)
+
+
+    def update(self, symbol_ids, values):
+        '''
+        Updates the sums with a new value for several symbols.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+            values (numpy array): The new value of each symbol.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The sum of the values in the window, for each symbol.
+        '''
+
+        sums = self._sums[symbol_ids]
+
+        # Rounding error of the addition (two-sum)
+        running_sums = sums + values
+        added = running_sums - sums
+        errors = self._errors[symbol_ids] + ((sums - (running_sums - added)) +
+            (values - added))
+
+        # The slot of the period leaving the window, zeros before the window
+        # is full
+        slots = (self._periods[symbol_ids] + 1) % len(self._previous_sums)
+        start_sums = self._previous_sums[slots, symbol_ids]
+        start_errors = self._previous_errors[slots, symbol_ids]
+
+        self._previous_sums[slots, symbol_ids] = running_sums
+        self._previous_errors[slots, symbol_ids] = errors
+        self._sums[symbol_ids] = running_sums
+        self._errors[symbol_ids] = errors
+        self._periods[symbol_ids] += 1
+
+        return (running_sums - start_sums) + (errors - start_errors)
+
+
+class _DirectionalMovements:
+    '''
+    State of the smoothed directional movement of each symbol, see the
+    _DirectionalMovement class of the tradingti.streaming package.
+
+    Args:
+        symbols (int): The number of the symbols.
+
+    Attributes:
+        _periods (numpy array): The number of the periods updated for each
+            symbol.
+
+        _previous (numpy array): Array of shape (symbols, 3) with the 'High',
+            'Low' and 'Close' of the previous period of each symbol.
+
+        _dm_plus, _dm_minus, _true_range (numpy array): The smoothed
+            directional moves and true range of each symbol (sums until the 5th
+            period).
+
+    Methods:
+        update(): Updates the directional movement with a new period for
+            several symbols.
+
+    Raises:
+        -
+    '''
+    def __init__(self, symbols):
+
+        self._periods = np.zeros(symbols, dtype = np.int64)
+        self._previous = np.full((symbols, 3), np.nan, dtype = np.float64)
+        self._dm_plus = np.zeros(symbols, dtype = np.float64)
+        self._dm_minus = np.zeros(symbols, dtype = np.float64)
+        self._true_range = np.zeros(symbols, dtype = np.float64)
+
+
+    def update(self, symbol_ids, high, low, close):
+        '''
+        Updates the directional movement with a new period for several symbols.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+            high (numpy array): The 'High' price of each symbol.
+
+            low (numpy array): The 'Low' price of each symbol.
+
+            close (numpy array): The 'Close' price of each symbol.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: Array of shape (len(symbol_ids), 3) with the 'DMI+',
+                'DMI-' and 'DX' values, NaN for the first 5 periods.
+        '''
+
+        previous_high, previous_low, previous_close = \
+            self._previous[symbol_ids].T
+
+        # Directional moves and true range (not defined for the first period)
+        first = self._periods[symbol_ids] == 0
+
+        up_move = high - previous_high
+        down_move = previous_low - low
+
+        di_plus = np.where(first, 0., np.where(up_move > down_move, up_move,
+            0.))
+        di_minus = np.where(first, 0., np.where(up_move < down_move,
+            down_move, 0.))
+        true_range = np.where(first, np.nan, np.maximum(high - low,
+            np.maximum(np.abs(high - previous_close), np.abs(low -
+            previous_close))))
+
+        self._previous[symbol_ids] = np.column_stack([high, low, close])
+
+        periods = self._periods[symbol_ids] + 1
+        self._periods[symbol_ids] = periods
+
+        # Sums of the first 5 periods (the true range from the second period),
+        # then S(i) = S(i-1) - S(i-1)/5 + X(i) from the 7th period
+        summed = periods <= 5
+        smoothed = periods > 6
+
+        dm_plus = self._dm_plus[symbol_ids]
+        dm_minus = self._dm_minus[symbol_ids]
+        true_range_sum = self._true_range[symbol_ids]
+
+        dm_plus = np.where(summed, dm_plus + di_plus, np.where(smoothed,
+            dm_plus - dm_plus/5. + di_plus, dm_plus))
+        dm_minus = np.where(summed, dm_minus + di_minus, np.where(smoothed,
+            dm_minus - dm_minus/5. + di_minus, dm_minus))
+        true_range_sum = np.where(summed, np.where(periods > 1,
+            true_range_sum + true_range, true_range_sum), np.where(smoothed,
+            true_range_sum - true_range_sum/5. + true_range, true_range_sum))
+
+        self._dm_plus[symbol_ids] = dm_plus
+        self._dm_minus[symbol_ids] = dm_minus
+        self._true_range[symbol_ids] = true_range_sum
+
+        # Normalize the smoothed directional moves and calculate the DX
+        dmi_plus = 100*dm_plus/true_range_sum
+        dmi_minus = 100*dm_minus/true_range_sum
+        dx = 100*np.abs(dmi_plus - dmi_minus)/(dmi_plus + dmi_minus)
+
+        return np.where(summed[:, None], np.nan, np.column_stack([dmi_plus,
+            dmi_minus, dx]))
+
+
+class _AverageDirectionalIndices:
+    '''
+    State of the average directional movement index of each symbol, see the
+    _AverageDirectionalIndex class of the tradingti.streaming package.
+
+    Args:
+        symbols (int): The number of the symbols.
+
+    Attributes:
+        _dx (numpy array): Ring buffer of shape (5, symbols) with the DX values
+            of the last 5 periods of each symbol.
+
+        _periods (numpy array): The number of the periods updated for each
+            symbol.
+
+    Methods:
+        update(): Updates the index with the DX value of a new period for
+            several symbols.
+
+    Raises:
+        -
+    '''
+    def __init__(self, symbols):
+
+        self._dx = np.full((5, symbols), np.nan, dtype = np.float64)
+        self._periods = np.zeros(symbols, dtype = np.int64)
+
+
+    def update(self, symbol_ids, dx):
+        '''
+        Updates the index with the DX value of a new period for several
+        symbols.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+            dx (numpy array): The DX value of each symbol.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The ADX value of each symbol, NaN when the last 5
+                periods have no DX value.
+        '''
+
+        periods = self._periods[symbol_ids]
+        self._dx[periods % 5, symbol_ids] = dx
+        self._periods[symbol_ids] = periods + 1
+
+        # Missing values are skipped, the values are summed from the oldest one
+        totals = np.zeros(len(symbol_ids), dtype = np.float64)
+        counts = np.zeros(len(symbol_ids), dtype = np.int64)
+
+        for lag in range(4, -1, -1):
+            values = self._dx[(periods - lag) % 5, symbol_ids]
+            observed = ~np.isnan(values)
+            totals = np.where(observed, totals + values, totals)
+            counts += observed
+
+        return np.where(counts == 0, np.nan, totals/counts)
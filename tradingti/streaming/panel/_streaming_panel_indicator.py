@@ -0,0 +1,371 @@
+'''
+File name: _streaming_panel_indicator.py
+    Parent class for all the streaming technical indicators of several symbols.
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+import numpy as np
+from abc import ABC, abstractmethod
+from ..._constants import *
+
+
+class StreamingPanelTI(ABC):
+    '''
+    Streaming Panel Technical Indicators class implementation. Is used as a
+    parent class for each streaming technical indicator of several symbols. The
+    state of the indicator is kept in numpy arrays with one slot for each
+    symbol, and the symbols of a micro-batch (for example all the symbols whose
+    bar closed at the same time) are updated together, with one vectorized
+    operation for each step of the update. The values and the signal calculated
+    for each symbol are the ones of the streaming indicator (tradingti.streaming
+    package) updated with the bars of this symbol.
+
+    Args:
+        indicator_name (string): The name of the Technical Indicator.
+
+        required_columns (list of strings): The stock data required in each bar.
+
+        columns (list of strings): The names of the calculated values.
+
+        history (int): The number of the most recent bars (input and calculated
+            values) kept for the signal calculation.
+
+        required_periods (int): The number of bars the indicator and its signal
+            rules require, see the getSignals method of the technical
+            indicator. The signal of the earlier bars of a symbol is 'Hold'.
+
+        symbols (int): The number of the symbols, the symbol ids are 0 to
+            symbols - 1.
+
+    Attributes:
+        _indicator_name (string): The name of the Technical Indicator.
+
+        _required_columns (list of strings): The stock data required in each
+            bar.
+
+        _columns (list of strings): The names of the calculated values.
+
+        _history (int): The number of the most recent bars kept.
+
+        _required_periods (int): The number of bars the indicator and its
+            signal rules require.
+
+        _symbols (int): The number of the symbols.
+
+        _inputs (numpy array): Ring buffer of shape (history, symbols,
+            len(required_columns)) with the input values of the most recent bars
+            of each symbol.
+
+        _rows (numpy array): Ring buffer of shape (history, symbols,
+            len(columns)) with the calculated values of the most recent bars of
+            each symbol.
+
+        _bars (numpy array): The number of bars each symbol was updated with.
+
+    Methods:
+        updateMany(): Updates the indicator with a new bar for several symbols.
+
+        getColumns(): Returns the names of the calculated values.
+
+        getTiValues(): Returns the calculated values of the most recent bar of
+            each symbol.
+
+    Raises:
+        ValueError
+    '''
+    def __init__(self, indicator_name, required_columns, columns, history,
+        required_periods, symbols):
+
+        # Validate that symbols is a positive integer
+        if type(symbols) != int or symbols <= 0:
+            raise ValueError('The argument symbols should be a positive ' +\
+                'integer, but it is ' + str(symbols) + '.')
+
+        self._indicator_name = indicator_name
+        self._required_columns = required_columns
+        self._columns = columns
+        self._history = history
+        self._required_periods = max(required_periods, history)
+        self._symbols = symbols
+
+        self._inputs = np.full((history, symbols, len(required_columns)),
+            np.nan, dtype = np.float64)
+        self._rows = np.full((history, symbols, len(columns)), np.nan,
+            dtype = np.float64)
+        self._bars = np.zeros(symbols, dtype = np.int64)
+
+
+    def _symbolIds(self, symbol_ids):
+        '''
+        Validates the symbol ids of a micro-batch.
+
+        Args:
+            symbol_ids (array-like of integers): The ids of the symbols.
+
+        Raises:
+            TypeError
+            ValueError
+
+        Returns:
+            numpy array: The ids of the symbols.
+        '''
+
+        symbol_ids = np.asarray(symbol_ids)
+
+        if symbol_ids.ndim != 1 or not (symbol_ids.size == 0 or
+            np.issubdtype(symbol_ids.dtype, np.integer)):
+            raise TypeError('The symbol ids should be a one dimensional ' +\
+                'array of integers, but they are of dtype `' +\
+                str(symbol_ids.dtype) + '` and shape ' +\
+                str(symbol_ids.shape) + '.')
+
+        symbol_ids = symbol_ids.astype(np.intp)
+
+        if np.any((symbol_ids < 0) | (symbol_ids >= self._symbols)):
+            raise ValueError('The symbol ids should be in the range [0, ' +\
+                str(self._symbols) + '), ids out of range: ' + str(
+                symbol_ids[(symbol_ids < 0) | (symbol_ids >= self._symbols)].
+                tolist()) + '.')
+
+        if len(np.unique(symbol_ids)) != len(symbol_ids):
+            raise ValueError('A symbol can be updated only once in each ' +\
+                'micro-batch, but the symbol ids contain duplicates.')
+
+        return symbol_ids
+
+
+    def _barValues(self, symbol_ids, bars):
+        '''
+        Validates the bars of a micro-batch and returns the values of the
+        required stock data. A missing value (NaN) is filled with the value of
+        the previous bar of the symbol, as the forward pass of the
+        fillMissingValues method.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+            bars (dictionary or pandas.DataFrame): The stock data of the bars,
+                as stock data name: array-like with one value for each symbol
+                id.
+
+        Raises:
+            TypeError
+            ValueError
+
+        Returns:
+            numpy array: Array of shape (len(symbol_ids),
+                len(required_columns)) with the values of the required stock
+                data.
+        '''
+
+        values = np.empty((len(symbol_ids), len(self._required_columns)),
+            dtype = np.float64)
+
+        for i, column in enumerate(self._required_columns):
+            try:
+                column_values = np.asarray(bars[column])
+            except (KeyError, IndexError, TypeError):
+                raise ValueError('Required column `' + column + '` for the ' +\
+                    'technical indicator `' + self._indicator_name + '` was ' +\
+                    'not found in the bars.')
+
+            if not np.issubdtype(column_values.dtype, np.number):
+                raise TypeError('The bars must hold values of numeric type. ' +\
+                    'column `' + column + '` is of dtype `' +\
+                    str(column_values.dtype) + '`.')
+
+            if column_values.shape != symbol_ids.shape:
+                raise ValueError('The bars must hold one value for each ' +\
+                    'symbol id. column `' + column + '` is of shape ' +\
+                    str(column_values.shape) + ', symbols = ' +\
+                    str(len(symbol_ids)) + '.')
+
+            values[:, i] = column_values
+
+        missing = np.isnan(values)
+
+        if np.any(missing):
+            if np.any(missing & (self._bars[symbol_ids] == 0)[:, None]):
+                raise ValueError('The values of the first bar of a symbol ' +\
+                    'cannot be missing.')
+
+            values = np.where(missing, self._recentInputs(symbol_ids, 0),
+                values)
+
+        return values
+
+
+    def _recentInputs(self, symbol_ids, lag):
+        '''
+        Returns the input values of a recent bar of the symbols.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+            lag (int): The position of the bar from the most recent stored one,
+                0 is the most recent bar.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: Array of shape (len(symbol_ids),
+                len(required_columns)), NaN for the symbols without this bar.
+        '''
+
+        return self._inputs[(self._bars[symbol_ids] - 1 - lag) %
+            self._history, symbol_ids]
+
+
+    def _recentRows(self, symbol_ids, lag):
+        '''
+        Returns the calculated values of a recent bar of the symbols.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+            lag (int): The position of the bar from the most recent stored one,
+                0 is the most recent bar.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: Array of shape (len(symbol_ids), len(columns)), NaN for
+                the symbols without this bar.
+        '''
+
+        return self._rows[(self._bars[symbol_ids] - 1 - lag) % self._history,
+            symbol_ids]
+
+
+    @abstractmethod
+    def _updateState(self, symbol_ids, values):
+        '''
+        Abstract method for updating the state of the indicator with the values
+        of a new bar for several symbols. The implemented method should return
+        the calculated values, an array of shape (len(symbol_ids),
+        len(columns)).
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+            values (numpy array): The values of the required stock data of the
+                bars.
+
+        Raises:
+            -
+
+        Returns:
+            -
+        '''
+
+        pass
+
+
+    @abstractmethod
+    def _signal(self, symbol_ids):
+        '''
+        Abstract method for the signal calculation from the most recent bars of
+        several symbols. The implemented method should return the signal value
+        of each symbol, see TRADE_SIGNALS package constant.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+        Raises:
+            -
+
+        Returns:
+            -
+        '''
+
+        pass
+
+
+    def updateMany(self, symbol_ids, bars):
+        '''
+        Updates the indicator with a new bar for several symbols, with
+        vectorized operations over the symbols.
+
+        Args:
+            symbol_ids (array-like of integers): The ids of the symbols, each
+                symbol at most once.
+
+            bars (dictionary or pandas.DataFrame): The stock data of the bars,
+                as stock data name: array-like with one value for each symbol
+                id. It should contain the stock data required by the indicator.
+
+        Raises:
+            TypeError
+            ValueError
+
+        Returns:
+            tuple (numpy array, numpy array): The calculated values of the
+                indicator, of shape (len(symbol_ids), len(columns)), and the
+                trading signal value of each symbol (see TRADE_SIGNALS package
+                constant). Until the bars required by the indicator and its
+                signal rules are available for a symbol, its signal is 'Hold'.
+        '''
+
+        symbol_ids = self._symbolIds(symbol_ids)
+        values = self._barValues(symbol_ids, bars)
+
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            rows = self._updateState(symbol_ids, values)
+
+        slots = self._bars[symbol_ids] % self._history
+        self._inputs[slots, symbol_ids] = values
+        self._rows[slots, symbol_ids] = rows
+        self._bars[symbol_ids] += 1
+
+        with np.errstate(invalid = 'ignore'):
+            signals = np.where(self._bars[symbol_ids] >=
+                self._required_periods, self._signal(symbol_ids),
+                TRADE_SIGNALS['Hold'])
+
+        return rows, signals.astype(np.int64)
+
+
+    def getColumns(self):
+        '''
+        Returns the names of the calculated values, the columns of the data
+        frame returned by the getTiData method of the technical indicator.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            list of strings: The names of the calculated values.
+        '''
+
+        return list(self._columns)
+
+
+    def getTiValues(self):
+        '''
+        Returns the calculated values of the most recent bar of each symbol.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: Array of shape (symbols, len(columns)), NaN for the
+                symbols not updated yet.
+        '''
+
+        return self._recentRows(np.arange(self._symbols), 0)
@@ -0,0 +1,518 @@
+'''
+File name: _trend.py
+    Trend streaming technical indicators of several symbols implementation.
+    Implements the following streaming technical indicators:
+    - Simple Moving Average (SMA class)
+    - Exponential Moving Average (EMA class)
+    - Moving Average Convergence Divergence (MACD class)
+    - Average Directional Movement Index (ADX class)
+    - Directional Movement Index (DMI class)
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+import numpy as np
+from ._streaming_panel_indicator import StreamingPanelTI
+from ._panel_states import _ExponentialMeans, _RollingMoments, \
+    _DirectionalMovements, _AverageDirectionalIndices
+from .._trend import _validatePeriods
+from ..._constants import *
+
+
+def _movingAverageSignals(previous_prices, prices, previous_rows, rows,
+    periods):
+    '''
+    Calculates the signal of a moving average indicator for several symbols,
+    see the _movingAverageSignal function of the tradingti.streaming package.
+
+    Args:
+        previous_prices, prices (numpy array): The price of the previous and of
+            the most recent bar of each symbol.
+
+        previous_rows, rows (numpy array): The calculated values of the previous
+            and of the most recent bar of each symbol, one column for each
+            period.
+
+        periods (list of integers): The periods of the moving averages.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: The signal value of each symbol, see TRADE_SIGNALS package
+            constant. When one period is given, the long term signal.
+    '''
+
+    long_term = periods.index(max(periods))
+
+    # Prices crosses the long term MA
+    signals = np.where((previous_prices - previous_rows[:, long_term])*(
+        prices - rows[:, long_term]) < 0, np.where(prices - rows[:, long_term]
+        > 0, TRADE_SIGNALS['Buy'], TRADE_SIGNALS['Sell']),
+        TRADE_SIGNALS['Hold'])
+
+    if len(periods) == 1:
+        return signals
+
+    short_term = periods.index(min(periods))
+
+    # MAs crosses each other
+    signals += np.where((previous_rows[:, short_term] - previous_rows[:,
+        long_term])*(rows[:, short_term] - rows[:, long_term]) < 0, np.where(
+        rows[:, short_term] - rows[:, long_term] > 0, TRADE_SIGNALS['Buy'],
+        TRADE_SIGNALS['Sell']), 0)
+
+    # Normalize signal if needed
+    return np.where(np.abs(signals) == 2, signals//2, signals)
+
+
+class SMA(StreamingPanelTI):
+    '''
+    Streaming Simple Moving Average (SMA) Technical Indicator of several symbols
+    class implementation.
+
+    Args:
+        symbols (int): The number of the symbols.
+
+        sma_periods (object): The sma periods for which the rolling mean of the
+            prices is calculated, see the tradingti.streaming.SMA class.
+            Default values are [50, 200].
+
+    Attributes:
+        _sma_periods (object): The sma periods for which the rolling mean of the
+            prices is calculated.
+
+        _moments (list of _RollingMoments): The state of the rolling mean of
+            each sma period.
+
+    Methods:
+        -
+
+    Raises:
+        TypeError
+        ValueError
+
+    '''
+    def __init__(self, symbols, sma_periods = [50, 200]):
+
+        _validatePeriods(sma_periods)
+
+        super().__init__(indicator_name = 'SMA-' + str(sma_periods),
+            required_columns = ['Adj Close'], columns = ['SMA-' + str(x) for x
+            in sma_periods], history = 2, required_periods = max(max(
+            sma_periods), 2), symbols = symbols)
+
+        self._sma_periods = sma_periods
+        self._moments = [_RollingMoments(x, symbols) for x in sma_periods]
+
+
+    def _updateState(self, symbol_ids, values):
+        '''
+        Updates the rolling mean of each sma period with the prices of a new
+        bar.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+            values (numpy array): The values of the required stock data of the
+                bars.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The SMA of each sma period.
+        '''
+
+        return np.column_stack([moments.update(symbol_ids, values[:, 0])[0]
+            for moments in self._moments])
+
+
+    def _signal(self, symbol_ids):
+        '''
+        Calculates the signal from the two most recent bars, see the getSignal
+        method of the tradingti.indicators.SMA class.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The signal values.
+        '''
+
+        return _movingAverageSignals(self._recentInputs(symbol_ids, 1)[:, 0],
+            self._recentInputs(symbol_ids, 0)[:, 0], self._recentRows(
+            symbol_ids, 1), self._recentRows(symbol_ids, 0), self._sma_periods)
+
+
+class EMA(StreamingPanelTI):
+    '''
+    Streaming Exponential Moving Average (EMA) Technical Indicator of several
+    symbols class implementation.
+
+    Args:
+        symbols (int): The number of the symbols.
+
+        span_periods (object): The span periods from which the decay is
+            calculated, see the tradingti.streaming.EMA class. Default values
+            are [26, 200].
+
+    Attributes:
+        _span_periods (object): The span periods from which the decay is
+            calculated.
+
+        _means (list of _ExponentialMeans): The state of the average of each
+            span period.
+
+    Methods:
+        -
+
+    Raises:
+        TypeError
+        ValueError
+
+    '''
+    def __init__(self, symbols, span_periods = [26, 200]):
+
+        _validatePeriods(span_periods)
+
+        super().__init__(indicator_name = 'EMA-' + str(span_periods),
+            required_columns = ['Adj Close'], columns = ['EMA-' + str(x) for x
+            in span_periods], history = 2, required_periods = max(max(
+            span_periods), 2), symbols = symbols)
+
+        self._span_periods = span_periods
+        self._means = [_ExponentialMeans(span, symbols) for span in
+            span_periods]
+
+
+    def _updateState(self, symbol_ids, values):
+        '''
+        Updates the average of each span period with the prices of a new bar.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+            values (numpy array): The values of the required stock data of the
+                bars.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The EMA of each span period.
+        '''
+
+        return np.column_stack([mean.update(symbol_ids, values[:, 0]) for mean
+            in self._means])
+
+
+    def _signal(self, symbol_ids):
+        '''
+        Calculates the signal from the two most recent bars, see the getSignal
+        method of the tradingti.indicators.EMA class.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The signal values.
+        '''
+
+        return _movingAverageSignals(self._recentInputs(symbol_ids, 1)[:, 0],
+            self._recentInputs(symbol_ids, 0)[:, 0], self._recentRows(
+            symbol_ids, 1), self._recentRows(symbol_ids, 0),
+            self._span_periods)
+
+
+class MACD(StreamingPanelTI):
+    '''
+    Streaming Moving Average Convergence Divergence (MACD) Technical Indicator
+    of several symbols class implementation.
+
+    Args:
+        symbols (int): The number of the symbols.
+
+    Attributes:
+        _ema_12 (_ExponentialMeans): The state of the 12 periods EMA of the
+            prices.
+
+        _ema_26 (_ExponentialMeans): The state of the 26 periods EMA of the
+            prices.
+
+        _signal_line (_ExponentialMeans): The state of the 9 periods EMA of the
+            MACD line.
+
+    Methods:
+        -
+
+    Raises:
+        ValueError
+
+    '''
+    def __init__(self, symbols):
+
+        super().__init__(indicator_name = 'MACD', required_columns =
+            ['Adj Close'], columns = ['MACD', 'Signal Line'], history = 2,
+            required_periods = 26, symbols = symbols)
+
+        self._ema_12 = _ExponentialMeans(12, symbols)
+        self._ema_26 = _ExponentialMeans(26, symbols)
+        self._signal_line = _ExponentialMeans(9, symbols)
+
+
+    def _updateState(self, symbol_ids, values):
+        '''
+        Updates the EMAs with the prices of a new bar.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+            values (numpy array): The values of the required stock data of the
+                bars.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The 'MACD' and the 'Signal Line' values.
+        '''
+
+        macd = self._ema_12.update(symbol_ids, values[:, 0]) - \
+            self._ema_26.update(symbol_ids, values[:, 0])
+
+        return np.column_stack([macd, self._signal_line.update(symbol_ids,
+            macd)])
+
+
+    def _signal(self, symbol_ids):
+        '''
+        Calculates the signal from the two most recent bars, see the getSignal
+        method of the tradingti.indicators.MACD class.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The signal values.
+        '''
+
+        previous_macd, previous_signal_line = self._recentRows(symbol_ids, 1).T
+        macd, signal_line = self._recentRows(symbol_ids, 0).T
+
+        # MACD crossing above zero is considered bullish, while crossing below
+        # zero is bearish.
+        signals = np.where((previous_macd < 0.) & (macd > 0.),
+            TRADE_SIGNALS['Buy'], 0)
+        signals += np.where((previous_macd > 0.) & (macd < 0.),
+            TRADE_SIGNALS['Sell'], 0)
+
+        # MACD turns up from below zero it is considered bullish.
+        # MACD turns down from above zero it is considered bearish.
+        signals += np.where((previous_macd < macd) & (macd < 0.),
+            TRADE_SIGNALS['Buy'], 0)
+        signals += np.where((previous_macd > macd) & (macd > 0.),
+            TRADE_SIGNALS['Sell'], 0)
+
+        # MACD line crosses the signal line
+        signals += np.where((previous_macd < previous_signal_line) & (macd >
+            signal_line), TRADE_SIGNALS['Buy'], 0)
+        signals += np.where((previous_macd > previous_signal_line) & (macd <
+            signal_line), TRADE_SIGNALS['Sell'], 0)
+
+        # Signal voting
+        return np.where(signals <= -1, TRADE_SIGNALS['Buy'], np.where(
+            signals >= 1, TRADE_SIGNALS['Sell'], signals))
+
+
+class DMI(StreamingPanelTI):
+    '''
+    Streaming Directional Movement Index (DMI) Technical Indicator of several
+    symbols class implementation.
+
+    Args:
+        symbols (int): The number of the symbols.
+
+        adx (boolean): If True, the Average Directional Movement Index (ADX) is
+            calculated in the same update and added as a fourth value 'ADX'.
+            Default value is False.
+
+    Attributes:
+        _adx (_AverageDirectionalIndices): The state of the ADX, None when the
+            ADX is not calculated.
+
+        _directional_movement (_DirectionalMovements): The state of the
+            directional movement.
+
+    Methods:
+        -
+
+    Raises:
+        TypeError
+        ValueError
+
+    '''
+    def __init__(self, symbols, adx = False):
+
+        # Validate the adx argument
+        if not isinstance(adx, bool):
+            raise TypeError('The argument adx should be a `bool` but it is ' +\
+                'of type `' + str(type(adx)) + '`.')
+
+        super().__init__(indicator_name = 'DMI', required_columns = ['High',
+            'Low', 'Close'], columns = ['DMI+', 'DMI-', 'DX'] + (['ADX'] if adx
+            else []), history = 2, required_periods = 2, symbols = symbols)
+
+        self._adx = _AverageDirectionalIndices(symbols) if adx else None
+        self._directional_movement = _DirectionalMovements(symbols)
+
+
+    def _updateState(self, symbol_ids, values):
+        '''
+        Updates the directional movement with a new bar.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+            values (numpy array): The values of the required stock data of the
+                bars.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The 'DMI+', 'DMI-' and 'DX' values, and the 'ADX'
+                value when requested.
+        '''
+
+        dmi = self._directional_movement.update(symbol_ids, *values.T)
+
+        if self._adx is not None:
+            dmi = np.column_stack([dmi, self._adx.update(symbol_ids,
+                dmi[:, 2])])
+
+        return dmi
+
+
+    def _signal(self, symbol_ids):
+        '''
+        Calculates the signal from the two most recent bars, see the getSignal
+        method of the tradingti.indicators.DMI class.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The signal values.
+        '''
+
+        previous = self._recentRows(symbol_ids, 1)
+        current = self._recentRows(symbol_ids, 0)
+
+        # A buy signal is given when DMI+ crosses above DMI-
+        # A sell signal is given when DMI- crosses above DMI+
+        return np.where((previous[:, 0] > previous[:, 1]) & (current[:, 0] <
+            current[:, 1]), TRADE_SIGNALS['Sell'], np.where((previous[:, 0] <
+            previous[:, 1]) & (current[:, 0] > current[:, 1]),
+            TRADE_SIGNALS['Buy'], TRADE_SIGNALS['Hold']))
+
+
+class ADX(StreamingPanelTI):
+    '''
+    Streaming Average Directional Movement Index (ADX) Technical Indicator of
+    several symbols class implementation.
+
+    Args:
+        symbols (int): The number of the symbols.
+
+    Attributes:
+        _adx (_AverageDirectionalIndices): The state of the ADX.
+
+        _directional_movement (_DirectionalMovements): The state of the
+            directional movement.
+
+    Methods:
+        -
+
+    Raises:
+        ValueError
+
+    '''
+    def __init__(self, symbols):
+
+        # The signal is calculated from the first of the input columns, as in
+        # the tradingti.indicators.ADX class for data in the usual column order
+        super().__init__(indicator_name = 'ADX', required_columns = ['High',
+            'Low', 'Close', 'Adj Close'], columns = ['ADX'], history = 3,
+            required_periods = 3, symbols = symbols)
+
+        self._adx = _AverageDirectionalIndices(symbols)
+        self._directional_movement = _DirectionalMovements(symbols)
+
+
+    def _updateState(self, symbol_ids, values):
+        '''
+        Updates the directional movement with a new bar.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+            values (numpy array): The values of the required stock data of the
+                bars.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The 'ADX' value.
+        '''
+
+        dx = self._directional_movement.update(symbol_ids, *values[:, :3].T)
+
+        return self._adx.update(symbol_ids, dx[:, 2])[:, None]
+
+
+    def _signal(self, symbol_ids):
+        '''
+        Calculates the signal from the three most recent bars, see the getSignal
+        method of the tradingti.indicators.ADX class.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The signal values.
+        '''
+
+        prices = [self._recentInputs(symbol_ids, lag)[:, 0] for lag in
+            [2, 1, 0]]
+        strong_trend = self._recentRows(symbol_ids, 0)[:, 0] > 25
+
+        # Price drops and strong trend
+        # Price raises and strong trend
+        return np.where((prices[0] > prices[1]) & (prices[1] > prices[2]) &
+            strong_trend, TRADE_SIGNALS['Sell'], np.where((prices[0] <
+            prices[1]) & (prices[1] < prices[2]) & strong_trend,
+            TRADE_SIGNALS['Buy'], TRADE_SIGNALS['Hold']))
@@ -0,0 +1,216 @@
+'''
+File name: _volatility.py
+    Volatility streaming technical indicators of several symbols
+    implementation.
+    Implements the following streaming technical indicators:
+    - Bollinger Bands (BB class)
+    - Standard Deviation (SD class)
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+import numpy as np
+from ._streaming_panel_indicator import StreamingPanelTI
+from ._panel_states import _RollingMoments
+from ...indicators._volatility import _BB_TERMS
+from ..._constants import *
+
+
+class BB(StreamingPanelTI):
+    '''
+    Streaming Bollinger Bands (BB) Technical Indicator of several symbols class
+    implementation.
+
+    Args:
+        symbols (int): The number of the symbols.
+
+        term (string): The term type for which the indicator should be
+            calculated, 'short', 'medium' or 'long'. See the
+            tradingti.indicators.BB class. Default value is 'medium'.
+
+    Attributes:
+        _term_type (string): The term type for which the indicator should be
+            calculated.
+
+        _term (tuple): The rolling window and the bands distance (in standard
+            deviations) of the term type.
+
+        _moments (_RollingMoments): The state of the rolling mean and variance
+            of the prices.
+
+    Methods:
+        -
+
+    Raises:
+        ValueError
+
+    '''
+    def __init__(self, symbols, term = 'medium'):
+
+        # Validate that term has one of the allowed values
+        if str(term) not in ['short', 'medium', 'long']:
+            raise(ValueError('Not allowed value for the \'term\' argument.' +\
+                ' It should be one of the following: \'short\', \'medium\', ' +\
+                '\'long\'. Value given is \'' + str(term) + '\'.'))
+
+        self._term_type = term
+        self._term = _BB_TERMS[term]
+
+        super().__init__(indicator_name = 'BB (sma = ' + str(self._term[0]) +\
+            ', std = ' + str(self._term[1]) + ')', required_columns =
+            ['Adj Close'], columns = ['SMA', 'Upper Band', 'Lower Band'],
+            history = 1, required_periods = self._term[0], symbols = symbols)
+
+        self._moments = _RollingMoments(self._term[0], symbols)
+
+
+    def _updateState(self, symbol_ids, values):
+        '''
+        Updates the rolling mean and variance with the prices of a new bar.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+            values (numpy array): The values of the required stock data of the
+                bars.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The 'SMA', 'Upper Band' and 'Lower Band' values, the
+                bands are NaN for the first bar of a symbol.
+        '''
+
+        means, variances = self._moments.update(symbol_ids, values[:, 0])
+        std = np.sqrt(variances)
+
+        return np.column_stack([means, means + self._term[1]*std, means -
+            self._term[1]*std])
+
+
+    def _signal(self, symbol_ids):
+        '''
+        Calculates the signal from the most recent bar, see the getSignal
+        method of the tradingti.indicators.BB class.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The signal values.
+        '''
+
+        prices = self._recentInputs(symbol_ids, 0)[:, 0]
+        _, upper_band, lower_band = self._recentRows(symbol_ids, 0).T
+
+        # Price goes above upper band
+        # Price goes below lower band
+        return np.where(prices > upper_band, TRADE_SIGNALS['Sell'], np.where(
+            prices < lower_band, TRADE_SIGNALS['Buy'], TRADE_SIGNALS['Hold']))
+
+
+class SD(StreamingPanelTI):
+    '''
+    Streaming Standard Deviation (SD) Technical Indicator of several symbols
+    class implementation.
+
+    Args:
+        symbols (int): The number of the symbols.
+
+        periods (int): The past periods on which standard deviation should be
+            calculated. Default value is 20.
+
+    Attributes:
+        _periods (int): The past periods on which standard deviation should be
+            calculated.
+
+        _moments (_RollingMoments): The state of the rolling mean and variance
+            of the prices.
+
+        _means (numpy array): The average price of the last periods of each
+            symbol, for the signal calculation.
+
+    Methods:
+        -
+
+    Raises:
+        ValueError
+
+    '''
+    def __init__(self, symbols, periods = 20):
+
+        # Validate that periods is positive integer
+        if type(periods) != int or periods <= 0:
+            raise(ValueError('Not allowed value for the \'periods\' argument.'+\
+                ' It should be integer > 0. Value given is ' + str(periods) +\
+                '.'))
+
+        super().__init__(indicator_name = 'SD-' + str(periods),
+            required_columns = ['Adj Close'], columns = ['SD'], history = 1,
+            required_periods = periods, symbols = symbols)
+
+        self._periods = periods
+        self._moments = _RollingMoments(periods, symbols)
+        self._means = np.full(symbols, np.nan, dtype = np.float64)
+
+
+    def _updateState(self, symbol_ids, values):
+        '''
+        Updates the rolling mean and variance with the prices of a new bar.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+            values (numpy array): The values of the required stock data of the
+                bars.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The 'SD' values, NaN for the first periods - 1 bars of
+                a symbol.
+        '''
+
+        means, variances = self._moments.update(symbol_ids, values[:, 0])
+        self._means[symbol_ids] = means
+
+        return np.where(self._bars[symbol_ids] < self._periods - 1, np.nan,
+            np.sqrt(variances))[:, None]
+
+
+    def _signal(self, symbol_ids):
+        '''
+        Calculates the signal from the most recent bar, see the getSignal
+        method of the tradingti.indicators.SD class.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The signal values.
+        '''
+
+        prices = self._recentInputs(symbol_ids, 0)[:, 0]
+        means = self._means[symbol_ids]
+        high_volatility = self._recentRows(symbol_ids, 0)[:, 0] > 3
+
+        # Price above average and volatility is high
+        # Price below average and volatility is high
+        return np.where((prices > means) & high_volatility,
+            TRADE_SIGNALS['Sell'], np.where((prices < means) & high_volatility,
+            TRADE_SIGNALS['Buy'], TRADE_SIGNALS['Hold']))
@@ -0,0 +1,101 @@
+'''
+File name: _volume.py
+    Volume streaming technical indicators of several symbols implementation.
+    Implements the following streaming technical indicators:
+    - On Balance Volume (OBV class)
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+import numpy as np
+from ._streaming_panel_indicator import StreamingPanelTI
+from ..._constants import *
+
+
+class OBV(StreamingPanelTI):
+    '''
+    Streaming On Balance Volume (OBV) Technical Indicator of several symbols
+    class implementation. The OBV is kept as float, integral volumes give
+    integral values up to 2**53.
+
+    Args:
+        symbols (int): The number of the symbols.
+
+    Attributes:
+        _obv (numpy array): The running OBV of each symbol.
+
+    Methods:
+        -
+
+    Raises:
+        ValueError
+
+    '''
+    def __init__(self, symbols):
+
+        super().__init__(indicator_name = 'OBV', required_columns = ['Volume',
+            'Adj Close'], columns = ['OBV'], history = 3, required_periods = 3,
+            symbols = symbols)
+
+        self._obv = np.zeros(symbols, dtype = np.float64)
+
+
+    def _updateState(self, symbol_ids, values):
+        '''
+        Updates the running OBV with a new bar.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+            values (numpy array): The values of the required stock data of the
+                bars.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The 'OBV' values.
+        '''
+
+        volume, close = values.T
+
+        # Volume is added when today's close is greater than yesterday's close,
+        # subtracted when it is less and ignored when it is equal (and for the
+        # first bar of a symbol)
+        previous_close = self._recentInputs(symbol_ids, 0)[:, 1]
+        close_direction = np.where(self._bars[symbol_ids] == 0, 0.,
+            np.sign(close - previous_close))
+
+        obv = self._obv[symbol_ids] + close_direction*volume
+        self._obv[symbol_ids] = obv
+
+        return obv[:, None]
+
+
+    def _signal(self, symbol_ids):
+        '''
+        Calculates the signal from the three most recent bars, see the getSignal
+        method of the tradingti.indicators.OBV class.
+
+        Args:
+            symbol_ids (numpy array): The ids of the symbols.
+
+        Raises:
+            -
+
+        Returns:
+            numpy array: The signal values.
+        '''
+
+        obv = [self._recentRows(symbol_ids, lag)[:, 0] for lag in [2, 1, 0]]
+
+        return np.where((obv[0] > obv[1]) & (obv[1] > obv[2]),
+            TRADE_SIGNALS['Sell'], np.where((obv[0] < obv[1]) & (obv[1] <
+            obv[2]), TRADE_SIGNALS['Buy'], TRADE_SIGNALS['Hold']))
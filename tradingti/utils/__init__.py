@@ -8,15 +8,16 @@ enail: vsaveris@gmail.com
 
 License: MIT
 
-Date last modified: 08.02.2020
+Date last modified: 18.10.2026
 
 Python Version: 3.6
 '''
 
 from ._plot import linesGraph
 from ._data_preprocessing import fillMissingValues
+from ._data_validation import ValidatedStockData
 from ._system_information import showSystemInfo
 from ._library_information import showLibraryInfo
 
-__all__ = ['linesGraph', 'fillMissingValues', 'showSystemInfo', 
-    'showLibraryInfo']
\ No newline at end of file
+__all__ = ['linesGraph', 'fillMissingValues', 'ValidatedStockData', 
+    'showSystemInfo', 'showLibraryInfo']
\ No newline at end of file
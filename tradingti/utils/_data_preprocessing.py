@@ -7,36 +7,66 @@ enail: vsaveris@gmail.com
 
 License: MIT
 
-Date last modified: 22.01.2020
+Date last modified: 18.10.2026
 
 Python Version: 3.6
 '''
 
-def fillMissingValues(df_data):
+import numpy as np
+
+
+def fillMissingValues(df_data, copy = True):
     '''
     Fills the missing values of a dataframe by executing first abs
     forward pass and then a backward pass. See details in:
     https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.
     DataFrame.fillna.html
+
+    The dataframe is sorted on its index. Both passes are done in one step,
+    each missing value takes the value of the previous observation of its
+    column, or of the first one for the missing values at the start.
     
     Args:
         df_data (pandas.core.frame.DataFrame): The input data.
 
+        copy (boolean): If False, when the index is already sorted and there
+            are no missing values, the input dataframe is returned as it is,
+            without being copied. Default value is True.
+
     Raises:
         -
 
     Returns:
         pandas.core.frame.DataFrame: The input data with missing
-            values filled.
+            values filled. It is a new dataframe, or the input object itself
+            when copy is False and there was nothing to sort or fill.
     '''
     
-    # Sort dataframe on index ascending
-    df_data = df_data.sort_index(ascending = True)
-    
-    # Fill forward
-    df_data.fillna(method = 'ffill', inplace = True)
-    
-    # Fill backward
-    df_data.fillna(method = 'bfill', inplace = True)
+    # Sort dataframe on index ascending, only when not already sorted
+    is_copy = not df_data.index.is_monotonic_increasing
+    if is_copy:
+        df_data = df_data.sort_index(ascending = True)
+
+    missing_columns = [column for column, values in df_data.items() if
+        values.hasnans]
+
+    # Nothing to fill
+    if len(missing_columns) == 0:
+        return df_data.copy() if copy and not is_copy else df_data
+
+    if not is_copy:
+        df_data = df_data.copy()
+
+    # Position of the observation taken by each period, the previous one or
+    # the first one for the periods before it
+    periods = np.arange(len(df_data.index))
+
+    for column in missing_columns:
+        observed = df_data[column].notna().values
+
+        positions = np.maximum.accumulate(np.where(observed, periods, -1))
+        positions[positions < 0] = np.argmax(observed)
+
+        df_data[column] = df_data[column].values[positions]
     
-    return df_data
\ No newline at end of file
+    return df_data
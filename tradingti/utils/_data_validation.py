@@ -8,7 +8,7 @@ enail: vsaveris@gmail.com
 
 License: MIT
 
-Date last modified: 08.02.2020
+Date last modified: 18.10.2026
 
 Python Version: 3.6
 '''
@@ -45,6 +45,46 @@ def validateDataFrame(data):
             'type `' + str(type(data.index)) + '`.')
     
 
+def _validateColumns(data, required_columns, indicator_name):
+    '''
+    Validates that the required_columns argument is a list of strings and that
+    the data frame contains all the required columns.
+
+    Args:
+        data (pandas.core.frame.DataFrame): The data frame to be checked.
+
+        required_columns (list of strings): The columns which should contained
+            in the data frame.
+
+        indicator_name (string): The name of the indicator. To be used in case
+            an exception is raised.
+
+    Raises:
+        TypeError
+        ValueError
+
+    Returns:
+        -
+    '''
+
+    if type(required_columns) != list:
+        raise TypeError('The argument required_columns should be a `list` ' +\
+            'but it is of type `' + str(type(required_columns)) + '`.')
+
+    for column in required_columns:
+        
+        # Check that required_columns are strings
+        if type(column) != str:
+            raise TypeError('Required columns list should contain strings ' +\
+                'but column `' + str(column) + '` it is of type `'          +\
+                str(type(column)) + '`.')
+            
+        elif column not in data.columns:
+            raise ValueError('Required column `' + column + '` for the ' +\
+                'technical indicator `' + indicator_name + '` was not '  +\
+                'found in the data frame.')
+
+
 def validateStockData(data, required_columns, indicator_name):
     '''
     Validates that the data argument is a pandas data frame, that its index
@@ -53,6 +93,10 @@ def validateStockData(data, required_columns, indicator_name):
     with only the required columns, sorted on the date index and with missing
     values filled. It raises an exception in case the validation fails.
 
+    When the data argument is a ValidatedStockData object, the data are not
+    validated again. Only the required columns are checked, and the data frame
+    with the required columns is taken from the object.
+    
     Args:
         data (object): Input object to be validated.
         
@@ -73,41 +117,134 @@ def validateStockData(data, required_columns, indicator_name):
             any further processing.
     '''
     
+    # Data already validated
+    if isinstance(data, ValidatedStockData):
+        return data.getData(required_columns, indicator_name)
+
     # Validate the type of the input arguments
     validateDataFrame(data)
     
-    if type(required_columns) != list:
-        raise TypeError('The argument required_columns should be a `list` ' +\
-            'but it is of type `' + str(type(required_columns)) + '`.')
-
     # Validate that the data frame is not empty
     if data.empty:
         raise ValueError('The input data cannot be empty. data_len = ' +\
             str(len(data.index)) + '.')
-   
+
     # Validate that the data frame holds columns of numeric type and that all
     # the required columns are contained.
-    for column in data.columns:
-        if not is_numeric_dtype(data[column]):
+    for column, dtype in data.dtypes.items():
+        if not is_numeric_dtype(dtype):
             raise ValueError('The input data frame must hold columns of ' +\
                 'numeric type. column `' + column + '`, is_numeric = '    +\
-                str(is_numeric_dtype(data[column])) + '.')
-                
-    for column in required_columns:
-        # Check that required_columns are strings
-        if type(column) != str:
-            raise TypeError('Required columns list should contain strings ' +\
-                'but column `' + str(column) + '` it is of type `'          +\
-                str(type(column)) + '`.')
+                str(is_numeric_dtype(dtype)) + '.')
+
+    _validateColumns(data, required_columns, indicator_name)
+        
+    # Keep only the required columns (in the order of the data frame), in one
+    # projection, which is already a new data frame
+    data = data[[column for column in data.columns if column in 
+        required_columns]]
             
-        elif column not in data.columns:
-            raise ValueError('Required column `' + column + '` for the ' +\
-                'technical indicator `' + indicator_name + '` was not '  +\
-                'found in the data frame.')
-    
-    # Remove not required columns
-    for column in data.columns:
-        if column not in required_columns:
-            data = data.drop(columns = column)
-    
-    return fillMissingValues(data)
\ No newline at end of file
+    return fillMissingValues(data, copy = False)
+
+
+class ValidatedStockData:
+    '''
+    Stock data validated once, to be used as input to several technical 
+    indicators. An object of this class is accepted by every indicator 
+    constructor in place of the data frame, without being copied or validated 
+    again.
+
+    Args:
+        data (pandas.core.frame.DataFrame): The stock data. Index is of type 
+            date. All the columns should be of numeric type.
+
+    Attributes:
+        _data (pandas.core.frame.DataFrame): The validated data, sorted on the
+            date index and with missing values filled.
+
+        _projections (dictionary): The data frames with the columns required by
+            the indicators, created once for each set of required columns.
+
+    Methods:
+        getData(): Returns the validated data frame with the required columns.
+            It can be called from several threads.
+
+    Raises:
+        TypeError
+        ValueError
+    '''
+    def __init__(self, data):
+
+        # All the columns are required, the data are validated once
+        self._data = validateStockData(data = data, required_columns = 
+            list(data.columns) if isinstance(data, pc.frame.DataFrame) else [],
+            indicator_name = 'ValidatedStockData')
+
+        self._projections = {}
+
+
+    def getData(self, required_columns = None, indicator_name = None):
+        '''
+        Returns the validated data frame with the required columns, in the 
+        order of the input data frame.
+
+        Args:
+            required_columns (list of strings, default is None): The columns 
+                which should be contained in the returned data frame. When None,
+                all the columns are returned.
+
+            indicator_name (string, default is None): The name of the 
+                indicator. To be used in case an exception is raised.
+
+        Raises:
+            TypeError
+            ValueError
+
+        Returns:
+            pandas.core.frame.DataFrame: The validated data frame. It should not
+                be modified, since it is shared by the indicators.
+        '''
+
+        if required_columns is None:
+            return self._data
+
+        _validateColumns(self._data, required_columns, str(indicator_name))
+
+        columns = tuple(column for column in self._data.columns if column in 
+            required_columns)
+
+        if columns == tuple(self._data.columns):
+            return self._data
+
+        # The first projection stored is returned to all the callers, also when
+        # several threads create it at the same time (setdefault is atomic)
+        projection = self._projections.get(columns)
+        if projection is None:
+            projection = self._projections.setdefault(columns, 
+                self._data[list(columns)])
+
+        return projection
+
+
+def _validatedStockData(data):
+    '''
+    Wraps stock data which are already validated (the output of
+    validateStockData or of the panel data validation) in a ValidatedStockData
+    object, without validating them again.
+
+    Args:
+        data (pandas.core.frame.DataFrame): The validated stock data, sorted on
+            the date index and with missing values filled.
+
+    Raises:
+        -
+
+    Returns:
+        ValidatedStockData: The validated stock data object.
+    '''
+
+    validated_data = ValidatedStockData.__new__(ValidatedStockData)
+    validated_data._data = data
+    validated_data._projections = {}
+
+    return validated_data
@@ -7,21 +7,33 @@ enail: vsaveris@gmail.com
 
 License: MIT
 
-Date last modified: 08.02.2020
+Date last modified: 18.10.2026
 
 Python Version: 3.6
 '''
 
+import threading
 import matplotlib.pyplot as plt
 from ._data_validation import validateDataFrame
 
 
+# The pyplot state (current figure) is shared by all the threads, the graphs 
+# are prepared one at a time
+_PLOT_LOCK = threading.RLock()
+
+
 def linesGraph(data, title = 'Untitled Graph', x_label = 'Date',  
     y_label = 'Price', lines_color = [None], lines_width = [None], 
     lines_style = [None], alpha_values = [None], areas = None): 
     '''
-    Returns a lines graph of type matplotlib.pyplot. The graph can be either
-    a figure with a single plot, or a figure containing two vertical subplots.
+    Returns a lines graph of type matplotlib.figure.Figure. The graph can be
+    either a figure with a single plot, or a figure containing two vertical
+    subplots.
+
+    The function can be called from several threads. The graphs are prepared
+    one at a time, each on its own figure, which is returned. The figure is
+    also the current pyplot figure when the function returns, but it can be
+    changed by other threads afterwards.
     
     Args:
         data (pandas.core.frame.DataFrame or a list of maximum two pandas.core.
@@ -76,7 +88,7 @@ def linesGraph(data, title = 'Untitled Graph', x_label = 'Date',
         TypeError
 
     Returns:
-        matplotlib.pyplot: The prepared graph object.
+        matplotlib.figure.Figure: The prepared graph object.
     '''
 
     # For handling a list input always
@@ -94,44 +106,51 @@ def linesGraph(data, title = 'Untitled Graph', x_label = 'Date',
     for df in data:
         validateDataFrame(df)
 
-    plt.figure(figsize = (7, 5))
-    
-    # Add the subplots
-    j = 0 # Used for plot attributes use in rotation
-    
-    for i in range(len(data)):
-        plt.subplot(len(data), 1, i+1)
+    with _PLOT_LOCK:
+
+        # The graph is drawn on its own figure and axes objects, not on the 
+        # current ones
+        figure = plt.figure(figsize = (7, 5))
         
-        for line_name in data[i].columns.values:
-            plt.plot(data[i].index, data[i][line_name], label = line_name, 
-                color = lines_color[j % len(lines_color)], 
-                linewidth = lines_width[j % len(lines_width)], 
-                linestyle = lines_style[j % len(lines_style)], 
-                alpha = alpha_values[j % len(alpha_values)])
-            
-            j += 1
+        # Add the subplots
+        j = 0 # Used for plot attributes use in rotation
+        
+        for i in range(len(data)):
+            axes = figure.add_subplot(len(data), 1, i+1)
             
-        plt.legend(loc = 0)
-        plt.grid(which = 'major', axis = 'y', alpha = 0.5)
-
-        # Set attributes for each subplot depending its position      
-        if i == 0:
-            plt.title(title, fontsize = 11, fontweight = 'bold')
-            if len(data) > 1:
-                plt.gca().axes.get_xaxis().set_visible(False)
-    
-    # Last subplot x-axis
-    plt.xlabel(x_label, fontsize = 11, fontweight = 'bold')
-    plt.gcf().autofmt_xdate()    
-    
-    # Common y-axis label
-    plt.gcf().text(0.04, 0.5, y_label, fontsize = 11, fontweight = 'bold', 
-        va = 'center', rotation = 'vertical')         
-    
-    # Plot areas
-    if areas is not None:
-        for a in areas:
-            plt.gca().fill_between(x = a['x'], y1 = a['y1'], y2 = a['y2'], 
-                color = a['color'])
+            for line_name in data[i].columns.values:
+                axes.plot(data[i].index, data[i][line_name], label = line_name,
+                    color = lines_color[j % len(lines_color)], 
+                    linewidth = lines_width[j % len(lines_width)], 
+                    linestyle = lines_style[j % len(lines_style)], 
+                    alpha = alpha_values[j % len(alpha_values)])
+                
+                j += 1
+                
+            axes.legend(loc = 0)
+            axes.grid(which = 'major', axis = 'y', alpha = 0.5)
+
+            # Set attributes for each subplot depending its position      
+            if i == 0:
+                axes.set_title(title, fontsize = 11, fontweight = 'bold')
+                if len(data) > 1:
+                    axes.get_xaxis().set_visible(False)
+        
+        # Last subplot x-axis
+        axes.set_xlabel(x_label, fontsize = 11, fontweight = 'bold')
+        figure.autofmt_xdate()    
+        
+        # Common y-axis label
+        figure.text(0.04, 0.5, y_label, fontsize = 11, fontweight = 'bold', 
+            va = 'center', rotation = 'vertical')         
+        
+        # Plot areas
+        if areas is not None:
+            for a in areas:
+                axes.fill_between(x = a['x'], y1 = a['y1'], y2 = a['y2'], 
+                    color = a['color'])
+
+        # The prepared figure is made the current one
+        plt.figure(figure.number)
 
-    return plt
+    return figure
@@ -0,0 +1,685 @@
+'''
+File name: _rolling_kernels.py
+    Rolling window kernels, defined under the tradingti.utils package. All the
+    windowed statistics needed by the technical indicators are calculated by
+    the methods of this module. The methods operate on numpy arrays, compute
+    several windows in one call and return an array of shape (len(values),
+    len(windows)), one contiguous column for each window. The rolling sums are
+    running sums restarted in blocks, the windows of the same block length
+    share one pass over the blocks.
+
+    Missing values (NaN) are skipped and windows with less than `min_periods`
+    observations give NaN, as in pandas rolling.
+
+    Two dimensional values are treated as independent series, one for each 
+    column (for example one symbol of a panel in each column). The results are
+    then arrays of shape (len(values), len(windows), columns), and no window 
+    crosses from one column to another.
+
+Author: Vasileios Saveris
+enail: vsaveris@gmail.com
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.6
+'''
+
+import numpy as np
+
+
+# Length of the blocks in which the running sums restart, in multiples of the
+# window. Blocks are longer than the window, so a window spans two blocks at
+# most, and only a few windows cross a boundary. Short blocks keep the values
+# close to the reference of their block, and the sums of squared deviations
+# small compared to the variance of a window.
+_BLOCK_WINDOWS = 8
+
+# Block lengths are powers of this base, so that windows of similar length
+# share their blocks and one pass over the blocks
+_BLOCK_BASE = 8
+
+
+def _blockLength(window):
+    '''
+    Returns the length of the blocks in which the running sums restart, the
+    smallest power of _BLOCK_BASE of at least _BLOCK_WINDOWS windows. It
+    depends only on the window, so the results for a window do not depend on
+    the other windows calculated with it.
+
+    Args:
+        window (int): The rolling window.
+
+    Raises:
+        -
+
+    Returns:
+        int: The length of the blocks.
+    '''
+
+    block = _BLOCK_BASE
+    while block < _BLOCK_WINDOWS*window:
+        block *= _BLOCK_BASE
+
+    return block
+
+
+def _windowDifferences(prefix, window):
+    '''
+    Reads the window totals from a prefix sum array. Windows at the beginning
+    of the data, which are not full, contain all the available periods.
+
+    Args:
+        prefix (numpy array): Prefix sums with a leading zero, its length is the
+            number of periods plus one. Two dimensional prefix sums hold one
+            column per series.
+
+        window (int): The rolling window.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: The total of each window.
+    '''
+
+    periods = len(prefix) - 1
+
+    differences = np.empty((periods,) + prefix.shape[1:], dtype = prefix.dtype)
+    differences[:window-1] = prefix[1:window]
+    differences[window-1:] = prefix[window:] - \
+        prefix[:max(periods + 1 - window, 0)]
+
+    return differences
+
+
+def _observationCounts(values, windows):
+    '''
+    Counts the observed (not NaN) values in each window.
+
+    Args:
+        values (numpy array): The input values, one or two dimensional.
+
+        windows (list of integers): The rolling windows.
+
+    Raises:
+        -
+
+    Returns:
+        list of numpy arrays: The observations count of each window.
+    '''
+
+    prefix = np.zeros((len(values) + 1,) + values.shape[1:], dtype = np.int64)
+    np.cumsum(~np.isnan(values), axis = 0, out = prefix[1:])
+
+    return [_windowDifferences(prefix, window) for window in windows]
+
+
+def _windowColumns(results, dimensions):
+    '''
+    Arranges the results of a kernel, calculated window after window, in the
+    layout returned by the kernels.
+
+    Args:
+        results (numpy array or None): Array of shape (windows, periods,
+            columns) with the results of each window.
+
+        dimensions (int): The number of dimensions of the input values.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array or None: Array of shape (periods, windows), one contiguous
+            column for each window, for one dimensional values, or of shape
+            (periods, windows, columns) for two dimensional values. None if
+            results is None.
+    '''
+
+    if results is None:
+        return None
+
+    if dimensions == 1:
+        return results[:, :, 0].T
+
+    return results.transpose(1, 0, 2)
+
+
+def _runLengths(values):
+    '''
+    Calculates the length of the run of equal values ending at each period.
+    NaN values are never equal, so they always start a new run.
+
+    Args:
+        values (numpy array): Array of shape (periods, columns) with the input
+            values.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array or None: The run lengths, of the same shape as the values.
+            None if no value equals the previous one, all the runs have then
+            a length of one.
+    '''
+
+    changes = np.ones(values.shape, dtype = bool)
+    np.not_equal(values[1:], values[:-1], out = changes[1:])
+
+    if changes.all():
+        return None
+
+    ends = np.arange(len(values))[:, None]
+
+    return ends - np.maximum.accumulate(np.where(changes, ends, 0), 
+        axis = 0) + 1
+
+
+def _constantWindows(run_lengths, window):
+    '''
+    Finds the windows in which all the values are equal. These windows get
+    exact results, free of the running sums rounding. Windows with missing
+    values are never constant, except the windows of one period.
+
+    Args:
+        run_lengths (numpy array or None): The run lengths of the values, as
+            returned by _runLengths.
+
+        window (int): The rolling window.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array, boolean or None: Boolean mask of the constant windows,
+            True if all the windows are constant and None if none of them is.
+    '''
+
+    if window == 1:
+        return True
+
+    if run_lengths is None:
+        return None
+
+    # The windows of the first periods hold the available periods
+    head = min(window - 1, len(run_lengths))
+
+    constant = run_lengths >= window
+    constant[:head] = run_lengths[:head] > np.arange(head)[:, None]
+
+    return constant
+
+
+def _blockRunningSums(values, block, squares, missing):
+    '''
+    Splits the values in blocks and calculates the running sums of the
+    observed values in each block, relative to the first observed value of
+    the block. Running sums restart at each block, so they stay small and
+    keep their precision on long histories. They are calculated once for all
+    the windows with the same block length.
+
+    Args:
+        values (numpy array): Array of shape (periods, columns) with the input
+            values.
+
+        block (int): The length of the blocks.
+
+        squares (boolean): If True, the running sums of squares are also
+            calculated.
+
+        missing (boolean): True if some of the values are missing.
+
+    Raises:
+        -
+
+    Returns:
+        tuple (numpy array, numpy array, numpy array, numpy array): The
+            reference value of each block, of shape (blocks, columns), and the
+            running sums, the running sums of squares (None if squares is
+            False) and the running counts of the observed values (None if no
+            value is missing), of shape (blocks, block, columns). The last
+            block is padded after the last period, the padding is never read.
+    '''
+
+    periods, columns = values.shape
+    blocks = -(-periods // block)
+
+    padded = np.empty((blocks, block, columns), dtype = np.float64)
+    padded.reshape(-1, columns)[:periods] = values
+    padded.reshape(-1, columns)[periods:] = np.nan
+
+    # Reference of each block is its first observed value
+    if missing:
+        observed = ~np.isnan(padded)
+        references = np.take_along_axis(padded, observed.argmax(axis = 1)[:, 
+            None], axis = 1)[:, 0]
+        references[np.isnan(references)] = 0.
+
+        deviations = np.subtract(padded, references[:, None], out = padded)
+        np.copyto(deviations, 0., where = ~observed)
+        observed_counts = np.cumsum(observed, axis = 1)
+
+    else:
+        references = padded[:, 0].copy()
+        deviations = np.subtract(padded, references[:, None], out = padded)
+        observed_counts = None
+
+    sums = np.cumsum(deviations, axis = 1)
+    square_sums = np.cumsum(np.square(deviations, out = deviations), 
+        axis = 1) if squares else None
+
+    return references, sums, square_sums, observed_counts
+
+
+def _inBlockTotals(running_sums, window, out):
+    '''
+    Reads the window totals from the running sums of the blocks, assuming that
+    each window is within one block. The windows of the first window - 1
+    periods of a block cross the block boundary, they get the total of their
+    periods in the block and are corrected by the caller.
+
+    Args:
+        running_sums (numpy array): Array of shape (blocks, block, columns),
+            the running sums of each block.
+
+        window (int): The rolling window.
+
+        out (numpy array): Array of shape (blocks, block, columns) in which the
+            total of each window is written.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: The out array.
+    '''
+
+    out[:, :window] = running_sums[:, :window]
+    np.subtract(running_sums[:, window:], running_sums[:, :-window], 
+        out = out[:, window:])
+
+    return out
+
+
+def _previousBlockTotals(running_sums, window):
+    '''
+    Reads the totals of the periods in the previous block, for the windows
+    crossing a block boundary.
+
+    Args:
+        running_sums (numpy array): Array of shape (blocks, block, columns),
+            the running sums of each block.
+
+        window (int): The rolling window.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: Array of shape (blocks - 1, window - 1, columns), the
+            totals of the previous block for the first window - 1 periods of
+            each block after the first one.
+    '''
+
+    block = running_sums.shape[1]
+
+    return running_sums[:-1, -1:] - running_sums[:-1, block-window:block-1]
+
+
+def _rollingMoments(values, windows, min_periods, ddof, variance):
+    '''
+    Calculates the rolling mean and optionally the rolling variance of the
+    values, for several windows. The windows with the same block length (see
+    _blockLength) share one block pass over the data, each window then reads
+    its sums from the running sums of the blocks. A window spans two blocks at
+    most, the part in the previous block is moved to the reference of the
+    block of its last period.
+
+    Args:
+        values (numpy array): The input values.
+
+        windows (list of integers): The rolling windows.
+
+        min_periods (int or None): Minimum number of observations in a window,
+            None means that the window should be full.
+
+        ddof (int): Delta degrees of freedom of the variance.
+
+        variance (boolean): If True, the rolling variance is also calculated.
+
+    Raises:
+        -
+
+    Returns:
+        tuple (numpy array, numpy array): The rolling means and the rolling
+            variances (None if variance is False).
+    '''
+
+    values = np.asarray(values, dtype = np.float64)
+    columns = values[:, None] if values.ndim == 1 else values
+    periods = len(columns)
+
+    block_lengths = sorted(set(_blockLength(window) for window in windows))
+
+    # The results of a window are written in its blocks, the results of all
+    # the windows are padded to the longest blocks
+    padded_periods = max([-(-periods // block)*block for block in 
+        block_lengths], default = 0)
+
+    means = np.empty((len(windows), padded_periods, columns.shape[1]), 
+        dtype = np.float64)
+    variances = np.empty_like(means) if variance else None
+
+    if periods == 0:
+        return _windowColumns(means, values.ndim), _windowColumns(variances,
+            values.ndim)
+
+    missing = bool(np.isnan(columns).any())
+    run_lengths = _runLengths(columns)
+
+    for block in block_lengths:
+        references, sums, square_sums, observed_counts = _blockRunningSums(
+            columns, block, squares = variance, missing = missing)
+        blocks = len(sums)
+        shift = (references[:-1] - references[1:])[:, None]
+        window_sums = np.empty_like(sums)
+
+        for i, window in enumerate(windows):
+            if _blockLength(window) != block:
+                continue
+
+            block_means = means[i, :blocks*block].reshape(sums.shape)
+
+            # Without missing values, a window holds window periods, except
+            # the windows of the first window - 1 periods
+            if missing:
+                counts = _inBlockTotals(observed_counts, window, 
+                    out = np.empty_like(observed_counts))
+                previous_counts = _previousBlockTotals(observed_counts, window)
+                counts[1:, :window-1] += previous_counts
+            else:
+                counts = window
+                first_counts = np.arange(1, window)[:, None]
+                previous_counts = np.arange(window - 1, 0, -1)[:, None]
+
+            # Windows crossing a block boundary: the part in the previous block
+            # is added and moved to the reference of the current block
+            _inBlockTotals(sums, window, out = window_sums)
+            previous_sums = _previousBlockTotals(sums, window)
+
+            if variance:
+                window_squares = _inBlockTotals(square_sums, window, 
+                    out = variances[i, :blocks*block].reshape(sums.shape))
+                window_squares[1:, :window-1] = window_squares[1:, :window-1] \
+                    + square_sums[:-1, -1:] - square_sums[:-1, 
+                    block-window:block-1] + 2*shift*previous_sums + \
+                    previous_counts*(shift*shift)
+
+            window_sums[1:, :window-1] = window_sums[1:, :window-1] + \
+                previous_sums + previous_counts*shift
+
+            with np.errstate(divide = 'ignore', invalid = 'ignore'):
+                relative_means = np.divide(window_sums, counts, 
+                    out = block_means)
+                if not missing:
+                    relative_means[0, :window-1] = window_sums[0, 
+                        :window-1]/first_counts
+
+                if variance:
+                    window_squares -= np.multiply(window_sums, relative_means,
+                        out = window_sums)
+                    if not missing:
+                        first_squares = window_squares[0, :window-1]/(
+                            first_counts - ddof)
+                    window_squares /= counts - ddof
+                    if not missing:
+                        window_squares[0, :window-1] = first_squares
+                    np.maximum(window_squares, 0., out = window_squares)
+
+            relative_means += references[:, None]
+
+            # Exact results for the constant windows, NaN for the windows with
+            # too few observations
+            constant = _constantWindows(run_lengths, window)
+            minimum = _minimumObservations(min_periods, window)
+
+            if constant is not None:
+                np.copyto(means[i, :periods], columns, where = constant)
+                if variance:
+                    np.copyto(variances[i, :periods], 0., where = constant)
+
+            if missing:
+                counts = counts.reshape(-1, columns.shape[1])[:periods]
+                np.copyto(means[i, :periods], np.nan, where = counts < minimum)
+                if variance:
+                    np.copyto(variances[i, :periods], np.nan, where = (counts <
+                        minimum) | (counts <= ddof))
+            else:
+                means[i, :_shortWindows(minimum, window, periods)] = np.nan
+                if variance:
+                    variances[i, :_shortWindows(max(minimum, ddof + 1), window,
+                        periods)] = np.nan
+
+    return _windowColumns(means[:, :periods], values.ndim), _windowColumns(
+        None if variances is None else variances[:, :periods], values.ndim)
+
+
+def _shortWindows(observations, window, periods):
+    '''
+    Returns the number of the first periods with less than a number of
+    observations in their window, when no value is missing.
+
+    Args:
+        observations (int): The number of observations.
+
+        window (int): The rolling window.
+
+        periods (int): The number of periods.
+
+    Raises:
+        -
+
+    Returns:
+        int: The number of the first periods with less observations.
+    '''
+
+    return min(observations - 1 if observations <= window else periods, 
+        periods)
+
+
+def _minimumObservations(min_periods, window):
+    '''
+    Returns the minimum number of observations required in a window.
+
+    Args:
+        min_periods (int or None): The requested minimum number of
+            observations, None means that the window should be full.
+
+        window (int): The rolling window.
+
+    Raises:
+        -
+
+    Returns:
+        int: The minimum number of observations.
+    '''
+
+    return window if min_periods is None else max(min_periods, 1)
+
+
+def rollingMean(values, windows, min_periods = 1):
+    '''
+    Calculates the rolling mean of the values for several windows.
+
+    Args:
+        values (numpy array): The input values.
+
+        windows (list of integers): The rolling windows.
+
+        min_periods (int or None): Minimum number of observations in a window,
+            None means that the window should be full. Default value is 1.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: Array of shape (len(values), len(windows)), the column i
+            holds the rolling mean for the windows[i] window.
+    '''
+
+    return _rollingMoments(values, windows, min_periods, ddof = 1,
+        variance = False)[0]
+
+
+def rollingMeanStd(values, windows, min_periods = 1, ddof = 1):
+    '''
+    Calculates the rolling mean and the rolling standard deviation of the values
+    for several windows, from the running sums and running sums of squares of
+    the blocks (one pass for the windows of the same block length).
+
+    Args:
+        values (numpy array): The input values.
+
+        windows (list of integers): The rolling windows.
+
+        min_periods (int or None): Minimum number of observations in a window,
+            None means that the window should be full. Default value is 1.
+
+        ddof (int): Delta degrees of freedom. Default value is 1.
+
+    Raises:
+        -
+
+    Returns:
+        tuple (numpy array, numpy array): Arrays of shape (len(values),
+            len(windows)) with the rolling means and the rolling standard
+            deviations.
+    '''
+
+    means, variances = _rollingMoments(values, windows, min_periods,
+        ddof = ddof, variance = True)
+
+    return means, np.sqrt(variances)
+
+
+def _rollingMaxima(values, window, out):
+    '''
+    Calculates the rolling maximum for one window with the van Herk/Gil-Werman
+    algorithm. The values are split in blocks of the window length, and a
+    window is covered by the end of one block and the start of the next one.
+    Its maximum is the larger of the suffix maximum of the first block and the
+    prefix maximum of the second one, so the cost is three comparisons per
+    period for any window length. Values are preceded by window - 1 periods of
+    -inf padding, so that the windows at the beginning of the data use all the
+    available periods.
+
+    Args:
+        values (numpy array): Array of shape (periods, columns) with the input
+            values, missing values replaced by -inf.
+
+        window (int): The rolling window.
+
+        out (numpy array): Array of shape (periods, columns) in which the
+            rolling maxima are written.
+
+    Raises:
+        -
+
+    Returns:
+        -
+    '''
+
+    periods, columns = values.shape
+    blocks = -(-(periods + window - 1) // window)
+
+    padded = np.full((blocks*window, columns), -np.inf, dtype = np.float64)
+    padded[window-1:window-1+periods] = values
+    padded = padded.reshape(blocks, window, columns)
+
+    prefix_maxima = np.maximum.accumulate(padded, axis = 1).reshape(-1,
+        columns)
+
+    # Accumulated on the reversed blocks, written back in the order of periods
+    suffix_maxima = np.empty_like(padded)
+    np.maximum.accumulate(padded[:, ::-1], axis = 1, 
+        out = suffix_maxima[:, ::-1])
+    suffix_maxima = suffix_maxima.reshape(-1, columns)
+
+    # The window ending at a padded period starts window - 1 periods before it
+    np.maximum(suffix_maxima[:periods], 
+        prefix_maxima[window-1:window-1+periods], out = out)
+
+
+def rollingMax(values, windows, min_periods = 1):
+    '''
+    Calculates the rolling maximum of the values for several windows, in O(n)
+    vectorized operations for each window (see _rollingMaxima).
+
+    Args:
+        values (numpy array): The input values.
+
+        windows (list of integers): The rolling windows.
+
+        min_periods (int or None): Minimum number of observations in a window,
+            None means that the window should be full. Default value is 1.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: Array of shape (len(values), len(windows)), the column i
+            holds the rolling maximum for the windows[i] window.
+    '''
+
+    values = np.asarray(values, dtype = np.float64)
+    columns = values[:, None] if values.ndim == 1 else values
+
+    # Observations are counted only when values are missing
+    missing = np.isnan(columns)
+    if missing.any():
+        filled = np.where(missing, -np.inf, columns)
+        counts = _observationCounts(columns, windows)
+    else:
+        filled, counts = columns, None
+
+    maxima = np.empty((len(windows),) + columns.shape, dtype = np.float64)
+    for i, window in enumerate(windows):
+        _rollingMaxima(filled, window, out = maxima[i])
+        minimum = _minimumObservations(min_periods, window)
+
+        # Without missing values, the first windows have one observation per
+        # period
+        if counts is not None:
+            np.copyto(maxima[i], np.nan, where = counts[i] < minimum)
+        elif minimum > window:
+            maxima[i] = np.nan
+        else:
+            maxima[i][:minimum-1] = np.nan
+
+    return _windowColumns(maxima, values.ndim)
+
+
+def rollingMin(values, windows, min_periods = 1):
+    '''
+    Calculates the rolling minimum of the values for several windows. See
+    rollingMax for details.
+
+    Args:
+        values (numpy array): The input values.
+
+        windows (list of integers): The rolling windows.
+
+        min_periods (int or None): Minimum number of observations in a window,
+            None means that the window should be full. Default value is 1.
+
+    Raises:
+        -
+
+    Returns:
+        numpy array: Array of shape (len(values), len(windows)), the column i
+            holds the rolling minimum for the windows[i] window.
+    '''
+
+    return -rollingMax(-np.asarray(values, dtype = np.float64), windows,
+        min_periods)
@@ -38,7 +38,7 @@ def showSystemInfo():
     print('- platform:', platform.platform())
     
     # Print Package Dependencies
-    dependenciess = ['pandas', 'matplotlib']
+    dependenciess = ['numpy', 'pandas', 'matplotlib']
     print('\nDependencies:')
     
     for d in dependenciess: